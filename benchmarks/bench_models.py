@@ -0,0 +1,77 @@
+"""
+큰 목록 응답을 dict(기본)와 typed 모델로 디코딩할 때의 메모리/CPU 사용량을 비교합니다.
+
+    python benchmarks/bench_models.py --items 50000
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+import bootstrap  # noqa: F401  (설치 없이 doorayapi를 불러옵니다)
+from doorayapi.models import json_loads, orjson, parse_response
+
+ENDPOINT = "/drive/v1/drives/drive-1/files"
+
+
+def make_listing(count: int) -> bytes:
+    items = [{
+        "id": f"{3000000000000000000 + i}",
+        "driveId": "drive-1",
+        "name": f"report-{i:06d}.pdf",
+        "type": "file",
+        "subType": "etc",
+        "mimeType": "application/pdf",
+        "size": 1024 * (i % 977),
+        "version": 1 + i % 5,
+        "createdAt": "2024-01-01T09:00:00+09:00",
+        "lastUpdatedAt": "2024-06-01T09:00:00+09:00",
+        "creator": {"type": "member", "member": {"organizationMemberId": f"{1000 + i % 50}"}},
+        "lastUpdater": {"type": "member", "member": {"organizationMemberId": f"{1000 + i % 50}"}},
+        "annotations": {"favorited": False},
+    } for i in range(count)]
+    body = {"header": {"isSuccessful": True, "resultCode": 0, "resultMessage": ""},
+            "result": items, "totalCount": count}
+    return json.dumps(body).encode("utf-8")
+
+
+def measure(name: str, decode, payload: bytes, repeat: int):
+    best = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(payload)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    gc.collect()
+    tracemalloc.start()
+    result = decode(payload)
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    print(f"{name:<28} {best * 1000:9.1f} ms {size / 1024 / 1024:9.1f} MiB")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    payload = make_listing(args.items)
+    print(f"{args.items} items, {len(payload) / 1024 / 1024:.1f} MiB JSON, orjson={'yes' if orjson else 'no'}")
+    print(f"{'':<28} {'time':>12} {'memory':>13}")
+    measure("json.loads (dict)", lambda data: json.loads(data), payload, args.repeat)
+    measure("json_loads (dict)", json_loads, payload, args.repeat)
+    measure("json_loads + typed", lambda data: parse_response(ENDPOINT, json_loads(data)), payload, args.repeat)
+
+    # 중첩 필드는 처음 접근할 때만 변환됩니다.
+    response = parse_response(ENDPOINT, json_loads(payload))
+    started = time.perf_counter()
+    for item in response:
+        item.creator.member
+    print(f"{'typed nested access':<28} {(time.perf_counter() - started) * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+"""
+설치하지 않은 체크아웃에서도 소스 디렉터리(dooray-api-client)를 doorayapi 패키지로 불러옵니다.
+
+    import bootstrap  # noqa: F401  (doorayapi를 불러오기 전에)
+
+pip install로 설치된 doorayapi가 있으면 그것을 사용합니다.
+"""
+import importlib.util
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE_DIR = os.path.join(ROOT, "dooray-api-client")
+
+
+def install_alias():
+    if "doorayapi" in sys.modules or importlib.util.find_spec("doorayapi") is not None:
+        return
+    spec = importlib.util.spec_from_file_location("doorayapi", os.path.join(PACKAGE_DIR, "__init__.py"),
+                                                  submodule_search_locations=[PACKAGE_DIR])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules["doorayapi"] = module
+    spec.loader.exec_module(module)
+
+
+install_alias()
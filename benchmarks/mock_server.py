@@ -0,0 +1,547 @@
+"""
+벤치마크용 로컬 Dooray! API 모의 서버.
+
+멤버, 드라이브, 위키, 프로젝트 API의 주요 엔드포인트를 메모리 상의 데이터로 흉내 냅니다.
+파일 업로드/다운로드는 실제 서비스처럼 API 서버가 307로 파일 서버(같은 경로, 다른 포트)로 보냅니다.
+
+    with MockDooray(latency=0.02, files=5000, error_rate=0.01) as server:
+        client = DoorayAPIClient("token")
+        client.base_url = server.base_url
+
+    python benchmarks/mock_server.py --port 8080 --latency 0.02
+"""
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+DRIVE_ID = "drive-1"
+ROOT_FOLDER_ID = "folder-root"
+WIKI_ID = "wiki-1"
+ROOT_PAGE_ID = "page-root"
+PROJECT_ID = "project-1"
+INITIAL_TIME = "2024-01-01T09:00:00+09:00"
+KST = timezone(timedelta(hours=9))
+
+
+def _now() -> str:
+    return datetime.now(KST).isoformat(timespec="milliseconds")
+
+
+class MockState:
+    """
+    모의 서버의 데이터. API 서버와 파일 서버가 함께 사용합니다.
+    """
+    def __init__(self, files: int = 1000, members: int = 500, tags: int = 200, milestones: int = 50,
+                 file_size: int = 64 * 1024, seed: int = 0):
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+        rng = random.Random(seed)
+        self.members = [{"id": f"member-{i}", "name": f"사용자{i}", "userCode": f"user{i}",
+                         "externalEmailAddress": f"user{i}@example.com", "idProviderUserId": f"idp-{i}"}
+                        for i in range(members)]
+        self.drives = [{"id": DRIVE_ID, "type": "private", "name": "drive"}]
+        self.files = {ROOT_FOLDER_ID: {"id": ROOT_FOLDER_ID, "driveId": DRIVE_ID, "name": "root", "type": "folder",
+                                       "parentId": None, "version": 1}}
+        self.contents = {}
+        # 초기 파일은 모두 같은 내용을 공유합니다.
+        content = bytes(rng.getrandbits(8) for _ in range(file_size))
+        for i in range(files):
+            self._add_file(f"file-{i:06d}.bin", ROOT_FOLDER_ID, content, INITIAL_TIME)
+        self.pages = {ROOT_PAGE_ID: {"id": ROOT_PAGE_ID, "wikiId": WIKI_ID, "parentPageId": None, "subject": "Home",
+                                     "version": 1, "body": {"mimeType": "text/x-markdown", "content": ""},
+                                     "createdAt": INITIAL_TIME, "updatedAt": INITIAL_TIME}}
+        self.comments = {}
+        self.tags = [{"id": f"tag-{i}", "name": f"tag{i}", "color": "ffffff"} for i in range(tags)]
+        self.milestones = [{"id": f"milestone-{i}", "name": f"m{i}", "status": "open"} for i in range(milestones)]
+        self.workflows = [{"id": f"workflow-{i}", "name": name, "order": i, "class": name}
+                          for i, name in enumerate(("registered", "working", "closed"))]
+
+    def new_id(self, prefix: str) -> str:
+        return f"{prefix}-{next(self.ids)}"
+
+    def _add_file(self, name: str, parent_id: str, content: bytes, timestamp: str = None) -> dict:
+        file_id = self.new_id("file")
+        timestamp = timestamp or _now()
+        item = {"id": file_id, "driveId": DRIVE_ID, "name": name, "type": "file", "subType": "etc",
+                "parentId": parent_id, "size": len(content), "version": 1,
+                "createdAt": timestamp, "lastUpdatedAt": timestamp}
+        self.files[file_id] = item
+        self.contents[file_id] = content
+        return item
+
+
+def _ok(result=None, total=None) -> dict:
+    body = {"header": {"isSuccessful": True, "resultCode": 0, "resultMessage": ""}, "result": result}
+    if total is not None:
+        body["totalCount"] = total
+    return body
+
+
+def _page(items: list, query: dict, max_page_size: int):
+    page = int(query.get("page", 0))
+    size = min(int(query.get("size", 20)), max_page_size)
+    return _ok(items[page * size:(page + 1) * size], len(items))
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockDooray/1.0"
+    # 헤더와 본문을 따로 쓰므로 Nagle 알고리즘을 끄지 않으면 응답마다 지연 ACK(약 40ms)를 기다립니다.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    @property
+    def mock(self) -> "MockDooray":
+        return self.server.mock
+
+    @property
+    def state(self) -> MockState:
+        return self.server.mock.state
+
+    def _read_body(self) -> bytes:
+        if self.headers.get("Transfer-Encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int(self.rfile.readline().split(b";")[0].strip() or b"0", 16)
+                if size == 0:
+                    while self.rfile.readline() not in (b"\r\n", b"\n", b""):
+                        pass
+                    return b"".join(chunks)
+                chunks.append(self.rfile.read(size))
+                self.rfile.readline()
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "application/json", headers: dict = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _json(self, obj, status: int = 200):
+        self._send(status, json.dumps(obj, ensure_ascii=False).encode("utf-8"))
+
+    def _handle(self):
+        split = urlsplit(self.path)
+        query = {key: values[-1] for key, values in parse_qs(split.query).items()}
+        body = self._body = self._read_body()
+        self.mock.count(requests=1)
+        if self.mock.latency:
+            time.sleep(self.mock.latency + random.random() * self.mock.jitter)
+        token = self.headers.get("Authorization", "").replace("dooray-api ", "", 1)
+        if token in self.mock.revoked_tokens:
+            self.mock.count(errors=1)
+            self._json({"header": {"isSuccessful": False, "resultCode": -401, "resultMessage": "unauthorized"}}, 401)
+            return
+        if not self.mock.admit(token):
+            self.mock.count(errors=1)
+            self._send(429, json.dumps({"header": {"isSuccessful": False, "resultCode": -429,
+                                                   "resultMessage": "too many requests"}}).encode("utf-8"),
+                       headers={"Retry-After": "1"})
+            return
+        if self.mock.inject_error():
+            self.mock.count(errors=1)
+            self._json({"header": {"isSuccessful": False, "resultCode": -1, "resultMessage": "injected"}},
+                       self.mock.error_status)
+            return
+        try:
+            result = self.route(self.command, split.path, query, body)
+        except KeyError:
+            self._json({"header": {"isSuccessful": False, "resultCode": -404, "resultMessage": "not found"}}, 404)
+            return
+        if result is not None:
+            self._json(result)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+
+class _ApiHandler(_Handler):
+    ROUTES = []
+
+    def route(self, method: str, path: str, query: dict, body: bytes):
+        for route_method, pattern, name in self.ROUTES:
+            if route_method == method:
+                match = pattern.match(path)
+                if match:
+                    data = json.loads(body) if body and self.headers.get("Content-Type", "").startswith(
+                        "application/json") else {}
+                    return getattr(self, name)(query, data, *match.groups())
+        raise KeyError(path)
+
+    def _redirect(self):
+        # 실제 서비스처럼 경로는 그대로 두고 파일 서버 호스트로 보냅니다.
+        self._send(307, headers={"Location": self.mock.file_url + self.path})
+
+    def members(self, query, data):
+        items = self.state.members
+        emails = query.get("externalEmailAddresses")
+        if emails:
+            wanted = set(emails.split(","))
+            items = [item for item in items if item["externalEmailAddress"] in wanted]
+        for param, key in (("userCode", "userCode"), ("userCodeExact", "userCode"),
+                           ("idProviderUserId", "idProviderUserId")):
+            if query.get(param):
+                items = [item for item in items if item[key] == query[param]]
+        return _page(items, query, self.mock.max_page_size)
+
+    def drives(self, query, data):
+        drive_type = query.get("type", "private")
+        return _ok([drive for drive in self.state.drives if drive["type"] == drive_type])
+
+    def drive(self, query, data, drive_id):
+        drive = next((drive for drive in self.state.drives if drive["id"] == drive_id),
+                     {"id": drive_id, "type": "private", "name": "drive"})
+        return _ok(dict(drive, root={"id": ROOT_FOLDER_ID}))
+
+    def list_files(self, query, data, drive_id):
+        parent_id = query.get("parentId", ROOT_FOLDER_ID)
+        with self.state.lock:
+            items = [item for item in self.state.files.values() if item["parentId"] == parent_id]
+        if query.get("type"):
+            items = [item for item in items if item["type"] == query["type"]]
+        return _page(items, query, self.mock.max_page_size)
+
+    def get_file(self, query, data, drive_id, file_id):
+        if query.get("media") == "raw":
+            return self._redirect()
+        return _ok(self.state.files[file_id])
+
+    def upload(self, query, data, drive_id, file_id=None):
+        if not self.mock.redirect_uploads:
+            return _store_upload(self, "drive", None, query, self._body)
+        return self._redirect()
+
+    def update_file(self, query, data, drive_id, file_id):
+        if query.get("media") == "raw":
+            return self._redirect()
+        with self.state.lock:
+            self.state.files[file_id].update(name=data["name"], lastUpdatedAt=_now())
+        return _ok()
+
+    def delete_file(self, query, data, drive_id, file_id):
+        with self.state.lock:
+            self.state.files.pop(file_id)
+            self.state.contents.pop(file_id, None)
+        return _ok()
+
+    def create_folder(self, query, data, drive_id, folder_id):
+        with self.state.lock:
+            file_id = self.state.new_id("folder")
+            self.state.files[file_id] = {"id": file_id, "driveId": drive_id, "name": data["name"], "type": "folder",
+                                         "parentId": folder_id, "version": 1}
+        return _ok({"id": file_id})
+
+    def copy_file(self, query, data, drive_id, file_id):
+        with self.state.lock:
+            source = self.state.files[file_id]
+            item = self.state._add_file(source["name"], data["destinationFileId"],
+                                        self.state.contents.get(file_id, b""))
+        return _ok({"id": item["id"]})
+
+    def move_file(self, query, data, drive_id, file_id):
+        with self.state.lock:
+            self.state.files[file_id].update(parentId=data["destinationFileId"], lastUpdatedAt=_now())
+        return _ok({"id": file_id})
+
+    def shared_links(self, query, data, drive_id, file_id):
+        if self.command == "POST":
+            return _ok({"id": self.state.new_id("link")})
+        return _ok([], 0)
+
+    def wikis(self, query, data):
+        return _page([{"id": WIKI_ID, "name": "wiki", "type": "project"}], query, self.mock.max_page_size)
+
+    def wiki_pages(self, query, data, wiki_id):
+        if self.command == "POST":
+            with self.state.lock:
+                page_id = self.state.new_id("page")
+                self.state.pages[page_id] = {"id": page_id, "wikiId": wiki_id, "parentPageId": data["parentPageId"],
+                                             "subject": data["subject"], "version": 1, "body": data["body"],
+                                             "createdAt": _now(), "updatedAt": _now()}
+            return _ok({"id": page_id, "wikiId": wiki_id, "parentPageId": data["parentPageId"], "version": 1})
+        parent_id = query.get("parentPageId")
+        with self.state.lock:
+            items = [{key: value for key, value in page.items() if key != "body"}
+                     for page in self.state.pages.values() if page["parentPageId"] == parent_id]
+        return _ok(items, len(items))
+
+    def wiki_page(self, query, data, wiki_id, page_id, field=None):
+        page = self.state.pages[page_id]
+        if self.command == "GET":
+            return _ok(page)
+        with self.state.lock:
+            if field in (None, "title"):
+                page["subject"] = data.get("subject", page["subject"])
+            if field in (None, "content"):
+                page["body"] = data.get("body", page["body"])
+            page["version"] += 1
+            page["updatedAt"] = _now()
+        return _ok()
+
+    def wiki_comments(self, query, data, wiki_id, page_id):
+        comments = self.state.comments.setdefault(page_id, [])
+        if self.command == "POST":
+            with self.state.lock:
+                comment = {"id": self.state.new_id("comment"), "pageId": page_id, "body": data["body"],
+                           "createdAt": _now()}
+                comments.append(comment)
+            return _ok({"id": comment["id"]})
+        return _page(comments, query, self.mock.max_page_size)
+
+    def wiki_upload(self, query, data, wiki_id, page_id=None):
+        return self._redirect()
+
+    def project(self, query, data, project_id):
+        return _ok({"id": project_id, "code": "bench", "state": "active"})
+
+    def workflows(self, query, data, project_id):
+        return _ok(self.state.workflows, len(self.state.workflows))
+
+    def tags(self, query, data, project_id):
+        return _page(self.state.tags, query, self.mock.max_page_size)
+
+    def milestones(self, query, data, project_id):
+        items = [item for item in self.state.milestones if item["status"] == query.get("status", "open")]
+        return _page(items, query, self.mock.max_page_size)
+
+
+_ApiHandler.ROUTES = [(method, re.compile(pattern + "$"), name) for method, pattern, name in (
+    ("GET", r"/common/v1/members", "members"),
+    ("GET", r"/drive/v1/drives", "drives"),
+    ("GET", r"/drive/v1/drives/([^/]+)", "drive"),
+    ("GET", r"/drive/v1/drives/([^/]+)/files", "list_files"),
+    ("POST", r"/drive/v1/drives/([^/]+)/files", "upload"),
+    ("GET", r"/drive/v1/drives/([^/]+)/files/([^/]+)", "get_file"),
+    ("PUT", r"/drive/v1/drives/([^/]+)/files/([^/]+)", "update_file"),
+    ("DELETE", r"/drive/v1/drives/([^/]+)/files/([^/]+)", "delete_file"),
+    ("POST", r"/drive/v1/drives/([^/]+)/files/([^/]+)/create-folder", "create_folder"),
+    ("POST", r"/drive/v1/drives/([^/]+)/files/([^/]+)/copy", "copy_file"),
+    ("POST", r"/drive/v1/drives/([^/]+)/files/([^/]+)/move", "move_file"),
+    ("GET", r"/drive/v1/drives/([^/]+)/files/([^/]+)/shared-links", "shared_links"),
+    ("POST", r"/drive/v1/drives/([^/]+)/files/([^/]+)/shared-links", "shared_links"),
+    ("GET", r"/wiki/v1/wikis", "wikis"),
+    ("GET", r"/wiki/v1/wikis/([^/]+)/pages", "wiki_pages"),
+    ("POST", r"/wiki/v1/wikis/([^/]+)/pages", "wiki_pages"),
+    ("GET", r"/wiki/v1/wikis/([^/]+)/pages/([^/]+)", "wiki_page"),
+    ("PUT", r"/wiki/v1/wikis/([^/]+)/pages/([^/]+)", "wiki_page"),
+    ("PUT", r"/wiki/v1/wikis/([^/]+)/pages/([^/]+)/(title|content)", "wiki_page"),
+    ("GET", r"/wiki/v1/wikis/([^/]+)/pages/([^/]+)/comments", "wiki_comments"),
+    ("POST", r"/wiki/v1/wikis/([^/]+)/pages/([^/]+)/comments", "wiki_comments"),
+    ("POST", r"/wiki/v1/wikis/([^/]+)/files", "wiki_upload"),
+    ("POST", r"/wiki/v1/wikis/([^/]+)/pages/([^/]+)/files", "wiki_upload"),
+    ("GET", r"/project/v1/projects/([^/]+)", "project"),
+    ("GET", r"/project/v1/projects/([^/]+)/workflows", "workflows"),
+    ("GET", r"/project/v1/projects/([^/]+)/tags", "tags"),
+    ("GET", r"/project/v1/projects/([^/]+)/milestones", "milestones"),
+)]
+
+
+def _parse_multipart(content_type: str, body: bytes):
+    """
+    multipart 본문에서 파일 이름과 내용을 꺼냅니다.
+    """
+    boundary = content_type.split("boundary=", 1)[1].strip('"').encode("ascii")
+    for part in body.split(b"--" + boundary):
+        head, _, content = part.partition(b"\r\n\r\n")
+        match = re.search(rb'filename="([^"]*)"', head)
+        if match:
+            return match.group(1).decode("utf-8"), content[:-2] if content.endswith(b"\r\n") else content
+    raise ValueError("multipart 본문에 파일이 없습니다.")
+
+
+def _store_upload(handler: _Handler, kind: str, file_id: str, query: dict, body: bytes) -> dict:
+    """
+    업로드 본문을 저장합니다. 본문이 없는 요청은 빈 파일을 만듭니다.
+    """
+    state = handler.state
+    if body:
+        name, content = _parse_multipart(handler.headers.get("Content-Type", ""), body)
+    else:
+        name, content = "untitled", b""
+    with state.lock:
+        if file_id is not None and handler.command == "PUT":
+            item = state.files[file_id]
+            item["version"] += 1
+            item["size"] = len(content)
+            state.contents[file_id] = content
+        else:
+            item = state._add_file(name, query.get("parentId", ROOT_FOLDER_ID), content)
+            if kind == "wiki":
+                item["type"] = "wiki"
+    return _ok({"id": item["id"], "version": item["version"]})
+
+
+class _FileHandler(_Handler):
+    """
+    307 리디렉션 대상 파일 서버. 업로드 본문을 받고 Range 다운로드를 지원합니다.
+    """
+    def route(self, method: str, path: str, query: dict, body: bytes):
+        state = self.state
+        self.mock.count(bytes_in=len(body))
+        match = re.match(r"/(drive|wiki)/v1/(?:drives|wikis)/([^/]+)(?:/pages/[^/]+)?/files(?:/([^/]+))?$", path)
+        if not match:
+            raise KeyError(path)
+        kind, _, file_id = match.groups()
+        if method == "GET":
+            return self._download(state.contents[file_id])
+        return _store_upload(self, kind, file_id, query, body)
+
+    def _download(self, content: bytes):
+        range_header = self.headers.get("Range")
+        if range_header:
+            start, _, end = range_header.partition("=")[2].partition("-")
+            start, end = int(start), min(int(end) if end else len(content) - 1, len(content) - 1)
+            part = content[start:end + 1]
+            if self.mock.truncate_ranges:
+                # 연결은 정상 종료하지만 요청한 범위보다 짧은 본문을 보냅니다.
+                part = part[:max(0, len(part) - self.mock.truncate_ranges)]
+            self.mock.count(bytes_out=len(part))
+            self._send(206, part, "application/octet-stream",
+                       {"Content-Range": f"bytes {start}-{end}/{len(content)}", "Accept-Ranges": "bytes"})
+        else:
+            self.mock.count(bytes_out=len(content))
+            self._send(200, content, "application/octet-stream", {"Accept-Ranges": "bytes"})
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+
+class MockDooray:
+    """
+    API 서버와 파일 서버를 백그라운드 스레드로 띄웁니다.
+
+    :param latency: 요청마다 추가할 지연 시간(초)
+    :param jitter: latency에 더할 0~jitter초의 무작위 지연
+    :param max_page_size: 목록 API가 한 번에 돌려줄 최대 항목 수 (size 파라미터 상한)
+    :param error_rate: 요청을 error_status로 실패시킬 확률 (0~1)
+        fail_requests 속성에 n을 넣으면 다음 n개 요청을 확률과 관계없이 error_status로 실패시킵니다.
+    :param token_rate: 토큰별 초당 요청 수 제한. 넘으면 429(Retry-After: 1)로 응답합니다.
+    :param revoked_tokens: 401로 응답할 토큰 목록
+    :param redirect_uploads: False이면 드라이브 업로드를 307 없이 API 서버가 바로 받습니다.
+    :param truncate_ranges: Range 응답 본문에서 끝의 몇 바이트를 잘라낼지 (구간 잘림 재현용)
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, latency: float = 0.0, jitter: float = 0.0,
+                 max_page_size: int = 100, error_rate: float = 0.0, error_status: int = 503,
+                 token_rate: float = None, revoked_tokens=(), redirect_uploads: bool = True, truncate_ranges: int = 0,
+                 state: MockState = None, **state_options):
+        self.latency = latency
+        self.jitter = jitter
+        self.max_page_size = max_page_size
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.token_rate = token_rate
+        self.revoked_tokens = set(revoked_tokens)
+        self.redirect_uploads = redirect_uploads
+        self.truncate_ranges = truncate_ranges
+        self.fail_requests = 0
+        self.token_requests = {}
+        self._windows = {}
+        self.state = state or MockState(**state_options)
+        self.requests = 0
+        self.errors = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._api = _Server((host, port), _ApiHandler)
+        self._files = _Server((host, 0), _FileHandler)
+        for server in (self._api, self._files):
+            server.mock = self
+        self._threads = []
+        self._lock = threading.Lock()
+
+    def count(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def inject_error(self) -> bool:
+        """
+        남은 fail_requests가 있거나 error_rate 확률에 걸리면 True를 반환합니다.
+        """
+        with self._lock:
+            if self.fail_requests:
+                self.fail_requests -= 1
+                return True
+        return bool(self.error_rate) and random.random() < self.error_rate
+
+    def admit(self, token: str) -> bool:
+        """
+        토큰별 최근 1초 동안의 요청 수가 token_rate 이하이면 True를 반환합니다.
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.token_requests[token] = self.token_requests.get(token, 0) + 1
+            if not self.token_rate:
+                return True
+            window = self._windows.setdefault(token, [])
+            while window and window[0] <= now - 1:
+                window.pop(0)
+            if len(window) >= self.token_rate:
+                return False
+            window.append(now)
+            return True
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._api.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def file_url(self) -> str:
+        host, port = self._files.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        for server in (self._api, self._files):
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def stop(self):
+        for server in (self._api, self._files):
+            server.shutdown()
+            server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 Dooray! API 모의 서버")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--max-page-size", type=int, default=100)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--files", type=int, default=1000)
+    args = parser.parse_args()
+    server = MockDooray(port=args.port, latency=args.latency, jitter=args.jitter,
+                        max_page_size=args.max_page_size, error_rate=args.error_rate, files=args.files).start()
+    print(f"API: {server.base_url}  files: {server.file_url}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+모의 서버(mock_server.MockDooray)를 상대로 DoorayAPIClient의 처리량과 지연 시간을 측정합니다.
+
+    python benchmarks/run.py --save baseline.json
+    python benchmarks/run.py --compare baseline.json --threshold 0.15
+    python benchmarks/run.py --scenario listing --latency 0.02
+
+결과는 시나리오별 처리량(높을수록 좋음)과 요청 지연 시간 p50/p95/p99(낮을수록 좋음)입니다.
+--compare를 지정하면 기준 결과보다 threshold 이상 나빠진 항목을 표시하고 종료 코드 1을 반환합니다.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import bootstrap  # noqa: F401  (설치 없이 doorayapi를 불러옵니다)
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID, ROOT_PAGE_ID, WIKI_ID, MockDooray
+
+from doorayapi.client import DoorayAPIClient
+from doorayapi.instrumentation import Instrumentation
+from doorayapi.publish import WikiPublisher
+from doorayapi.retry import RetryPolicy
+
+
+class LatencyRecorder:
+    """
+    응답 훅으로 요청 시도별 지연 시간을 모읍니다.
+    """
+    def __init__(self):
+        self.samples = []
+        self._lock = threading.Lock()
+
+    def __call__(self, event):
+        with self._lock:
+            self.samples.append(event.elapsed)
+
+    def percentiles(self) -> dict:
+        samples = sorted(self.samples)
+        if not samples:
+            return {}
+
+        def at(q):
+            return samples[min(len(samples) - 1, int(q * len(samples)))]
+
+        return {"p50": round(at(0.50) * 1000, 3), "p95": round(at(0.95) * 1000, 3),
+                "p99": round(at(0.99) * 1000, 3)}
+
+
+def _client(server: MockDooray, recorder: LatencyRecorder, workers: int) -> DoorayAPIClient:
+    instrumentation = Instrumentation(metrics=False)
+    instrumentation.on_response(recorder)
+    client = DoorayAPIClient("benchmark-token", pool_maxsize=max(10, workers), instrumentation=instrumentation,
+                             retry=RetryPolicy(backoff_factor=0.01, jitter=False))
+    client.base_url = server.base_url
+    return client
+
+
+def bench_listing(server: MockDooray, args, workdir: str) -> dict:
+    recorder = LatencyRecorder()
+    with _client(server, recorder, args.workers) as client:
+        started = time.monotonic()
+        count = sum(1 for _ in client.iter_files(DRIVE_ID, parentId=ROOT_FOLDER_ID, size=args.page_size,
+                                                 max_workers=args.workers))
+        elapsed = time.monotonic() - started
+    if count != args.files:
+        raise AssertionError(f"목록 항목 수가 다릅니다: {count} != {args.files}")
+    return dict(throughput=count / elapsed, unit="items/s", items=count, elapsed=elapsed,
+                requests=len(recorder.samples), **recorder.percentiles())
+
+
+def _make_files(workdir: str, count: int, size: int) -> list:
+    paths = []
+    block = os.urandom(min(size, 1024 * 1024))
+    for i in range(count):
+        path = os.path.join(workdir, f"upload-{i:04d}.bin")
+        with open(path, "wb") as f:
+            remaining = size
+            while remaining > 0:
+                f.write(block[:remaining])
+                remaining -= len(block)
+        paths.append(path)
+    return paths
+
+
+def bench_upload(server: MockDooray, args, workdir: str) -> dict:
+    paths = _make_files(workdir, args.uploads, args.file_size)
+    recorder = LatencyRecorder()
+    with _client(server, recorder, args.workers) as client:
+        started = time.monotonic()
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            results = list(executor.map(lambda path: client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, path), paths))
+        elapsed = time.monotonic() - started
+    sent = sum(result.bytes_transferred for result in results)
+    return dict(throughput=sent / elapsed / 1024 / 1024, unit="MiB/s", items=len(results), elapsed=elapsed,
+                requests=len(recorder.samples), **recorder.percentiles())
+
+
+def bench_download(server: MockDooray, args, workdir: str) -> dict:
+    source = _make_files(workdir, 1, args.download_size)[0]
+    recorder = LatencyRecorder()
+    with _client(server, recorder, args.workers) as client:
+        file_id = client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, source)["result"]["id"]
+        recorder.samples.clear()
+        target = os.path.join(workdir, "download.bin")
+        started = time.monotonic()
+        for _ in range(args.downloads):
+            client.download_file(DRIVE_ID, file_id, target, segments=args.segments, chunk_size=256 * 1024)
+        elapsed = time.monotonic() - started
+    if os.path.getsize(target) != args.download_size:
+        raise AssertionError("다운로드한 파일 크기가 다릅니다.")
+    received = args.download_size * args.downloads
+    return dict(throughput=received / elapsed / 1024 / 1024, unit="MiB/s", items=args.downloads, elapsed=elapsed,
+                requests=len(recorder.samples), **recorder.percentiles())
+
+
+def bench_publish(server: MockDooray, args, workdir: str) -> dict:
+    docs = os.path.join(workdir, "docs")
+    for section in range(args.sections):
+        section_dir = os.path.join(docs, f"section-{section:02d}")
+        os.makedirs(section_dir)
+        with open(os.path.join(section_dir, "index.md"), "w", encoding="utf-8") as f:
+            f.write(f"# 섹션 {section}\n\n개요\n")
+        for page in range(args.pages_per_section):
+            with open(os.path.join(section_dir, f"page-{page:03d}.md"), "w", encoding="utf-8") as f:
+                f.write(f"# 페이지 {section}-{page}\n\n" + "본문 내용입니다.\n" * 50)
+    recorder = LatencyRecorder()
+    with _client(server, recorder, args.workers) as client:
+        publisher = WikiPublisher(client, WIKI_ID, ROOT_PAGE_ID, docs, max_workers=args.workers)
+        started = time.monotonic()
+        summary = publisher.run()
+        elapsed = time.monotonic() - started
+    # POST는 재시도하지 않으므로 오류를 주입하면 일부 페이지가 실패할 수 있습니다.
+    return dict(throughput=summary.created / elapsed, unit="pages/s", items=summary.created,
+                failed=len(summary.errors), elapsed=elapsed, requests=len(recorder.samples),
+                **recorder.percentiles())
+
+
+SCENARIOS = {
+    "listing": bench_listing,
+    "upload": bench_upload,
+    "download": bench_download,
+    "publish": bench_publish,
+}
+# 나빠졌는지 판단할 지표와 방향 (1: 클수록 좋음, -1: 작을수록 좋음)
+COMPARED_METRICS = (("throughput", 1), ("p95", -1), ("p99", -1))
+
+
+def run(args) -> dict:
+    results = {}
+    for name in args.scenario or list(SCENARIOS):
+        workdir = tempfile.mkdtemp(prefix=f"dooray-bench-{name}-")
+        try:
+            with MockDooray(latency=args.latency, jitter=args.jitter, max_page_size=args.max_page_size,
+                            error_rate=args.error_rate, files=args.files) as server:
+                result = SCENARIOS[name](server, args, workdir)
+                result["serverRequests"] = server.requests
+                result["injectedErrors"] = server.errors
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+        results[name] = {key: round(value, 3) if isinstance(value, float) else value
+                         for key, value in result.items()}
+        print(_format(name, results[name]))
+    return results
+
+
+def _format(name: str, result: dict) -> str:
+    return (f"{name:<10} {result['throughput']:>10.1f} {result['unit']:<8} "
+            f"p50 {result.get('p50', 0):>8.2f}ms  p95 {result.get('p95', 0):>8.2f}ms  "
+            f"p99 {result.get('p99', 0):>8.2f}ms  ({result['requests']} requests, {result['elapsed']:.2f}s)")
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    기준 결과보다 threshold 비율 이상 나빠진 (시나리오, 지표, 기준값, 현재값) 목록을 반환합니다.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        for metric, direction in COMPARED_METRICS:
+            old, new = base.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            change = (new - old) / old * direction
+            marker = "REGRESSION" if change < -threshold else ""
+            print(f"{name:<10} {metric:<10} {old:>10.2f} -> {new:>10.2f} ({change * 100:+6.1f}%) {marker}")
+            if marker:
+                regressions.append((name, metric, old, new))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DoorayAPIClient 벤치마크")
+    parser.add_argument("--scenario", action="append", choices=sorted(SCENARIOS))
+    parser.add_argument("--save", help="결과를 기준(baseline) JSON 파일로 저장")
+    parser.add_argument("--compare", help="기준 JSON 파일과 비교")
+    parser.add_argument("--threshold", type=float, default=0.10, help="회귀로 판단할 변화율 (기본 10%%)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=0.005, help="모의 서버의 요청당 지연 시간(초)")
+    parser.add_argument("--jitter", type=float, default=0.005)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--max-page-size", type=int, default=100)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--uploads", type=int, default=32)
+    parser.add_argument("--file-size", type=int, default=1024 * 1024)
+    parser.add_argument("--downloads", type=int, default=4)
+    parser.add_argument("--download-size", type=int, default=32 * 1024 * 1024)
+    parser.add_argument("--segments", type=int, default=4)
+    parser.add_argument("--sections", type=int, default=5)
+    parser.add_argument("--pages-per-section", type=int, default=20)
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.save:
+        with open(args.save, "w", encoding="utf-8") as f:
+            json.dump({"python": platform.python_version(), "options": vars(args), "results": results}, f,
+                      ensure_ascii=False, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        if compare(results, baseline, args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1 +1,7 @@
-from .client import DoorayAPIClient
+from .client import DoorayAPIClient, RedirectError
+from .aio import AsyncDoorayAPIClient
+from .cache import ResponseCache
+from .instrumentation import Instrumentation, LogExporter, MetricsCollector
+from .ratelimit import RateLimiter, TokenBucket
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
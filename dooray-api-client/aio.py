@@ -0,0 +1,426 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - aiohttp는 선택 의존성
+    aiohttp = None
+
+from .cache import ResponseCache
+from .client import DEFAULT_TIMEOUT, MIN_SEGMENT_SIZE, DoorayAPIClient, RedirectError
+from .instrumentation import Instrumentation
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .transfer import DownloadState, MultipartEncoder, SegmentedFile, TransferResult
+
+
+def _client_timeout(timeout):
+    """
+    requests 형식의 타임아웃(초 또는 (connect, read) 튜플)을 aiohttp.ClientTimeout으로 변환합니다.
+    """
+    if timeout is None:
+        return aiohttp.ClientTimeout(total=None)
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+    else:
+        connect = read = timeout
+    return aiohttp.ClientTimeout(total=None, sock_connect=connect, sock_read=read)
+
+
+def _clean_params(params):
+    # aiohttp는 None 값을 허용하지 않으므로 requests와 동일하게 제외합니다.
+    if not params:
+        return None
+    return {key: value for key, value in params.items() if value is not None}
+
+
+class AsyncDoorayAPIClient(DoorayAPIClient):
+    """
+    DoorayAPIClient의 asyncio 버전입니다.
+
+    API 메서드(엔드포인트/파라미터 구성)는 DoorayAPIClient의 것을 그대로 사용하고,
+    전송 계층(_request, 307 파일 헬퍼)만 aiohttp로 교체합니다. 따라서 모든 API
+    메서드는 코루틴을 반환하며 await 해서 사용합니다.
+
+        async with AsyncDoorayAPIClient(token, max_concurrency=50) as client:
+            drive = await client.get_drive(drive_id)
+
+    나머지 인자(cache, rate_limiter, retry, coalesce, upload_redirect 등)는 DoorayAPIClient와 같습니다.
+
+    :param max_concurrency: 동시에 진행할 수 있는 최대 요청 수
+    """
+    def __init__(self, token: str, max_concurrency: int = 20, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, timeout=DEFAULT_TIMEOUT, upload_redirect: str = "probe",
+                 cache: ResponseCache = None, rate_limiter: RateLimiter = None, retry: RetryPolicy = None,
+                 coalesce: bool = False, typed: bool = False, instrumentation: Instrumentation = None):
+        if aiohttp is None:
+            raise ImportError("AsyncDoorayAPIClient를 사용하려면 aiohttp가 필요합니다. "
+                              "(pip install dooray-api-client[async])")
+        super().__init__(token, pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block,
+                         timeout=timeout, upload_redirect=upload_redirect, cache=cache, rate_limiter=rate_limiter,
+                         retry=retry, coalesce=coalesce, typed=typed, instrumentation=instrumentation)
+        self.max_concurrency = max_concurrency
+        self._semaphore = None
+
+    def _create_session(self):
+        connector = aiohttp.TCPConnector(limit=max(self.max_concurrency, self.pool_maxsize),
+                                         limit_per_host=self.pool_maxsize)
+        return aiohttp.ClientSession(connector=connector, timeout=_client_timeout(self.timeout))
+
+    @property
+    def session(self):
+        """
+        요청에 사용하는 aiohttp 세션. 이벤트 루프 안에서 처음 접근할 때 생성됩니다.
+        """
+        if self._session is None or self._session.closed:
+            self._session = self._create_session()
+        return self._session
+
+    def _limiter(self):
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+
+    async def close(self):
+        """
+        커넥션 풀을 닫습니다.
+        """
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+    def __enter__(self):
+        raise TypeError("AsyncDoorayAPIClient는 'async with'로 사용해야 합니다.")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _send(self, method: str, url: str, body: MultipartEncoder = None, **kwargs):
+        """
+        요청 하나를 전송하고 응답을 반환합니다. 반환된 응답은 async with로 해제해야 합니다.
+        속도 제한(rate_limiter)과 재시도(retry), 계측(instrumentation)이 여기서 적용됩니다.
+        """
+        path = urlsplit(url).path
+        instrumentation = self.instrumentation
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(path)
+            if body is not None:
+                kwargs["data"] = body.aiter_chunks()
+            if instrumentation is not None:
+                event = instrumentation.start(method, url, attempt, body.len if body is not None else 0)
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            except Exception as error:
+                if instrumentation is not None:
+                    instrumentation.finish(event, error=error)
+                if not isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)) \
+                        or self.retry is None or not self.retry.should_retry(method, attempt):
+                    raise
+                delay = self.retry.delay(attempt)
+            else:
+                if instrumentation is not None:
+                    # 응답 본문 크기는 본문을 읽는 쪽에서 add_bytes로 기록합니다.
+                    instrumentation.finish(event, response.status)
+                if self.retry is None or not self.retry.should_retry(method, attempt, response.status):
+                    return response
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+                response.release()
+            await asyncio.sleep(delay)
+            attempt += 1
+            if body is not None:
+                body.rewind()
+
+    async def _request(self, method: str, endpoint: str, params=None, data=None, json_data=None, files=None, extra_headers=None):
+        if method == "GET" and self.singleflight is not None:
+            key = ResponseCache.make_key(method, endpoint, params)
+            content = await self.singleflight.do_async(key, lambda: self._request_content(
+                method, endpoint, params, data, json_data, files, extra_headers))
+        else:
+            content = await self._request_content(method, endpoint, params, data, json_data, files, extra_headers)
+        return self._decode(endpoint, content)
+
+    async def _request_content(self, method: str, endpoint: str, params=None, data=None, json_data=None, files=None,
+                               extra_headers=None) -> bytes:
+        url = self.base_url + endpoint
+        headers = self.headers.copy()
+        if extra_headers:
+            headers.update(extra_headers)
+
+        cache = self.cache if method == "GET" else None
+        if cache is not None:
+            cache_key, entry, fresh = cache.lookup(endpoint, params, method)
+            if fresh:
+                return entry.value
+            if entry is not None:
+                headers.update(entry.validators())
+            generation = cache.generation
+
+        async with self._limiter():
+            async with await self._send(method, url, params=_clean_params(params), data=data, json=json_data,
+                                        headers=headers) as response:
+                if cache is not None and entry is not None and response.status == 304:
+                    cache.revalidated(cache_key, entry)
+                    return entry.value
+                response.raise_for_status()
+                if cache is None and self.cache is not None:
+                    self.cache.invalidate(endpoint)
+                content = await response.read()
+                if self.instrumentation is not None:
+                    self.instrumentation.add_bytes(method, url, received=len(content))
+                if cache is not None:
+                    cache.store(cache_key, content, response.headers, generation)
+                return content
+
+    async def _iter_pages(self, fetch, size: int, max_workers: int, **kwargs):
+        """
+        page/size 기반 목록 API를 순회하는 비동기 제너레이터. (async for로 사용)
+
+        DoorayAPIClient._iter_pages와 동일하게 첫 페이지 이후의 페이지를 최대
+        max_workers개까지 동시에 가져오면서 순서대로 항목을 반환합니다.
+        """
+        first = await fetch(page=0, size=size, **kwargs)
+        items = first.get("result") or []
+        for item in items:
+            yield item
+        if not items:
+            return
+        # 서버가 size를 줄였을 수 있으므로 이후 페이지는 첫 페이지의 실제 항목 수로 요청합니다.
+        size = min(size, len(items))
+        total = first.get("totalCount")
+        if total is None:
+            page = 1
+            while len(items) >= size:
+                items = (await fetch(page=page, size=size, **kwargs)).get("result") or []
+                for item in items:
+                    yield item
+                page += 1
+            return
+
+        pages = math.ceil(total / size)
+        pending = deque()
+        next_page = 1
+        try:
+            while next_page < pages and len(pending) < max_workers:
+                pending.append(asyncio.ensure_future(fetch(page=next_page, size=size, **kwargs)))
+                next_page += 1
+            while pending:
+                result = await pending.popleft()
+                if next_page < pages:
+                    pending.append(asyncio.ensure_future(fetch(page=next_page, size=size, **kwargs)))
+                    next_page += 1
+                for item in result.get("result") or []:
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _resolve_upload_target(self, method: str, url: str, params: dict, headers: dict) -> str:
+        """
+        본문 없이 요청을 보내 307 리디렉션 대상을 확인합니다. (DoorayAPIClient._resolve_upload_target 참고)
+        """
+        async with await self._send(method, url, params=params, headers=headers,
+                                    allow_redirects=False) as response:
+            response.raise_for_status()
+            if response.status != 307:
+                raise RedirectError(f"리디렉션 확인 요청이 {response.status}로 처리되어 빈 파일이 만들어졌을 수 "
+                                    "있습니다. 이 서버는 업로드를 리디렉션하지 않습니다.")
+            location = response.headers.get("location")
+        if not location:
+            raise RedirectError("307 응답이지만 location 헤더가 없습니다.")
+        self._remember_redirect(method, url, location)
+        return location
+
+    async def _send_file_with_redirect(self, method: str, url: str, params: dict, file_field: str, file_path: str,
+                                       data: dict = None, extra_headers: dict = None, progress=None):
+        """
+        multipart 본문을 스트리밍으로 업로드하고 307 응답을 처리합니다.
+        """
+        headers = self.headers.copy()
+        if extra_headers:
+            headers.update(extra_headers)
+        params = _clean_params(params)
+
+        original_url = url
+        async with self._limiter():
+            known = self._known_upload_target(method, url)
+            if known is not None:
+                url = known
+            elif self.upload_redirect == "probe":
+                url = await self._resolve_upload_target(method, url, params, headers)
+
+            started = time.monotonic()
+            with MultipartEncoder(file_field, file_path, fields=data, progress=progress) as body:
+                headers["Content-Type"] = body.content_type
+                headers["Content-Length"] = str(body.len)
+                response = None
+                if known is not None:
+                    # 기억한 대상이 더 이상 유효하지 않으면 원래 URL의 307 처리로 돌아갑니다.
+                    try:
+                        response = await self._send(method, known, body=body,
+                                                    params=self._redirect_params(known, params), headers=headers,
+                                                    allow_redirects=False)
+                    except aiohttp.ClientConnectionError:
+                        response = None
+                    if response is None or response.status >= 300:
+                        if response is not None:
+                            response.release()
+                        response = None
+                        self._forget_redirect(method, original_url)
+                        body.rewind()
+                        url = original_url
+                if response is None:
+                    response = await self._send(method, url, body=body,
+                                                params=params if url == original_url else
+                                                self._redirect_params(url, params),
+                                                headers=headers, allow_redirects=False)
+                async with response:
+                    if response.status != 307:
+                        response.raise_for_status()
+                        self._invalidate_url(original_url)
+                        result = await response.json(content_type=None)
+                        return TransferResult(result, body.len, time.monotonic() - started)
+                    location = response.headers.get("location")
+                if not location:
+                    raise RedirectError("307 응답이지만 location 헤더가 없습니다.")
+                self._remember_redirect(method, original_url, location)
+                body.rewind()
+                async with await self._send(method, location, body=body,
+                                            params=self._redirect_params(location, params),
+                                            headers=headers) as response:
+                    response.raise_for_status()
+                    self._invalidate_url(original_url)
+                    result = await response.json(content_type=None)
+                    return TransferResult(result, body.len, time.monotonic() - started)
+
+    async def _post_file_with_redirect(self, url: str, params: dict, file_field: str, file_path: str, data: dict = None, extra_headers: dict = None,
+                                       progress=None):
+        """
+        POST 방식 파일 업로드 시 307 응답을 처리하는 헬퍼 메서드.
+        """
+        return await self._send_file_with_redirect("POST", url, params, file_field, file_path, data, extra_headers,
+                                                   progress)
+
+    async def _put_file_with_redirect(self, url: str, params: dict, file_field: str, file_path: str, data: dict = None, extra_headers: dict = None,
+                                      progress=None):
+        """
+        PUT 방식 파일 업로드(업데이트) 시 307 응답을 처리하는 헬퍼 메서드.
+        """
+        return await self._send_file_with_redirect("PUT", url, params, file_field, file_path, data, extra_headers,
+                                                   progress)
+
+    async def _get_file_with_redirect(self, url: str, params: dict, save_path: str, extra_headers: dict = None,
+                                      chunk_size: int = 8192):
+        """
+        GET 방식 파일 다운로드 시 307 응답을 처리하는 헬퍼 메서드.
+        """
+        headers = self.headers.copy()
+        if extra_headers:
+            headers.update(extra_headers)
+        params = _clean_params(params)
+
+        async with self._limiter():
+            async with await self._send("GET", url, params=params, headers=headers,
+                                        allow_redirects=False) as response:
+                if response.status == 307:
+                    location = response.headers.get("location")
+                    if not location:
+                        raise RedirectError("307 응답이지만 location 헤더가 없습니다.")
+                else:
+                    location = None
+                    await self._save_response(response, save_path, chunk_size)
+            if location:
+                async with await self._send("GET", location, params=params, headers=headers) as response:
+                    await self._save_response(response, save_path, chunk_size)
+        return f"파일이 {save_path}에 저장되었습니다."
+
+    async def _save_response(self, response, save_path: str, chunk_size: int):
+        response.raise_for_status()
+        received = 0
+        with open(save_path, "wb") as f:
+            async for chunk in response.content.iter_chunked(chunk_size):
+                f.write(chunk)
+                received += len(chunk)
+        if self.instrumentation is not None:
+            self.instrumentation.add_bytes("GET", str(response.url), received=received)
+
+    async def _resolve_download_target(self, url: str, params: dict, headers: dict) -> str:
+        """
+        다운로드 URL의 307 리디렉션 대상을 한 번만 확인합니다.
+        """
+        async with self._limiter():
+            async with await self._send("GET", url, params=params, headers=headers,
+                                        allow_redirects=False) as response:
+                if response.status != 307:
+                    response.raise_for_status()
+                    return url
+                location = response.headers.get("location")
+        if not location:
+            raise RedirectError("307 응답이지만 location 헤더가 없습니다.")
+        return location
+
+    async def _fetch_segment(self, url: str, params: dict, headers: dict, state: DownloadState, index: int,
+                             output: SegmentedFile, chunk_size: int):
+        start, end, done = state.segments[index]
+        offset = start + done
+        if offset > end:
+            return
+        range_headers = dict(headers, Range=f"bytes={offset}-{end}")
+        async with self._limiter():
+            async with await self._send("GET", url, params=params, headers=range_headers) as response:
+                response.raise_for_status()
+                if response.status != 206 and (offset != 0 or end != state.size - 1):
+                    raise Exception("서버가 Range 요청을 지원하지 않습니다. segments=1, resume=False로 다운로드하세요.")
+                try:
+                    async for chunk in response.content.iter_chunked(chunk_size):
+                        if offset + len(chunk) > end + 1:
+                            raise IOError(f"구간 {index}의 응답이 요청한 범위({start}-{end})보다 깁니다.")
+                        output.write_at(offset, chunk)
+                        offset += len(chunk)
+                        state.advance(index, len(chunk))
+                    if offset != end + 1:
+                        raise IOError(f"구간 {index}({start}-{end})를 {offset - start}바이트만 받았습니다.")
+                finally:
+                    if self.instrumentation is not None:
+                        self.instrumentation.add_bytes("GET", url, received=offset - start - done)
+
+    async def _get_file_ranged(self, url: str, params: dict, save_path: str, drive_id: str, file_id: str,
+                               segments: int, chunk_size: int, resume: bool, extra_headers: dict = None):
+        """
+        Range 요청으로 파일을 여러 구간으로 나눠 동시에 받습니다. (DoorayAPIClient._get_file_ranged 참고)
+        """
+        size = int((await self.get_file_meta(drive_id, file_id))["result"]["size"])
+        headers = self.headers.copy()
+        if extra_headers:
+            headers.update(extra_headers)
+        params = _clean_params(params)
+        location = await self._resolve_download_target(url, params, headers)
+
+        part_path = save_path + ".part"
+        state_path = part_path + ".json"
+        state = DownloadState.load(state_path, size) if resume and os.path.exists(part_path) else None
+        if state is None:
+            state = DownloadState.create(state_path, size, segments, MIN_SEGMENT_SIZE)
+
+        with SegmentedFile(part_path, size) as output:
+            try:
+                await asyncio.gather(*(self._fetch_segment(location, params, headers, state, index, output, chunk_size)
+                                       for index in state.pending()))
+            finally:
+                state.save()
+
+        # .part 파일은 미리 size만큼 할당되므로 파일 크기가 아니라 구간별로 받은 바이트 수를 비교합니다.
+        received = state.received()
+        if received != size:
+            raise IOError(f"다운로드한 파일 크기({received})가 메타 정보의 크기({size})와 다릅니다.")
+        os.replace(part_path, save_path)
+        state.remove()
+        return f"파일이 {save_path}에 저장되었습니다."
@@ -0,0 +1,342 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+# 작업 이름 → 클라이언트 메서드. 작업의 나머지 필드는 메서드의 키워드 인자로 그대로 전달됩니다.
+OPERATIONS = {
+    "create_folder": "create_folder",        # drive_id, folder_id, folder_name
+    "copy": "copy_file",                     # drive_id, file_id, destination_drive_id, destination_file_id
+    "move": "move_file",                     # drive_id, file_id, destination_file_id
+    "rename": "update_file_name",            # drive_id, file_id, new_name
+    "delete": "delete_file",                 # drive_id, file_id
+    "create_shared_link": "create_shared_link",  # drive_id, file_id, scope, expiredAt
+    "delete_shared_link": "delete_shared_link",  # drive_id, file_id, link_id
+}
+# 재실행했을 때 404이면 이미 처리된 것으로 보는 작업
+DELETE_OPERATIONS = ("delete", "delete_shared_link")
+# 다시 실행하면 서버에 같은 리소스가 하나 더 생기는 작업. 완료되는 즉시 체크포인트 로그에 기록합니다.
+NON_IDEMPOTENT_OPERATIONS = ("create_folder", "copy", "create_shared_link")
+RESERVED = ("id", "op", "after")
+
+
+def _refs(value):
+    """
+    인자 값에 포함된 {"$ref": 작업 id} 참조를 찾습니다.
+    """
+    if isinstance(value, dict):
+        if set(value) == {"$ref"}:
+            yield value["$ref"]
+        else:
+            for item in value.values():
+                yield from _refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _refs(item)
+
+
+def _payload(response):
+    result = response.get("result") if response is not None else None
+    return result.to_dict() if hasattr(result, "to_dict") else result
+
+
+class BatchItem:
+    """
+    작업 하나의 실행 결과. status는 "pending", "done", "failed", "skipped" 중 하나입니다.
+    """
+    __slots__ = ("id", "op", "params", "after", "status", "result", "error", "resumed")
+
+    def __init__(self, id: str, op: str, params: dict, after: list):
+        self.id = id
+        self.op = op
+        self.params = params
+        self.after = after
+        self.status = "pending"
+        self.result = None
+        self.error = None
+        self.resumed = False
+
+    def as_dict(self) -> dict:
+        data = {"id": self.id, "op": self.op, "status": self.status}
+        if self.result is not None:
+            data["result"] = self.result
+        if self.error is not None:
+            data["error"] = str(self.error)
+        if self.resumed:
+            data["resumed"] = True
+        return data
+
+    def __repr__(self):
+        return f"BatchItem({self.id!r}, {self.op!r}, {self.status!r})"
+
+
+class BatchResult:
+    def __init__(self, items: list, elapsed: float):
+        self.items = items
+        self.elapsed = elapsed
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def _with(self, status: str) -> list:
+        return [item for item in self.items if item.status == status]
+
+    @property
+    def succeeded(self) -> list:
+        return self._with("done")
+
+    @property
+    def failed(self) -> list:
+        return self._with("failed")
+
+    @property
+    def skipped(self) -> list:
+        return self._with("skipped")
+
+    @property
+    def ok(self) -> bool:
+        return all(item.status == "done" for item in self.items)
+
+    def as_dict(self) -> dict:
+        return {
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "skipped": len(self.skipped),
+            "resumed": sum(1 for item in self.items if item.resumed),
+            "elapsed": round(self.elapsed, 3),
+            "items": [item.as_dict() for item in self.items],
+        }
+
+
+class BatchExecutor:
+    """
+    드라이브/공유 링크 변경 작업 목록을 동시에 실행합니다.
+
+        executor = BatchExecutor(client, max_workers=8, checkpoint_path="reorg.checkpoint.json")
+        result = executor.run([
+            {"id": "archive", "op": "create_folder", "drive_id": d, "folder_id": root, "folder_name": "archive"},
+            {"id": "mv-1", "op": "move", "drive_id": d, "file_id": f1, "destination_file_id": {"$ref": "archive"}},
+            {"id": "rm-1", "op": "delete", "drive_id": d, "file_id": f2, "after": ["mv-1"]},
+        ])
+        print(result.as_dict())
+
+    작업은 {"id", "op", "after", 메서드 인자...} 형태의 dict입니다. (op는 OPERATIONS 참고)
+    인자 값에 {"$ref": 작업 id}를 쓰면 그 작업 결과의 id로 바뀌고, 그 작업이 끝난 뒤에 실행됩니다.
+    after에 지정한 작업도 먼저 실행됩니다. 선행 작업이 실패하면 후행 작업은 skipped가 됩니다.
+
+    checkpoint_path를 지정하면 완료된 작업과 결과를 기록해 두고, 중단된 배치를 같은 작업 목록으로
+    다시 실행하면 완료된 작업은 건너뜁니다. (재개하려면 작업마다 고정된 id를 지정해야 합니다.)
+    다시 실행하면 리소스가 중복되는 작업(NON_IDEMPOTENT_OPERATIONS)은 완료되는 즉시
+    {checkpoint_path}.log에 한 줄씩 덧붙이고, 전체 체크포인트는 checkpoint_every개마다 다시 씁니다.
+
+    :param stop_on_error: True이면 작업 하나가 실패했을 때 새 작업을 시작하지 않습니다.
+    :param ignore_missing: True이면 삭제 작업의 404 응답을 이미 삭제된 것으로 보고 성공 처리합니다.
+    :param checkpoint_every: 완료된 작업 몇 개마다 전체 체크포인트를 다시 쓰고 로그를 비울지
+    """
+    def __init__(self, client, max_workers: int = 8, checkpoint_path: str = None, stop_on_error: bool = False,
+                 ignore_missing: bool = True, checkpoint_every: int = 50):
+        self.client = client
+        self.max_workers = max_workers
+        self.checkpoint_path = checkpoint_path
+        self.stop_on_error = stop_on_error
+        self.ignore_missing = ignore_missing
+        self.checkpoint_every = checkpoint_every
+        self._lock = threading.Lock()
+        self._log = None
+        self._journaled = {}
+
+    @staticmethod
+    def _parse(operations) -> dict:
+        items = {}
+        for index, operation in enumerate(operations):
+            op = operation.get("op")
+            if op not in OPERATIONS:
+                raise ValueError(f"지원하지 않는 작업입니다: {op}")
+            item_id = str(operation.get("id", f"#{index}"))
+            if item_id in items:
+                raise ValueError(f"작업 id가 중복되었습니다: {item_id}")
+            params = {key: value for key, value in operation.items() if key not in RESERVED}
+            after = list(dict.fromkeys([str(dep) for dep in operation.get("after", ())] + list(_refs(params))))
+            items[item_id] = BatchItem(item_id, op, params, after)
+        for item in items.values():
+            for dep in item.after:
+                if dep not in items:
+                    raise ValueError(f"{item.id}: 알 수 없는 선행 작업입니다: {dep}")
+        return items
+
+    @staticmethod
+    def _check_cycles(items: dict):
+        # 1: 탐색 중, 2: 탐색 완료
+        state = {}
+        for start in items:
+            if start in state:
+                continue
+            state[start] = 1
+            stack = [(start, iter(items[start].after))]
+            while stack:
+                node, deps = stack[-1]
+                dep = next(deps, None)
+                if dep is None:
+                    state[node] = 2
+                    stack.pop()
+                elif state.get(dep) == 1:
+                    raise ValueError(f"작업 순서에 순환이 있습니다: {dep}")
+                elif dep not in state:
+                    state[dep] = 1
+                    stack.append((dep, iter(items[dep].after)))
+
+    def _load_checkpoint(self) -> dict:
+        if not self.checkpoint_path:
+            return {}
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                done = json.load(f).get("done", {})
+        except (OSError, ValueError):
+            done = {}
+        try:
+            with open(self.checkpoint_path + ".log", "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # 기록 중에 끊긴 마지막 줄은 무시합니다.
+                        continue
+                    done[record["id"]] = {"op": record["op"], "result": record.get("result")}
+        except OSError:
+            pass
+        return done
+
+    def _journal(self, item: BatchItem, result):
+        """
+        완료된 작업 하나를 체크포인트 로그에 바로 덧붙입니다. (작업 스레드에서 호출됩니다.)
+        """
+        if not self.checkpoint_path:
+            return
+        record = {"id": item.id, "op": item.op, "result": result}
+        with self._lock:
+            self._journaled[item.id] = {"op": item.op, "result": result}
+            if self._log is None:
+                self._log = open(self.checkpoint_path + ".log", "a", encoding="utf-8")
+            self._log.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self._log.flush()
+
+    def _save_checkpoint(self, items: dict):
+        if not self.checkpoint_path:
+            return
+        with self._lock:
+            # 로그에만 기록되고 아직 done으로 표시되지 않은 작업도 함께 저장합니다.
+            done = dict(self._journaled)
+            done.update((item.id, {"op": item.op, "result": item.result}) for item in items.values()
+                        if item.status == "done")
+            temp_path = self.checkpoint_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "done": done}, f, ensure_ascii=False)
+            os.replace(temp_path, self.checkpoint_path)
+            if self._log is not None:
+                self._log.close()
+                self._log = None
+            log_path = self.checkpoint_path + ".log"
+            if os.path.exists(log_path):
+                os.remove(log_path)
+
+    def _resolve(self, value, items: dict):
+        if isinstance(value, dict):
+            if set(value) == {"$ref"}:
+                result = items[value["$ref"]].result or {}
+                return result.get("id")
+            return {key: self._resolve(item, items) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._resolve(item, items) for item in value]
+        return value
+
+    def _execute(self, item: BatchItem, items: dict):
+        params = self._resolve(item.params, items)
+        method = getattr(self.client, OPERATIONS[item.op])
+        try:
+            result = _payload(method(**params))
+        except requests.HTTPError as error:
+            if (self.ignore_missing and item.op in DELETE_OPERATIONS and error.response is not None
+                    and error.response.status_code == 404):
+                return None
+            raise
+        if item.op in NON_IDEMPOTENT_OPERATIONS:
+            self._journal(item, result)
+        return result
+
+    def run(self, operations) -> BatchResult:
+        """
+        작업을 모두 실행하고 입력 순서대로 정렬된 BatchResult를 반환합니다.
+        """
+        started = time.monotonic()
+        items = self._parse(operations)
+        self._check_cycles(items)
+        for item_id, saved in self._load_checkpoint().items():
+            item = items.get(item_id)
+            if item is not None and item.op == saved.get("op"):
+                item.status, item.result, item.resumed = "done", saved.get("result"), True
+
+        dependents = {item_id: [] for item_id in items}
+        waiting = {}
+        for item in items.values():
+            if item.status == "pending":
+                waiting[item.id] = sum(1 for dep in item.after if items[dep].status != "done")
+                for dep in item.after:
+                    dependents[dep].append(item.id)
+        ready = deque(item_id for item_id, count in waiting.items() if count == 0)
+        completed = 0
+        stopped = False
+        running = {}
+        self._journaled = {}
+
+        def skip(item_id):
+            stack = [item_id]
+            while stack:
+                current = stack.pop()
+                for dependent in dependents[current]:
+                    if items[dependent].status == "pending":
+                        items[dependent].status = "skipped"
+                        items[dependent].error = f"선행 작업 {current}이(가) 완료되지 않았습니다."
+                        stack.append(dependent)
+
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+                while ready or running:
+                    while ready and not stopped and len(running) < self.max_workers:
+                        item_id = ready.popleft()
+                        if items[item_id].status == "pending":
+                            running[executor.submit(self._execute, items[item_id], items)] = item_id
+                    if not running:
+                        break
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        item = items[running.pop(future)]
+                        try:
+                            item.result = future.result()
+                        except Exception as error:
+                            item.status, item.error = "failed", error
+                            skip(item.id)
+                            stopped = stopped or self.stop_on_error
+                            continue
+                        item.status = "done"
+                        completed += 1
+                        for dependent in dependents[item.id]:
+                            waiting[dependent] -= 1
+                            if waiting[dependent] == 0:
+                                ready.append(dependent)
+                        if completed % self.checkpoint_every == 0:
+                            self._save_checkpoint(items)
+        finally:
+            # 중단되었더라도 이미 끝난 작업의 결과는 체크포인트에 남깁니다.
+            for future, item_id in running.items():
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    items[item_id].status, items[item_id].result = "done", future.result()
+            self._save_checkpoint(items)
+            self._journaled = {}
+        for item in items.values():
+            if item.status == "pending":
+                item.status, item.error = "skipped", "이전 작업이 실패해 배치가 중단되었습니다."
+        return BatchResult(list(items.values()), time.monotonic() - started)
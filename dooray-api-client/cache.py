@@ -0,0 +1,201 @@
+import fnmatch
+import threading
+import time
+from collections import OrderedDict, deque
+
+DEFAULT_TTL = 60
+# 진행 중인 GET의 결과를 저장해도 되는지 판단하기 위해 기억해 두는 최근 무효화 수
+INVALIDATION_HISTORY = 256
+
+
+class CacheEntry:
+    """
+    캐시된 GET 응답 하나. 만료된 뒤에도 ETag/Last-Modified가 있으면 재검증에 사용됩니다.
+
+    value는 응답 본문(bytes)이며, 클라이언트는 캐시에서 꺼낼 때마다 새로 디코딩하므로
+    반환된 결과를 수정해도 캐시된 응답은 바뀌지 않습니다.
+    """
+    __slots__ = ("endpoint", "value", "expires_at", "etag", "last_modified")
+
+    def __init__(self, endpoint: str, value, expires_at: float, etag: str = None, last_modified: str = None):
+        self.endpoint = endpoint
+        self.value = value
+        self.expires_at = expires_at
+        self.etag = etag
+        self.last_modified = last_modified
+
+    def is_fresh(self, now: float = None) -> bool:
+        return (time.monotonic() if now is None else now) < self.expires_at
+
+    def validators(self) -> dict:
+        """
+        조건부 요청에 사용할 헤더
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class ResponseCache:
+    """
+    GET 응답을 method/endpoint/params 기준으로 저장하는 TTL + LRU 캐시.
+
+        client = DoorayAPIClient(token, cache=ResponseCache(maxsize=2048, ttls={
+            "/drive/v1/drives/*/files": 10,
+            "/wiki/v1/wikis/*/pages/*": 120,
+        }))
+
+    :param maxsize: 최대 항목 수. 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    :param ttl: 규칙에 해당하지 않는 엔드포인트의 TTL(초)
+    :param ttls: {fnmatch 패턴: TTL} 엔드포인트별 TTL. 먼저 일치하는 규칙을 사용하며 0이면 캐시하지 않습니다.
+
+    GET이 아닌 요청이 성공하면 해당 경로의 상위/하위 엔드포인트 항목을 무효화합니다.
+    예를 들어 move_file(.../files/{id}/move)은 파일 메타와 파일 목록 캐시를 함께 지웁니다.
+    GET을 보내기 전의 generation을 store()에 넘기면, 응답을 기다리는 동안 관련 경로가 무효화된 경우
+    이전 상태일 수 있는 응답을 저장하지 않습니다.
+    """
+    def __init__(self, maxsize: int = 1024, ttl: float = DEFAULT_TTL, ttls: dict = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.ttls = list((ttls or {}).items())
+        self._entries = OrderedDict()
+        self._keys_by_endpoint = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._invalidated = deque(maxlen=INVALIDATION_HISTORY)
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self.stale = 0
+
+    @staticmethod
+    def make_key(method: str, endpoint: str, params: dict = None):
+        items = tuple(sorted((key, str(value)) for key, value in (params or {}).items() if value is not None))
+        return method, endpoint, items
+
+    @property
+    def generation(self) -> int:
+        """
+        무효화할 때마다 1씩 늘어나는 값. 요청을 보내기 전에 읽어 store()에 넘깁니다.
+        """
+        return self._generation
+
+    def ttl_for(self, endpoint: str) -> float:
+        for pattern, ttl in self.ttls:
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return ttl
+        return self.ttl
+
+    def lookup(self, endpoint: str, params: dict = None, method: str = "GET"):
+        """
+        (key, entry, fresh)를 반환합니다. entry는 없거나 만료되었을 수 있습니다.
+        """
+        key = self.make_key(method, endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            fresh = entry is not None and entry.is_fresh()
+            if fresh:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        return key, entry, fresh
+
+    def store(self, key, value, headers=None, generation: int = None):
+        """
+        응답을 저장합니다. headers는 ETag/Last-Modified를 읽을 응답 헤더입니다.
+
+        :param generation: 요청을 보내기 전의 generation. 그 뒤에 이 경로가 무효화되었으면 저장하지 않습니다.
+        """
+        endpoint = key[1]
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0 or self.maxsize <= 0:
+            return
+        headers = headers or {}
+        entry = CacheEntry(endpoint, value, time.monotonic() + ttl,
+                           etag=headers.get("ETag"), last_modified=headers.get("Last-Modified"))
+        with self._lock:
+            if generation is not None and self._invalidated_since(generation, endpoint):
+                self.stale += 1
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            self._keys_by_endpoint.setdefault(endpoint, set()).add(key)
+            while len(self._entries) > self.maxsize:
+                old_key, _ = self._entries.popitem(last=False)
+                self._discard_key(old_key)
+                self.evictions += 1
+
+    def revalidated(self, key, entry: CacheEntry):
+        """
+        304 Not Modified 응답으로 재검증된 항목의 만료 시각을 갱신합니다.
+        """
+        with self._lock:
+            entry.expires_at = time.monotonic() + self.ttl_for(entry.endpoint)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            self.revalidations += 1
+
+    def invalidate(self, endpoint: str):
+        """
+        endpoint의 상위 경로(목록 등)와 하위 경로(하위 리소스)의 항목을 모두 제거합니다.
+        """
+        endpoint = endpoint.rstrip("/")
+        with self._lock:
+            self._generation += 1
+            self._invalidated.append((self._generation, endpoint))
+            for cached_endpoint in list(self._keys_by_endpoint):
+                if _is_related(cached_endpoint, endpoint):
+                    for key in self._keys_by_endpoint.pop(cached_endpoint):
+                        self._entries.pop(key, None)
+                        self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._invalidated.append((self._generation, ""))
+            self._entries.clear()
+            self._keys_by_endpoint.clear()
+
+    def _invalidated_since(self, generation: int, endpoint: str) -> bool:
+        # self._lock을 잡은 상태에서 호출합니다.
+        if generation == self._generation:
+            return False
+        if not self._invalidated or self._invalidated[0][0] > generation + 1:
+            # 기록이 잘려 확인할 수 없으면 저장하지 않습니다.
+            return True
+        return any(number > generation and _is_related(endpoint, invalidated)
+                   for number, invalidated in self._invalidated)
+
+    def _discard_key(self, key):
+        keys = self._keys_by_endpoint.get(key[1])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._keys_by_endpoint[key[1]]
+
+    def __len__(self):
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "stale": self.stale,
+        }
+
+
+def _is_related(cached_endpoint: str, endpoint: str) -> bool:
+    # 경로 구분자(/) 경계에서 한쪽이 다른 쪽의 접두어이면 관련된 리소스로 봅니다.
+    shorter, longer = sorted((cached_endpoint, endpoint), key=len)
+    return longer.startswith(shorter) and (len(longer) == len(shorter) or longer[len(shorter)] == "/")
@@ -1,73 +1,507 @@
+import contextvars
+import math
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
 import requests
+from requests.adapters import HTTPAdapter
+
+from .cache import ResponseCache
+from .instrumentation import Instrumentation, endpoint_template
+from .models import json_loads, parse_response
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .singleflight import SingleFlight
+from .transfer import DownloadState, MultipartEncoder, SegmentedFile, TransferResult
+
+DEFAULT_TIMEOUT = (5, 60)
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_PAGE_WORKERS = 4
+MIN_SEGMENT_SIZE = 8 * 1024 * 1024
+# 기억해 둘 업로드 리디렉션 대상(파일 서버)의 최대 개수
+MAX_REDIRECT_TARGETS = 64
+DRIVE_PATTERN = re.compile(r"/drives/([^/]+)")
+
+
+class RedirectError(requests.HTTPError):
+    """
+    307 리디렉션을 처리할 수 없을 때 발생하는 예외. response에 원인이 된 응답이 들어 있습니다.
+    """
 
 class DoorayAPIClient:
     """
     DoorayAPIClient는 Dooray! API를 사용하기 위한 Python 클라이언트입니다.
+
+    모든 요청은 하나의 requests.Session을 통해 전송되므로 api.dooray.co.kr과
+    307 리디렉션 대상 호스트에 대한 TCP/TLS 연결이 keep-alive로 재사용됩니다.
+    세션의 커넥션 풀은 스레드 간에 공유해도 안전합니다.
+
+    :param pool_connections: 풀을 유지할 호스트 수
+    :param pool_maxsize: 호스트당 유지할 최대 연결 수 (동시 요청 스레드 수에 맞춰 설정)
+    :param pool_block: 풀이 가득 찼을 때 새 연결을 만들지 않고 대기할지 여부
+    :param timeout: requests 형식의 타임아웃 (초 또는 (connect, read) 튜플)
+    :param upload_redirect: 파일 업로드의 307 처리 방식.
+        "probe"(기본값)는 본문 없이 먼저 요청해 리디렉션 대상을 확인한 뒤 본문을 한 번만 전송합니다.
+        "resend"는 본문을 첫 호스트에 보낸 뒤 307이면 대상 URL로 다시 전송합니다. 본문 없는 요청을
+        리디렉션하지 않는 서버에서 사용합니다.
+        두 방식 모두 확인된 파일 서버를 (메서드, 드라이브, 엔드포인트 종류)별로 최대 MAX_REDIRECT_TARGETS개
+        기억해 이후 업로드는 파일 id가 달라도 대상으로 바로 보냅니다. 기억한 대상으로 보낸 요청이 실패하면
+        잊어버린 뒤 원래 URL로 다시 307 처리부터 진행합니다.
+    :param cache: GET 응답 캐시(ResponseCache). True이면 기본 설정의 캐시를 사용합니다.
+    :param rate_limiter: 요청 전 속도를 조절할 RateLimiter
+    :param retry: 429/5xx 재시도 정책(RetryPolicy). True이면 기본 정책을 사용합니다.
+    :param coalesce: True(또는 SingleFlight)이면 동시에 진행 중인 같은 GET 요청을 하나로 합칩니다.
+        합쳐진 호출자들은 응답 본문을 공유하고 각자 디코딩한 결과를 받습니다.
+    :param instrumentation: 요청마다 훅을 호출하고 지표를 수집할 Instrumentation. True이면 기본 설정을 사용합니다.
+    :param typed: True이면 응답을 dict 대신 models의 __slots__ 모델(models.Response)로 반환합니다.
+        모델은 dict처럼 item["id"], item.get("id")로도 접근할 수 있습니다.
     """
-    def __init__(self, token: str):
+    def __init__(self, token: str, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, timeout=DEFAULT_TIMEOUT, upload_redirect: str = "probe",
+                 cache: ResponseCache = None, rate_limiter: RateLimiter = None, retry: RetryPolicy = None,
+                 coalesce: bool = False, typed: bool = False, instrumentation: Instrumentation = None):
         self.token = token
         self.base_url = "https://api.dooray.co.kr"
+        self.timeout = timeout
 
         self.headers = {
             "Authorization": f"dooray-api {self.token}"
         }
 
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        if upload_redirect not in ("probe", "resend"):
+            raise ValueError(f"지원하지 않는 upload_redirect 값입니다: {upload_redirect}")
+        self.upload_redirect = upload_redirect
+        self._redirect_targets = OrderedDict()
+        self._redirect_lock = threading.Lock()
+
+        self.cache = ResponseCache() if cache is True else (None if cache is False else cache)
+        self.rate_limiter = rate_limiter
+        self.retry = RetryPolicy() if retry is True else (None if retry is False else retry)
+        self.singleflight = SingleFlight() if coalesce is True else (coalesce or None)
+        self.typed = typed
+        self.instrumentation = Instrumentation() if instrumentation is True else (instrumentation or None)
+
+    def _create_session(self):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=self.pool_connections, pool_maxsize=self.pool_maxsize,
+                              pool_block=self.pool_block)
+        # 307 리디렉션 대상(파일 서버)도 같은 어댑터의 풀을 사용합니다.
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.headers["Connection"] = "keep-alive"
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        요청에 사용하는 공유 세션. 처음 접근할 때 생성됩니다.
+        """
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                if self._session is None:
+                    self._session = self._create_session()
+                session = self._session
+        return session
+
+    def close(self):
+        """
+        커넥션 풀을 닫습니다. 이후 요청이 오면 새 세션을 생성합니다.
+        """
+        with self._session_lock:
+            session, self._session = self._session, None
+        if session is not None:
+            session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        세션으로 요청 하나를 전송합니다. 모든 API 호출과 파일 전송이 이 메서드를 거치며,
+        속도 제한(rate_limiter)과 재시도(retry), 계측(instrumentation)이 여기서 적용됩니다.
+        """
+        path = urlsplit(url).path
+        instrumentation = self.instrumentation
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(path)
+            if instrumentation is not None:
+                event = instrumentation.start(method, url, attempt, getattr(kwargs.get("data"), "len", 0))
+            try:
+                response = self.session.request(method, url, timeout=self.timeout, **kwargs)
+            except Exception as error:
+                if instrumentation is not None:
+                    instrumentation.finish(event, error=error)
+                if not isinstance(error, (requests.ConnectionError, requests.Timeout)) or self.retry is None \
+                        or not self.retry.should_retry(method, attempt):
+                    raise
+                delay = self.retry.delay(attempt)
+            else:
+                if instrumentation is not None:
+                    received = 0 if kwargs.get("stream") else len(response.content)
+                    instrumentation.finish(event, response.status_code, bytes_received=received)
+                if self.retry is None or not self.retry.should_retry(method, attempt, response.status_code):
+                    return response
+                delay = self.retry.delay(attempt, response.headers.get("Retry-After"))
+                response.close()
+            time.sleep(delay)
+            attempt += 1
+            body = kwargs.get("data")
+            if hasattr(body, "rewind"):
+                body.rewind()
+
     def _request(self, method: str, endpoint: str, params=None, data=None, json_data=None, files=None, extra_headers=None):
+        if method == "GET" and self.singleflight is not None:
+            key = ResponseCache.make_key(method, endpoint, params)
+            content = self.singleflight.do(key, lambda: self._request_content(method, endpoint, params, data, json_data,
+                                                                              files, extra_headers))
+        else:
+            content = self._request_content(method, endpoint, params, data, json_data, files, extra_headers)
+        # 캐시 적중이나 합쳐진 호출이어도 호출자마다 새로 디코딩한 결과를 받습니다.
+        return self._decode(endpoint, content)
+
+    def _request_content(self, method: str, endpoint: str, params=None, data=None, json_data=None, files=None,
+                         extra_headers=None) -> bytes:
+        """
+        요청을 보내고 응답 본문을 반환합니다. GET은 캐시를 거칩니다.
+        """
         url = self.base_url + endpoint
         headers = self.headers.copy()
         if extra_headers:
             headers.update(extra_headers)
 
-        response = requests.request(method, url, params=params, data=data, json=json_data, files=files, headers=headers)
+        cache = self.cache if method == "GET" else None
+        if cache is not None:
+            cache_key, entry, fresh = cache.lookup(endpoint, params, method)
+            if fresh:
+                return entry.value
+            if entry is not None:
+                headers.update(entry.validators())
+            generation = cache.generation
+
+        response = self._send(method, url, params=params, data=data, json=json_data, files=files, headers=headers)
+        if cache is not None and entry is not None and response.status_code == 304:
+            cache.revalidated(cache_key, entry)
+            return entry.value
         response.raise_for_status()
-        return response.json()
+        if cache is None and self.cache is not None:
+            # 변경 요청이 성공하면 관련 캐시를 무효화합니다.
+            self.cache.invalidate(endpoint)
+        content = response.content
+        if cache is not None:
+            cache.store(cache_key, content, response.headers, generation)
+        return content
+
+    def _decode(self, endpoint: str, content: bytes):
+        """
+        응답 본문을 디코딩합니다. typed이면 엔드포인트에 맞는 모델로 변환합니다.
+        """
+        result = json_loads(content)
+        return parse_response(endpoint, result) if self.typed else result
+
+    def _invalidate_url(self, url: str):
+        if self.cache is not None:
+            self.cache.invalidate(urlsplit(url).path)
+
+    @staticmethod
+    def _redirect_key(method: str, url: str):
+        # 파일 서버 호스트는 드라이브와 엔드포인트 종류로 정해지므로 파일/페이지 id 구간은 키에 넣지 않습니다.
+        split = urlsplit(url)
+        drive = DRIVE_PATTERN.search(split.path)
+        return method, split.scheme, split.netloc, drive.group(1) if drive else None, endpoint_template(split.path)
+
+    def _known_upload_target(self, method: str, url: str):
+        """
+        같은 드라이브와 엔드포인트 종류로 이전에 확인한 파일 서버에 url의 경로를 붙여 반환합니다. 없으면 None입니다.
+        """
+        key = self._redirect_key(method, url)
+        with self._redirect_lock:
+            origin = self._redirect_targets.get(key)
+            if origin is None:
+                return None
+            self._redirect_targets.move_to_end(key)
+        return origin + urlsplit(url).path
+
+    def _remember_redirect(self, method: str, url: str, location: str):
+        # 대상이 같은 경로를 다른 호스트로 보낸 경우에만 호스트를 기억해 다른 파일 id에도 재사용합니다.
+        target = urlsplit(location)
+        if target.path != urlsplit(url).path:
+            return
+        key = self._redirect_key(method, url)
+        with self._redirect_lock:
+            self._redirect_targets[key] = f"{target.scheme}://{target.netloc}"
+            self._redirect_targets.move_to_end(key)
+            while len(self._redirect_targets) > MAX_REDIRECT_TARGETS:
+                self._redirect_targets.popitem(last=False)
+
+    def _forget_redirect(self, method: str, url: str):
+        with self._redirect_lock:
+            self._redirect_targets.pop(self._redirect_key(method, url), None)
+
+    @staticmethod
+    def _redirect_params(location: str, params: dict):
+        # 리디렉션 대상에 쿼리가 있으면 그대로 사용하고 원래 파라미터를 다시 붙이지 않습니다.
+        return None if urlsplit(location).query else params
+
+    def _resolve_upload_target(self, method: str, url: str, params: dict, headers: dict) -> str:
+        """
+        본문 없이 요청을 보내 307 리디렉션 대상을 확인합니다.
+
+        오류 응답은 HTTPError로 알립니다. 리디렉션 없이 성공했다면 서버가 빈 파일을 이미 만든 것이므로
+        본문을 보내지 않고 RedirectError를 발생시킵니다. 이런 서버에는 "probe"를 사용할 수 없습니다.
+        """
+        response = self._send(method, url, params=params, headers=headers, allow_redirects=False)
+        with response:
+            response.raise_for_status()
+            if response.status_code != 307:
+                raise RedirectError(f"리디렉션 확인 요청이 {response.status_code}로 처리되어 빈 파일이 만들어졌을 수 "
+                                    "있습니다. 이 서버는 업로드를 리디렉션하지 않습니다.", response=response)
+            location = response.headers.get("location")
+        if not location:
+            raise RedirectError("307 응답이지만 location 헤더가 없습니다.", response=response)
+        self._remember_redirect(method, url, location)
+        return location
 
-    def _post_file_with_redirect(self, url: str, params: dict, file_field: str, file_path: str, data: dict = None, extra_headers: dict = None):
+    def _send_file_with_redirect(self, method: str, url: str, params: dict, file_field: str, file_path: str,
+                                 data: dict = None, extra_headers: dict = None, progress=None):
         """
-        POST 방식 파일 업로드 시 307 응답을 처리하는 헬퍼 메서드.
+        multipart 본문을 스트리밍으로 업로드하고 307 응답을 처리합니다.
+
+        파일은 고정 크기 청크로 읽어 전송하므로 파일 크기와 관계없이 메모리 사용량이 일정합니다.
         """
         headers = self.headers.copy()
         if extra_headers:
             headers.update(extra_headers)
 
-        with open(file_path, "rb") as f:
-            files = {file_field: f}
-            # 자동 리디렉션을 비활성화하여 첫 요청을 보냄
-            response = requests.post(url, params=params, data=data, files=files, headers=headers, allow_redirects=False)
-
-        if response.status_code == 307:
-            location = response.headers.get("location")
-            if not location:
-                raise Exception("307 응답이지만 location 헤더가 없습니다.")
-            with open(file_path, "rb") as f:
-                files = {file_field: f}
-                response = requests.post(location, params=params, data=data, files=files, headers=headers)
-
-        response.raise_for_status()
-        return response.json()
+        original_url = url
+        known = self._known_upload_target(method, url)
+        if known is not None:
+            url = known
+        elif self.upload_redirect == "probe":
+            url = self._resolve_upload_target(method, url, params, headers)
+
+        started = time.monotonic()
+        with MultipartEncoder(file_field, file_path, fields=data, progress=progress) as body:
+            headers["Content-Type"] = body.content_type
+            response = None
+            if known is not None:
+                # 기억한 대상이 더 이상 유효하지 않으면 원래 URL의 307 처리로 돌아갑니다.
+                try:
+                    response = self._send(method, known, params=self._redirect_params(known, params), data=body,
+                                          headers=headers, allow_redirects=False)
+                except requests.ConnectionError:
+                    response = None
+                if response is None or response.status_code >= 300:
+                    if response is not None:
+                        response.close()
+                    response = None
+                    self._forget_redirect(method, original_url)
+                    body.rewind()
+                    url = original_url
+            if response is None:
+                response = self._send(method, url, params=params if url == original_url else
+                                      self._redirect_params(url, params), data=body, headers=headers,
+                                      allow_redirects=False)
+            if response.status_code == 307:
+                location = response.headers.get("location")
+                if not location:
+                    raise RedirectError("307 응답이지만 location 헤더가 없습니다.", response=response)
+                response.close()
+                self._remember_redirect(method, original_url, location)
+                body.rewind()
+                response = self._send(method, location, params=self._redirect_params(location, params), data=body,
+                                      headers=headers)
+            response.raise_for_status()
+            self._invalidate_url(original_url)
+            return TransferResult(response.json(), body.len, time.monotonic() - started)
+
+    def _post_file_with_redirect(self, url: str, params: dict, file_field: str, file_path: str, data: dict = None, extra_headers: dict = None,
+                                 progress=None):
+        """
+        POST 방식 파일 업로드 시 307 응답을 처리하는 헬퍼 메서드.
+        """
+        return self._send_file_with_redirect("POST", url, params, file_field, file_path, data, extra_headers, progress)
 
-    def _put_file_with_redirect(self, url: str, params: dict, file_field: str, file_path: str, data: dict = None, extra_headers: dict = None):
+    def _put_file_with_redirect(self, url: str, params: dict, file_field: str, file_path: str, data: dict = None, extra_headers: dict = None,
+                                progress=None):
         """
         PUT 방식 파일 업로드(업데이트) 시 307 응답을 처리하는 헬퍼 메서드.
         """
+        return self._send_file_with_redirect("PUT", url, params, file_field, file_path, data, extra_headers, progress)
+
+    def _get_file_with_redirect(self, url: str, params: dict, save_path: str, extra_headers: dict = None,
+                                chunk_size: int = 8192):
+        """
+        GET 방식 파일 다운로드 시 307 응답을 처리하는 헬퍼 메서드.
+        """
         headers = self.headers.copy()
         if extra_headers:
             headers.update(extra_headers)
 
-        with open(file_path, "rb") as f:
-            files = {file_field: f}
-            response = requests.put(url, params=params, data=data, files=files, headers=headers, allow_redirects=False)
-
+        # 자동 리디렉션 비활성화
+        response = self._send("GET", url, params=params, headers=headers, stream=True, allow_redirects=False)
         if response.status_code == 307:
             location = response.headers.get("location")
             if not location:
-                raise Exception("307 응답이지만 location 헤더가 없습니다.")
-            with open(file_path, "rb") as f:
-                files = {file_field: f}
-                response = requests.put(location, params=params, data=data, files=files, headers=headers)
+                raise RedirectError("307 응답이지만 location 헤더가 없습니다.", response=response)
+            response.close()
+            response = self._send("GET", location, params=params, headers=headers, stream=True)
+        received = 0
+        with response:
+            response.raise_for_status()
+            with open(save_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    f.write(chunk)
+                    received += len(chunk)
+        if self.instrumentation is not None:
+            self.instrumentation.add_bytes("GET", response.url, received=received)
+        return f"파일이 {save_path}에 저장되었습니다."
 
-        response.raise_for_status()
-        return response.json()
+    def _resolve_download_target(self, url: str, params: dict, headers: dict) -> str:
+        """
+        다운로드 URL의 307 리디렉션 대상을 한 번만 확인합니다.
+        """
+        response = self._send("GET", url, params=params, headers=headers, stream=True, allow_redirects=False)
+        with response:
+            if response.status_code != 307:
+                response.raise_for_status()
+                return url
+            location = response.headers.get("location")
+        if not location:
+            raise RedirectError("307 응답이지만 location 헤더가 없습니다.", response=response)
+        return location
+
+    def _fetch_segment(self, url: str, params: dict, headers: dict, state: DownloadState, index: int,
+                       output: SegmentedFile, chunk_size: int):
+        start, end, done = state.segments[index]
+        offset = start + done
+        if offset > end:
+            return
+        range_headers = dict(headers, Range=f"bytes={offset}-{end}")
+        with self._send("GET", url, params=params, headers=range_headers, stream=True) as response:
+            response.raise_for_status()
+            if response.status_code != 206 and (offset != 0 or end != state.size - 1):
+                raise Exception("서버가 Range 요청을 지원하지 않습니다. segments=1, resume=False로 다운로드하세요.")
+            try:
+                for chunk in response.iter_content(chunk_size=chunk_size):
+                    if offset + len(chunk) > end + 1:
+                        raise IOError(f"구간 {index}의 응답이 요청한 범위({start}-{end})보다 깁니다.")
+                    output.write_at(offset, chunk)
+                    offset += len(chunk)
+                    state.advance(index, len(chunk))
+                if offset != end + 1:
+                    raise IOError(f"구간 {index}({start}-{end})를 {offset - start}바이트만 받았습니다.")
+            finally:
+                if self.instrumentation is not None:
+                    self.instrumentation.add_bytes("GET", url, received=offset - start - done)
+
+    def _get_file_ranged(self, url: str, params: dict, save_path: str, drive_id: str, file_id: str, segments: int,
+                         chunk_size: int, resume: bool, extra_headers: dict = None):
+        """
+        Range 요청으로 파일을 여러 구간으로 나눠 동시에 받습니다.
+
+        307 리디렉션은 한 번만 확인하고, 미리 크기를 할당한 {save_path}.part 파일에 각 구간을 씁니다.
+        진행 상태는 {save_path}.part.json에 저장되어 resume=True로 다시 호출하면 이어받습니다.
+        각 구간이 요청한 범위만큼 왔는지 확인하고, 완료 후 받은 바이트 수의 합을 get_file_meta의 size와 비교합니다.
+        """
+        size = int(self.get_file_meta(drive_id, file_id)["result"]["size"])
+        headers = self.headers.copy()
+        if extra_headers:
+            headers.update(extra_headers)
+        location = self._resolve_download_target(url, params, headers)
+
+        part_path = save_path + ".part"
+        state_path = part_path + ".json"
+        state = DownloadState.load(state_path, size) if resume and os.path.exists(part_path) else None
+        if state is None:
+            state = DownloadState.create(state_path, size, segments, MIN_SEGMENT_SIZE)
+
+        with SegmentedFile(part_path, size) as output:
+            pending = state.pending()
+            try:
+                if len(pending) > 1:
+                    with ThreadPoolExecutor(max_workers=min(segments, len(pending))) as executor:
+                        # 구간은 호출한 스레드의 컨텍스트에서 받습니다. (DoorayClientPool의 토큰 고정 등)
+                        futures = [executor.submit(contextvars.copy_context().run, self._fetch_segment, location,
+                                                   params, headers, state, index, output, chunk_size)
+                                   for index in pending]
+                        for future in futures:
+                            future.result()
+                else:
+                    for index in pending:
+                        self._fetch_segment(location, params, headers, state, index, output, chunk_size)
+            finally:
+                state.save()
+
+        # .part 파일은 미리 size만큼 할당되므로 파일 크기가 아니라 구간별로 받은 바이트 수를 비교합니다.
+        received = state.received()
+        if received != size:
+            raise IOError(f"다운로드한 파일 크기({received})가 메타 정보의 크기({size})와 다릅니다.")
+        os.replace(part_path, save_path)
+        state.remove()
+        return f"파일이 {save_path}에 저장되었습니다."
+
+    def _iter_pages(self, fetch, size: int, max_workers: int, **kwargs):
+        """
+        page/size 기반 목록 API를 순회하며 항목을 하나씩 반환하는 제너레이터.
+
+        첫 페이지의 totalCount와 실제 항목 수(서버의 최대 페이지 크기)로 전체 페이지 수를 구한 뒤, 나머지 페이지는 최대
+        max_workers개까지 동시에 미리 가져옵니다. 항목은 페이지 순서대로 반환되며
+        메모리에는 최대 max_workers개의 페이지만 유지됩니다.
+        """
+        first = fetch(page=0, size=size, **kwargs)
+        items = first.get("result") or []
+        yield from items
+        if not items:
+            return
+        # 서버가 size를 줄였을 수 있으므로(최대 페이지 크기) 이후 페이지는 첫 페이지의 실제 항목 수로 요청합니다.
+        size = min(size, len(items))
+        total = first.get("totalCount")
+        if total is None:
+            # totalCount가 없으면 마지막(덜 찬) 또는 빈 페이지가 나올 때까지 순차 조회
+            page = 1
+            while len(items) >= size:
+                items = fetch(page=page, size=size, **kwargs).get("result") or []
+                yield from items
+                page += 1
+            return
+
+        pages = math.ceil(total / size)
+        if pages <= 1:
+            return
+        executor = ThreadPoolExecutor(max_workers=max(1, max_workers))
+        pending = deque()
+        next_page = 1
+        try:
+            while next_page < pages and len(pending) < max_workers:
+                pending.append(executor.submit(fetch, page=next_page, size=size, **kwargs))
+                next_page += 1
+            while pending:
+                result = pending.popleft().result()
+                if next_page < pages:
+                    pending.append(executor.submit(fetch, page=next_page, size=size, **kwargs))
+                    next_page += 1
+                yield from result.get("result") or []
+        finally:
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
 
     # ==================== 멤버 API ====================
     def get_members(self, externalEmailAddresses: str, name: str = None, userCode: str = None,
@@ -88,6 +522,16 @@ class DoorayAPIClient:
             params["idProviderUserId"] = idProviderUserId
         return self._request("GET", endpoint, params=params)
 
+    def iter_members(self, externalEmailAddresses: str = None, name: str = None, userCode: str = None,
+                     userCodeExact: str = None, idProviderUserId: str = None,
+                     size: int = DEFAULT_PAGE_SIZE, max_workers: int = DEFAULT_PAGE_WORKERS):
+        """
+        get_members의 모든 페이지를 순회하며 멤버를 하나씩 반환합니다.
+        """
+        return self._iter_pages(self.get_members, size, max_workers, externalEmailAddresses=externalEmailAddresses,
+                                name=name, userCode=userCode, userCodeExact=userCodeExact,
+                                idProviderUserId=idProviderUserId)
+
     # ==================== 드라이브 API ====================
     def get_drives(self, projectId: str = None, type: str = "private", scope: str = None, state: str = "active"):
         endpoint = "/drive/v1/drives"
@@ -102,14 +546,16 @@ class DoorayAPIClient:
         endpoint = f"/drive/v1/drives/{drive_id}"
         return self._request("GET", endpoint)
 
-    def upload_file(self, drive_id: str, parent_id: str, file_path: str):
+    def upload_file(self, drive_id: str, parent_id: str, file_path: str, progress=None):
         """
         파일 업로드 (드라이브에 단일 파일 업로드)
+
+        :param progress: progress(전송한 바이트, 전체 바이트) 형태의 진행률 콜백
         """
-        upload_url = f"https://api.dooray.co.kr/drive/v1/drives/{drive_id}/files"
+        upload_url = f"{self.base_url}/drive/v1/drives/{drive_id}/files"
         params = {"parentId": parent_id}
         headers = {"Authorization": f"dooray-api {self.token}"}
-        return self._post_file_with_redirect(upload_url, params, file_field="file", file_path=file_path, data=None, extra_headers=headers)
+        return self._post_file_with_redirect(upload_url, params, file_field="file", file_path=file_path, data=None, extra_headers=headers, progress=progress)
 
     def get_files(self, drive_id: str, type: str = None, subTypes: str = None, parentId: str = None, page: int = 0, size: int = 20):
         endpoint = f"/drive/v1/drives/{drive_id}/files"
@@ -122,30 +568,37 @@ class DoorayAPIClient:
             params["parentId"] = parentId
         return self._request("GET", endpoint, params=params)
 
+    def iter_files(self, drive_id: str, type: str = None, subTypes: str = None, parentId: str = None,
+                   size: int = DEFAULT_PAGE_SIZE, max_workers: int = DEFAULT_PAGE_WORKERS):
+        """
+        get_files의 모든 페이지를 순회하며 파일을 하나씩 반환합니다.
+        """
+        return self._iter_pages(self.get_files, size, max_workers, drive_id=drive_id, type=type,
+                                subTypes=subTypes, parentId=parentId)
+
     def get_file_meta(self, drive_id: str, file_id: str):
         endpoint = f"/drive/v1/drives/{drive_id}/files/{file_id}"
         params = {"media": "meta"}
         return self._request("GET", endpoint, params=params)
 
-    def download_file(self, drive_id: str, file_id: str, save_path: str):
+    def download_file(self, drive_id: str, file_id: str, save_path: str, segments: int = 1, chunk_size: int = 8192,
+                      resume: bool = False):
         """
         파일 다운로드 시에도 307 응답을 확인하여 재요청합니다.
+
+        :param segments: 1보다 크면 Range 요청으로 여러 구간을 동시에 받습니다.
+        :param chunk_size: 응답 본문을 읽어 쓰는 단위(바이트)
+        :param resume: 중단된 다운로드({save_path}.part)가 있으면 이어받습니다.
+        segments > 1 또는 resume=True이면 완료 후 크기를 get_file_meta와 비교합니다.
         """
-        download_url = f"https://api.dooray.co.kr/drive/v1/drives/{drive_id}/files/{file_id}"
+        download_url = f"{self.base_url}/drive/v1/drives/{drive_id}/files/{file_id}"
         params = {"media": "raw"}
         headers = {"Authorization": f"dooray-api {self.token}"}
-        # 자동 리디렉션 비활성화
-        response = requests.get(download_url, params=params, headers=headers, stream=True, allow_redirects=False)
-        if response.status_code == 307:
-            location = response.headers.get("location")
-            if not location:
-                raise Exception("307 응답이지만 location 헤더가 없습니다.")
-            response = requests.get(location, params=params, headers=headers, stream=True)
-        response.raise_for_status()
-        with open(save_path, "wb") as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        return f"파일이 {save_path}에 저장되었습니다."
+        if segments > 1 or resume:
+            return self._get_file_ranged(download_url, params, save_path, drive_id, file_id, segments, chunk_size,
+                                         resume, extra_headers=headers)
+        return self._get_file_with_redirect(download_url, params, save_path, extra_headers=headers,
+                                            chunk_size=chunk_size)
 
     def update_file_name(self, drive_id: str, file_id: str, new_name: str):
         endpoint = f"/drive/v1/drives/{drive_id}/files/{file_id}"
@@ -154,14 +607,14 @@ class DoorayAPIClient:
         headers = {"Content-Type": "application/json"}
         return self._request("PUT", endpoint, params=params, json_data=json_data, extra_headers=headers)
 
-    def update_file_version(self, drive_id: str, file_id: str, file_path: str):
+    def update_file_version(self, drive_id: str, file_id: str, file_path: str, progress=None):
         """
         파일 업데이트 (새 버전 업로드) 시 PUT 방식의 307 리디렉션을 처리합니다.
         """
-        update_url = f"https://api.dooray.co.kr/drive/v1/drives/{drive_id}/files/{file_id}"
+        update_url = f"{self.base_url}/drive/v1/drives/{drive_id}/files/{file_id}"
         params = {"media": "raw"}
         headers = {"Authorization": f"dooray-api {self.token}"}
-        return self._put_file_with_redirect(update_url, params, file_field="file", file_path=file_path, data=None, extra_headers=headers)
+        return self._put_file_with_redirect(update_url, params, file_field="file", file_path=file_path, data=None, extra_headers=headers, progress=progress)
 
     def delete_file(self, drive_id: str, file_id: str):
         endpoint = f"/drive/v1/drives/{drive_id}/files/{file_id}"
@@ -221,6 +674,12 @@ class DoorayAPIClient:
         params = {"page": page, "size": size}
         return self._request("GET", endpoint, params=params)
 
+    def iter_wikis(self, size: int = DEFAULT_PAGE_SIZE, max_workers: int = DEFAULT_PAGE_WORKERS):
+        """
+        get_wikis의 모든 페이지를 순회하며 위키를 하나씩 반환합니다.
+        """
+        return self._iter_pages(self.get_wikis, size, max_workers)
+
     def create_wiki_page(self, wiki_id: str, parentPageId: str, subject: str, content: str, attachFileIds: list = None, referrers: list = None):
         endpoint = f"/wiki/v1/wikis/{wiki_id}/pages"
         json_data = {
@@ -292,6 +751,13 @@ class DoorayAPIClient:
         params = {"page": page, "size": size}
         return self._request("GET", endpoint, params=params)
 
+    def iter_wiki_comments(self, wiki_id: str, page_id: str, size: int = DEFAULT_PAGE_SIZE,
+                           max_workers: int = DEFAULT_PAGE_WORKERS):
+        """
+        get_wiki_comments의 모든 페이지를 순회하며 댓글을 하나씩 반환합니다.
+        """
+        return self._iter_pages(self.get_wiki_comments, size, max_workers, wiki_id=wiki_id, page_id=page_id)
+
     def get_wiki_comment(self, wiki_id: str, page_id: str, comment_id: str):
         endpoint = f"/wiki/v1/wikis/{wiki_id}/pages/{page_id}/comments/{comment_id}"
         return self._request("GET", endpoint)
@@ -306,27 +772,26 @@ class DoorayAPIClient:
         endpoint = f"/wiki/v1/wikis/{wiki_id}/pages/{page_id}/comments/{comment_id}"
         return self._request("DELETE", endpoint)
 
-    def upload_wiki_page_file(self, wiki_id: str, page_id: str, file_path: str, file_type: str = "general"):
+    def upload_wiki_page_file(self, wiki_id: str, page_id: str, file_path: str, file_type: str = "general", progress=None):
         """
         위키 페이지에 파일 업로드 시 307 응답을 처리합니다.
         """
         url = f"{self.base_url}/wiki/v1/wikis/{wiki_id}/pages/{page_id}/files"
         data = {"type": file_type}
         headers = {"Authorization": f"dooray-api {self.token}"}
-        return self._post_file_with_redirect(url, params={}, file_field="file", file_path=file_path, data=data, extra_headers=headers)
+        return self._post_file_with_redirect(url, params={}, file_field="file", file_path=file_path, data=data, extra_headers=headers, progress=progress)
 
-    def upload_wiki_file(self, wiki_id: str, file_path: str, file_type: str = "general"):
+    def upload_wiki_file(self, wiki_id: str, file_path: str, file_type: str = "general", progress=None):
         """
         위키에 파일 업로드 시 307 응답을 처리합니다.
         """
         url = f"{self.base_url}/wiki/v1/wikis/{wiki_id}/files"
         data = {"type": file_type}
         headers = {"Authorization": f"dooray-api {self.token}"}
-        return self._post_file_with_redirect(url, params={}, file_field="file", file_path=file_path, data=data, extra_headers=headers)
+        return self._post_file_with_redirect(url, params={}, file_field="file", file_path=file_path, data=data, extra_headers=headers, progress=progress)
 
-# 여기서부터는 작동 여부 모름 ===========================================================================
-# ==================== 프로젝트 API ====================
-def create_project(self, code: str, description: str, scope: str = "private"):
+    # ==================== 프로젝트 API ====================
+    def create_project(self, code: str, description: str, scope: str = "private"):
         """
         프로젝트 생성
         """
@@ -353,6 +818,14 @@ def create_project(self, code: str, description: str, scope: str = "private"):
         }
         return self._request("GET", endpoint, params=params)
 
+    def iter_projects(self, member: str = "me", type: str = "public", scope: str = "private", state: str = "active",
+                      size: int = DEFAULT_PAGE_SIZE, max_workers: int = DEFAULT_PAGE_WORKERS):
+        """
+        get_projects의 모든 페이지를 순회하며 프로젝트를 하나씩 반환합니다.
+        """
+        return self._iter_pages(self.get_projects, size, max_workers, member=member, type=type, scope=scope,
+                                state=state)
+
     def get_project(self, project_id: str):
         """
         프로젝트 정보 조회
@@ -371,7 +844,6 @@ def create_project(self, code: str, description: str, scope: str = "private"):
         return self._request("POST", endpoint, json_data=json_data)
 
     # ==================== 프로젝트 업무 상태 API ====================
-    
     def get_workflows(self, project_id: str):
         """
         프로젝트의 업무 상태 조회
@@ -416,7 +888,6 @@ def create_project(self, code: str, description: str, scope: str = "private"):
         return self._request("POST", endpoint, json_data=json_data)
 
     # ==================== 프로젝트 이메일 API ====================
-    
     def create_email_address(self, project_id: str, email_address: str, name: str):
         """
         프로젝트 하위에 이메일 주소 생성
@@ -436,7 +907,6 @@ def create_project(self, code: str, description: str, scope: str = "private"):
         return self._request("GET", endpoint)
 
     # ==================== 프로젝트 태그 API ====================
-    
     def create_tag(self, project_id: str, name: str, color: str):
         """
         프로젝트에 태그 생성
@@ -459,6 +929,12 @@ def create_project(self, code: str, description: str, scope: str = "private"):
         }
         return self._request("GET", endpoint, params=params)
 
+    def iter_tags(self, project_id: str, size: int = DEFAULT_PAGE_SIZE, max_workers: int = DEFAULT_PAGE_WORKERS):
+        """
+        get_tags의 모든 페이지를 순회하며 태그를 하나씩 반환합니다.
+        """
+        return self._iter_pages(self.get_tags, size, max_workers, project_id=project_id)
+
     def get_tag(self, project_id: str, tag_id: str):
         """
         프로젝트의 특정 태그 조회
@@ -467,7 +943,6 @@ def create_project(self, code: str, description: str, scope: str = "private"):
         return self._request("GET", endpoint)
 
     # ==================== 프로젝트 마일스톤 API ====================
-    
     def create_milestone(self, project_id: str, name: str, started_at: str, ended_at: str):
         """
         프로젝트 마일스톤 생성
@@ -492,6 +967,13 @@ def create_project(self, code: str, description: str, scope: str = "private"):
         }
         return self._request("GET", endpoint, params=params)
 
+    def iter_milestones(self, project_id: str, status: str = "open", size: int = DEFAULT_PAGE_SIZE,
+                        max_workers: int = DEFAULT_PAGE_WORKERS):
+        """
+        get_milestones의 모든 페이지를 순회하며 마일스톤을 하나씩 반환합니다.
+        """
+        return self._iter_pages(self.get_milestones, size, max_workers, project_id=project_id, status=status)
+
     def get_milestone(self, project_id: str, milestone_id: str):
         """
         특정 프로젝트 마일스톤 조회
@@ -520,7 +1002,6 @@ def create_project(self, code: str, description: str, scope: str = "private"):
         return self._request("DELETE", endpoint)
 
     # ==================== 프로젝트 Hook API ====================
-    
     def create_hook(self, project_id: str, url: str, send_events: list):
         """
         프로젝트 Hook 생성
@@ -0,0 +1,261 @@
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait
+
+import requests
+
+
+class WikiNode:
+    """
+    위키 페이지 트리의 노드 하나
+    """
+    __slots__ = ("id", "parent_id", "subject", "path", "version", "children", "body", "comments")
+
+    def __init__(self, id: str, parent_id: str, subject: str, path: str, version=None):
+        self.id = id
+        self.parent_id = parent_id
+        self.subject = subject
+        self.path = path
+        self.version = version
+        self.children = []
+        self.body = None
+        self.comments = None
+
+    def __repr__(self):
+        return f"WikiNode({self.id!r}, {self.path!r})"
+
+
+class WikiTree:
+    """
+    id → 노드, 경로 → id 색인을 가진 위키 페이지 트리.
+
+    경로는 최상위 페이지부터 제목을 "/"로 이은 문자열입니다. (예: "Home/가이드/설치")
+    """
+    def __init__(self, wiki_id: str):
+        self.wiki_id = wiki_id
+        self.nodes = {}
+        self.roots = []
+        self._path_to_id = {}
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def __contains__(self, page_id: str):
+        return page_id in self.nodes
+
+    def get(self, page_id: str) -> WikiNode:
+        return self.nodes.get(page_id)
+
+    def find(self, path: str) -> WikiNode:
+        """
+        경로로 노드를 찾습니다. 같은 경로의 페이지가 여럿이면 마지막으로 색인된 페이지를 반환합니다.
+        """
+        page_id = self._path_to_id.get(path.strip("/"))
+        return self.nodes.get(page_id) if page_id is not None else None
+
+    def parent(self, page_id: str) -> WikiNode:
+        node = self.nodes.get(page_id)
+        return self.nodes.get(node.parent_id) if node is not None else None
+
+    def children(self, page_id: str) -> list:
+        node = self.nodes.get(page_id)
+        return [self.nodes[child_id] for child_id in node.children] if node is not None else []
+
+    def walk(self, page_id: str = None):
+        """
+        page_id(없으면 전체)의 하위 노드를 깊이 우선 순서로 반환합니다.
+        """
+        stack = [page_id] if page_id is not None else list(reversed(self.roots))
+        while stack:
+            node = self.nodes.get(stack.pop())
+            if node is None:
+                continue
+            yield node
+            stack.extend(reversed(node.children))
+
+    def search(self, text: str) -> list:
+        """
+        제목 또는 (가져온 경우) 본문에 text가 포함된 노드 목록
+        """
+        text = text.lower()
+        found = []
+        for node in self.walk():
+            content = (node.body or {}).get("content") or ""
+            if text in node.subject.lower() or text in content.lower():
+                found.append(node)
+        return found
+
+    def _add(self, node: WikiNode):
+        self.nodes[node.id] = node
+        self._path_to_id[node.path] = node.id
+        parent = self.nodes.get(node.parent_id)
+        if parent is None:
+            if node.id not in self.roots:
+                self.roots.append(node.id)
+        elif node.id not in parent.children:
+            parent.children.append(node.id)
+
+    def _rename(self, node: WikiNode, subject: str):
+        if self._path_to_id.get(node.path) == node.id:
+            del self._path_to_id[node.path]
+        parent = self.nodes.get(node.parent_id)
+        node.subject = subject
+        node.path = f"{parent.path}/{subject}" if parent is not None else subject
+        self._path_to_id[node.path] = node.id
+
+    def _move(self, node: WikiNode, parent_id: str):
+        """
+        node를 parent_id(None이면 최상위) 아래로 옮깁니다. 경로는 _rename으로 다시 계산해야 합니다.
+        """
+        old_parent = self.nodes.get(node.parent_id)
+        siblings = old_parent.children if old_parent is not None else self.roots
+        if node.id in siblings:
+            siblings.remove(node.id)
+        node.parent_id = parent_id
+        parent = self.nodes.get(parent_id)
+        siblings = parent.children if parent is not None else self.roots
+        if node.id not in siblings:
+            siblings.append(node.id)
+
+    def _remove(self, page_id: str):
+        self._remove_subtree(page_id)
+        node = self.nodes.pop(page_id, None)
+        if node is None:
+            return
+        if self._path_to_id.get(node.path) == node.id:
+            del self._path_to_id[node.path]
+        parent = self.nodes.get(node.parent_id)
+        siblings = parent.children if parent is not None else self.roots
+        if page_id in siblings:
+            siblings.remove(page_id)
+
+    def _remove_subtree(self, page_id: str):
+        """
+        page_id의 하위 노드를 모두 제거합니다. page_id 노드 자체는 남깁니다.
+        """
+        node = self.nodes.get(page_id)
+        if node is None:
+            return
+        for child in list(self.walk(page_id))[1:]:
+            self.nodes.pop(child.id, None)
+            if self._path_to_id.get(child.path) == child.id:
+                del self._path_to_id[child.path]
+        node.children = []
+
+
+class WikiCrawler:
+    """
+    get_wiki_pages를 동시에 호출해 위키 전체 페이지 트리를 만듭니다.
+
+        crawler = WikiCrawler(client, wiki_id, max_workers=16, bodies=True)
+        tree = crawler.crawl()
+        tree.find("Home/가이드").children
+
+    :param bodies: True이면 get_wiki_page로 각 페이지의 본문도 가져옵니다.
+    :param comments: True이면 iter_wiki_comments로 각 페이지의 댓글도 가져옵니다.
+    """
+    def __init__(self, client, wiki_id: str, max_workers: int = 8, bodies: bool = False, comments: bool = False):
+        self.client = client
+        self.wiki_id = wiki_id
+        self.max_workers = max_workers
+        self.bodies = bodies
+        self.comments = comments
+
+    def crawl(self) -> WikiTree:
+        """
+        최상위 페이지부터 전체 트리를 가져옵니다.
+        """
+        tree = WikiTree(self.wiki_id)
+        self._expand(tree, [None])
+        return tree
+
+    def refresh(self, tree: WikiTree, page_ids) -> WikiTree:
+        """
+        page_ids에 해당하는 페이지와 그 하위 트리만 다시 가져옵니다. (웹훅 등으로 변경을 알고 있을 때)
+        트리에 없는 id는 무시하고, 삭제된 페이지는 트리에서 제거하며, 다른 상위 페이지로 옮겨진 페이지는
+        새 위치로 옮깁니다.
+        """
+        page_ids = [page_id for page_id in dict.fromkeys(page_ids) if page_id in tree]
+        roots = [page_id for page_id in page_ids
+                 if not any(ancestor in page_ids for ancestor in self._ancestors(tree, tree.get(page_id)))]
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            pages = list(executor.map(self._fetch_page, roots))
+        fetched = []
+        for page_id, page in zip(roots, pages):
+            if page is None:
+                tree._remove(page_id)
+            else:
+                tree._remove_subtree(page_id)
+                fetched.append((page_id, page))
+        alive = []
+        for page_id, page in fetched:
+            node = tree.get(page_id)
+            if node is None:
+                continue
+            parent_id = page.get("parentPageId", node.parent_id)
+            if parent_id != node.parent_id:
+                if parent_id is not None and parent_id not in tree:
+                    # 트리에 없는 페이지 아래로 옮겨졌으면 그 상위 페이지를 새로 고칠 때 다시 추가됩니다.
+                    tree._remove(page_id)
+                    continue
+                tree._move(node, parent_id)
+            tree._rename(node, page.get("subject", node.subject))
+            node.version = page.get("version", node.version)
+            if self.bodies:
+                node.body = page.get("body")
+            alive.append(page_id)
+        # 다시 가져올 다른 페이지 아래로 옮겨진 페이지는 그 페이지를 펼칠 때 함께 가져옵니다.
+        alive = [page_id for page_id in alive
+                 if not any(ancestor in alive for ancestor in self._ancestors(tree, tree.get(page_id)))]
+        if alive:
+            self._expand(tree, alive, refetch=True)
+        return tree
+
+    def _fetch_page(self, page_id: str):
+        try:
+            return self.client.get_wiki_page(self.wiki_id, page_id).get("result") or {}
+        except requests.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                return None
+            raise
+
+    @staticmethod
+    def _ancestors(tree: WikiTree, node: WikiNode):
+        while node is not None and node.parent_id is not None:
+            yield node.parent_id
+            node = tree.get(node.parent_id)
+
+    def _list_children(self, parent_id: str) -> list:
+        return self.client.get_wiki_pages(self.wiki_id, parent_id).get("result") or []
+
+    def _load_details(self, node: WikiNode):
+        if self.bodies:
+            page = self.client.get_wiki_page(self.wiki_id, node.id).get("result") or {}
+            node.body = page.get("body")
+            node.version = page.get("version", node.version)
+        if self.comments:
+            self._load_comments(node)
+
+    def _load_comments(self, node: WikiNode):
+        node.comments = list(self.client.iter_wiki_comments(self.wiki_id, node.id, max_workers=1))
+
+    def _expand(self, tree: WikiTree, parent_ids: list, refetch: bool = False):
+        """
+        parent_ids의 자식 목록을 너비 우선으로 동시에 조회해 트리에 추가합니다.
+        """
+        details = []
+        with ThreadPoolExecutor(max_workers=max(1, self.max_workers)) as executor:
+            if refetch and self.comments:
+                details.extend(executor.submit(self._load_comments, tree.get(page_id)) for page_id in parent_ids)
+            running = deque((executor.submit(self._list_children, parent_id), parent_id) for parent_id in parent_ids)
+            while running:
+                future, parent_id = running.popleft()
+                parent = tree.get(parent_id)
+                for page in future.result():
+                    path = f"{parent.path}/{page['subject']}" if parent is not None else page["subject"]
+                    node = WikiNode(page["id"], parent_id, page["subject"], path, page.get("version"))
+                    tree._add(node)
+                    running.append((executor.submit(self._list_children, node.id), node.id))
+                    if self.bodies or self.comments:
+                        details.append(executor.submit(self._load_details, node))
+            for future in wait(details).done:
+                future.result()
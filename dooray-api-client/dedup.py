@@ -0,0 +1,342 @@
+import json
+import os
+import threading
+import time
+
+import requests
+
+from .singleflight import SingleFlight
+from .transfer import TransferResult, hash_file
+
+STORE_NAME = ".dooray-uploads.json"
+
+
+def _hit_result(file_id: str, started: float, mode: str) -> TransferResult:
+    response = {"header": {"isSuccessful": True, "resultCode": 0, "resultMessage": ""}, "result": {"id": file_id}}
+    result = TransferResult(response, 0, time.monotonic() - started)
+    result.deduplicated = mode
+    return result
+
+
+class UploadStore:
+    """
+    내용 해시 → Dooray 파일 id 저장소.
+
+    scopes는 {"drive:{drive_id}:{parent_id}" 또는 "wiki:{wiki_id}...": {해시: {"id", "size"[, "name"]}}},
+    files는 다시 해시하지 않기 위한 {절대 경로: [크기, mtime_ns, 해시]}입니다.
+
+    journal이 True이면 put/remove와 새로 계산한 파일 해시를 {path}.log에 한 줄씩 덧붙여 바로 기록하고, 기록이 compact_after줄을
+    넘으면 전체를 path에 다시 쓴 뒤 로그를 비웁니다. 불러올 때는 path를 읽고 로그를 이어서 적용합니다.
+    """
+    version = 2
+
+    def __init__(self, path: str, journal: bool = False, compact_after: int = 1000):
+        self.path = path
+        self.log_path = path + ".log"
+        self.journal = journal
+        self.compact_after = compact_after
+        self.scopes = {}
+        self.files = {}
+        self._lock = threading.Lock()
+        self._log = None
+        self._logged = 0
+        self._load()
+
+    def _load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        if data.get("version") == self.version:
+            self.scopes = data.get("scopes", {})
+            self.files = data.get("files", {})
+        try:
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # 기록 중에 끊긴 마지막 줄은 무시합니다.
+                        continue
+                    self._apply(record)
+                    self._logged += 1
+        except OSError:
+            pass
+
+    def _apply(self, record: dict):
+        if record.get("op") == "put":
+            self.scopes.setdefault(record["scope"], {})[record["digest"]] = record["entry"]
+        elif record.get("op") == "remove":
+            self.scopes.get(record["scope"], {}).pop(record["digest"], None)
+        elif record.get("op") == "hash":
+            self.files[record["path"]] = record["entry"]
+
+    def _append(self, record: dict):
+        # self._lock을 잡은 상태에서 호출합니다.
+        if self._log is None:
+            self._log = open(self.log_path, "a", encoding="utf-8")
+        self._log.write(json.dumps(record, ensure_ascii=False, sort_keys=True) + "\n")
+        self._log.flush()
+        self._logged += 1
+
+    def _write(self):
+        # self._lock을 잡은 상태에서 호출합니다.
+        data = {"version": self.version, "scopes": self.scopes, "files": self.files}
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, sort_keys=True)
+        os.replace(temp_path, self.path)
+        if self._log is not None:
+            self._log.close()
+            self._log = None
+        if os.path.exists(self.log_path):
+            os.remove(self.log_path)
+        self._logged = 0
+
+    def save(self):
+        """
+        전체 저장소를 path에 쓰고 로그를 비웁니다.
+        """
+        with self._lock:
+            self._write()
+
+    def close(self):
+        """
+        저장소를 저장하고 로그 파일을 닫습니다. journal이면 로그에 기록이 있을 때만 다시 씁니다.
+        """
+        with self._lock:
+            if not self.journal or self._logged:
+                self._write()
+            elif self._log is not None:
+                self._log.close()
+                self._log = None
+
+    def get(self, scope: str, digest: str):
+        return self.scopes.get(scope, {}).get(digest)
+
+    def find(self, prefix: str, digest: str):
+        """
+        prefix로 시작하는 모든 범위에서 digest를 찾아 (범위, 항목)을 반환합니다.
+        """
+        with self._lock:
+            for scope, entries in self.scopes.items():
+                if scope.startswith(prefix) and digest in entries:
+                    return scope, entries[digest]
+        return None, None
+
+    def put(self, scope: str, digest: str, entry: dict):
+        self._update({"op": "put", "scope": scope, "digest": digest, "entry": entry})
+
+    def remove(self, scope: str, digest: str):
+        self._update({"op": "remove", "scope": scope, "digest": digest})
+
+    def _update(self, record: dict):
+        with self._lock:
+            self._apply(record)
+            if not self.journal:
+                return
+            if self._logged >= self.compact_after:
+                self._write()
+            else:
+                self._append(record)
+
+    def hash(self, path: str) -> str:
+        """
+        파일 해시를 스트리밍으로 계산합니다. 크기와 수정 시각이 같으면 저장된 해시를 사용합니다.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        cached = self.files.get(path)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+        digest = hash_file(path)
+        self._update({"op": "hash", "path": path, "entry": [stat.st_size, stat.st_mtime_ns, digest]})
+        return digest
+
+
+class UploadDeduplicator:
+    """
+    같은 내용의 파일을 다시 업로드하지 않도록 하는 업로드 래퍼.
+
+        dedup = UploadDeduplicator(client, "uploads.json")
+        result = dedup.upload_file(drive_id, parent_id, "template.docx")
+        result["result"]["id"], result.deduplicated  # None(업로드), "reused", "copied"
+
+    파일 내용의 SHA-256 해시별로 업로드하거나 복사한 파일 id를 드라이브 폴더/위키 범위마다 기록합니다.
+    드라이브에 같은 내용의 파일이 있으면 get_file_meta로 아직 존재하고 크기가 같은지 확인한 뒤,
+    같은 폴더에 같은 이름으로 올린 파일이면 그 id를 그대로 쓰고, 그 밖에는 copy_file로 서버에서 복사한 뒤
+    update_file_name으로 올리려던 파일 이름으로 바꿉니다. 복사본도 대상 폴더에 기록하므로 같은 폴더로
+    다시 올리면 복사하지 않고 재사용합니다.
+    위키 파일은 확인할 API가 없으므로 기록된 id를 그대로 사용합니다.
+
+    :param copy: False이면 복사하지 않습니다. 같은 폴더, 같은 이름의 기록이 없으면 그대로 업로드합니다.
+    :param verify: False이면 get_file_meta 확인을 생략합니다.
+    :param autosave: True이면 새로 기록할 때마다 저장소 로그({store_path}.log)에 한 줄씩 덧붙입니다.
+        전체 파일은 로그가 길어지거나 close()할 때 다시 씁니다.
+    """
+    def __init__(self, client, store_path: str = STORE_NAME, copy: bool = True, verify: bool = True,
+                 autosave: bool = True):
+        self.client = client
+        self.store = UploadStore(store_path, journal=autosave)
+        self.copy = copy
+        self.verify = verify
+        self.autosave = autosave
+        self._verified = set()
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self.uploaded = 0
+        self.reused = 0
+        self.copied = 0
+        self.bytes_saved = 0
+
+    def _count(self, name: str, size: int = 0):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+            if name != "uploaded":
+                self.bytes_saved += size
+
+    def close(self):
+        """
+        저장소를 저장합니다.
+        """
+        self.store.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _alive(self, drive_id: str, entry: dict) -> bool:
+        """
+        get_file_meta로 기록된 파일이 아직 있고 크기가 같은지 확인합니다.
+        """
+        if not self.verify or entry["id"] in self._verified:
+            return True
+        try:
+            meta = self.client.get_file_meta(drive_id, entry["id"]).get("result") or {}
+        except requests.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                return False
+            raise
+        if meta.get("size") is not None and int(meta["size"]) != entry["size"]:
+            return False
+        self._verified.add(entry["id"])
+        return True
+
+    def _copy(self, drive_id: str, file_id: str, destination_drive_id: str, destination_file_id: str):
+        """
+        서버에서 파일을 복사하고 새 파일 id를 반환합니다. 원본이 지워졌으면(404) None을 반환합니다.
+        """
+        try:
+            copied = self.client.copy_file(drive_id, file_id, destination_drive_id, destination_file_id)
+        except requests.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                return None
+            raise
+        return (copied.get("result") or {}).get("id")
+
+    def _copy_stored(self, drive_id: str, parent_id: str, digest: str, name: str):
+        """
+        저장소에 기록된 같은 내용의 파일을 parent_id 폴더로 복사하고 이름을 name으로 바꾼 뒤 새 파일 id를 반환합니다.
+        사라진 기록은 지우고 다음 후보를 찾으며, 복사할 파일이 없으면 None을 반환합니다.
+        """
+        while True:
+            # 같은 드라이브를 먼저 찾고, 없으면 다른 드라이브도 찾습니다.
+            source_scope, entry = self.store.find(f"drive:{drive_id}:", digest)
+            if entry is None:
+                source_scope, entry = self.store.find("drive:", digest)
+            if entry is None:
+                return None
+            source_drive_id = source_scope.split(":")[1]
+            file_id = self._copy(source_drive_id, entry["id"], drive_id, parent_id) \
+                if self._alive(source_drive_id, entry) else None
+            if file_id:
+                # copy_file은 원본 이름을 유지하므로 일반 업로드와 같은 이름으로 바꿉니다.
+                try:
+                    self.client.update_file_name(drive_id, file_id, name)
+                except requests.HTTPError:
+                    self.client.delete_file(drive_id, file_id)
+                    raise
+                return file_id
+            self.store.remove(source_scope, digest)
+            self._verified.discard(entry["id"])
+
+    def upload_file(self, drive_id: str, parent_id: str, file_path: str, progress=None) -> TransferResult:
+        """
+        DoorayAPIClient.upload_file과 같지만 같은 내용의 파일이 있으면 업로드하지 않습니다.
+
+        결과는 일반 업로드와 같이 parent_id 폴더에 있는 file_path의 파일 이름을 가진 파일입니다.
+        """
+        started = time.monotonic()
+        digest = self.store.hash(file_path)
+        size = os.path.getsize(file_path)
+        name = os.path.basename(file_path)
+        scope = f"drive:{drive_id}:{parent_id}"
+
+        entry = self.store.get(scope, digest)
+        if entry is not None and entry.get("name") == name:
+            if self._alive(drive_id, entry):
+                self._count("reused", size)
+                return _hit_result(entry["id"], started, "reused")
+            self.store.remove(scope, digest)
+            self._verified.discard(entry["id"])
+
+        if self.copy:
+            file_id = self._copy_stored(drive_id, parent_id, digest, name)
+            if file_id:
+                self._count("copied", size)
+                self.store.put(scope, digest, {"id": file_id, "size": size, "name": name})
+                self._verified.add(file_id)
+                return _hit_result(file_id, started, "copied")
+
+        # 같은 내용을 같은 폴더에 같은 이름으로 동시에 올리는 호출은 하나로 합칩니다.
+        def upload():
+            result = self.client.upload_file(drive_id, parent_id, file_path, progress=progress)
+            self.store.put(scope, digest, {"id": result["result"]["id"], "size": size, "name": name})
+            self._verified.add(result["result"]["id"])
+            self._count("uploaded")
+            result.deduplicated = None
+            return result
+
+        return self._flight.do((scope, digest, name), upload)
+
+    def _upload_wiki(self, scope: str, file_path: str, upload) -> TransferResult:
+        started = time.monotonic()
+        digest = self.store.hash(file_path)
+        size = os.path.getsize(file_path)
+        entry = self.store.get(scope, digest)
+        if entry is not None:
+            self._count("reused", size)
+            return _hit_result(entry["id"], started, "reused")
+
+        def run():
+            result = upload()
+            self.store.put(scope, digest, {"id": result["result"]["id"], "size": size})
+            self._count("uploaded")
+            result.deduplicated = None
+            return result
+
+        return self._flight.do((scope, digest), run)
+
+    def upload_wiki_file(self, wiki_id: str, file_path: str, file_type: str = "general",
+                         progress=None) -> TransferResult:
+        """
+        DoorayAPIClient.upload_wiki_file과 같지만 이 위키에 올린 적 있는 내용이면 기존 파일 id를 반환합니다.
+        """
+        return self._upload_wiki(f"wiki:{wiki_id}:{file_type}", file_path, lambda: self.client.upload_wiki_file(
+            wiki_id, file_path, file_type=file_type, progress=progress))
+
+    def upload_wiki_page_file(self, wiki_id: str, page_id: str, file_path: str, file_type: str = "general",
+                              progress=None) -> TransferResult:
+        """
+        DoorayAPIClient.upload_wiki_page_file과 같지만 이 페이지에 올린 적 있는 내용이면 기존 파일 id를 반환합니다.
+        """
+        return self._upload_wiki(f"wiki:{wiki_id}:page:{page_id}:{file_type}", file_path,
+                                 lambda: self.client.upload_wiki_page_file(wiki_id, page_id, file_path,
+                                                                           file_type=file_type, progress=progress))
+
+    def stats(self) -> dict:
+        return {"uploaded": self.uploaded, "reused": self.reused, "copied": self.copied,
+                "bytesSaved": self.bytes_saved}
@@ -0,0 +1,283 @@
+import gzip
+import json
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import requests
+
+from .walker import DriveWalker
+
+FORMAT_VERSION = 1
+# 항목이 마지막으로 바뀐 시각이 들어 있는 필드. 앞에서부터 먼저 있는 값을 사용합니다.
+CHANGED_AT_FIELDS = ("updatedAt", "lastUpdatedAt", "modifiedAt", "createdAt")
+# drives=None일 때 내보낼 드라이브 종류 (get_drives의 type)
+DRIVE_TYPES = ("private", "project")
+UNSAFE_PATTERN = re.compile(r"[/\\\0]")
+
+
+def _plain(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    raise TypeError(f"JSON으로 변환할 수 없는 값입니다: {type(value).__name__}")
+
+
+def _timestamp(value):
+    """
+    ISO 8601 문자열 또는 초 단위 숫자를 UNIX 시각으로 바꿉니다. 알 수 없으면 None을 반환합니다.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _changed_at(item: dict):
+    return next((_timestamp(item[field]) for field in CHANGED_AT_FIELDS if item.get(field)), None)
+
+
+def _safe_name(name: str) -> str:
+    """
+    서버의 이름을 경로 구성 요소 하나로 쓸 수 있게 바꿉니다. 구분자와 ".", ".."은 남기지 않습니다.
+    """
+    name = UNSAFE_PATTERN.sub("_", str(name))
+    return "_" + name if name in ("", ".", "..") else name
+
+
+def _raw_path(drive_id: str, path: str, item: dict) -> str:
+    """
+    원본 파일을 저장할 상대 경로. 이름이 같은 파일을 덮어쓰지 않도록 파일 이름에 id를 붙입니다.
+    """
+    name = item.get("name") or path.rpartition("/")[2]
+    # 이름에 "/"가 들어 있을 수 있으므로 상위 폴더 경로는 path에서 이름을 뺀 부분입니다.
+    parent = path[:-len(name)].rstrip("/") if path.endswith(name) else path.rpartition("/")[0]
+    folders = parent.split("/") if parent else []
+    stem, ext = os.path.splitext(_safe_name(name))
+    return os.path.join(_safe_name(drive_id), *map(_safe_name, folders), f"{stem}.{_safe_name(item['id'])}{ext}")
+
+
+def _ordered(executor: ThreadPoolExecutor, calls, window: int):
+    """
+    calls의 함수를 최대 window개까지 미리 실행하고 결과는 입력 순서대로 반환하는 제너레이터
+    """
+    running = deque()
+    try:
+        for call in calls:
+            running.append(executor.submit(call))
+            if len(running) >= window:
+                yield running.popleft().result()
+        while running:
+            yield running.popleft().result()
+    finally:
+        for future in running:
+            future.cancel()
+
+
+class Exporter:
+    """
+    위키(페이지, 댓글)와 드라이브(파일 메타)를 gzip으로 압축한 NDJSON 파일 하나로 내보냅니다.
+
+        exporter = Exporter(client, max_workers=16, since=Exporter.watermark("backup-1.ndjson.gz"))
+        summary = exporter.export("backup-2.ndjson.gz", drives=[drive_id], raw_dir="raw/")
+
+    각 줄은 {"type": "meta" | "wiki" | "page" | "comment" | "drive" | "file" | "end", ...} 형식이며
+    위키 → 페이지(너비 우선, 각 페이지 뒤에 그 댓글) → 드라이브 → 파일(너비 우선) 순서로 항상 같은 순서로 씁니다.
+    조회는 max_workers개까지 동시에 진행하되 window개보다 앞서 가져오지 않으므로,
+    위키나 드라이브 크기와 관계없이 메모리 사용량이 일정합니다.
+
+    since(이전 내보내기의 watermark)를 지정하면 그 뒤에 바뀐 페이지, 댓글, 파일만 씁니다.
+    목록 응답으로 바뀌지 않은 것을 알 수 있는 페이지는 본문과 댓글을 조회하지 않으므로,
+    그 페이지에 새로 달린 댓글은 페이지가 바뀔 때까지 포함되지 않습니다.
+    바뀐 시각을 알 수 없는 항목은 항상 포함합니다. 삭제된 항목은 알 수 없습니다.
+    마지막 줄("end")의 watermark는 내보내기를 시작한 시각이므로 진행 중에 바뀐 항목은 다음 내보내기에 포함됩니다.
+
+    :param comments: False이면 댓글을 내보내지 않습니다.
+    :param file_meta: True이면 파일마다 get_file_meta로 상세 메타를 가져옵니다. False이면 목록 응답을 씁니다.
+    :param window: 미리 가져올 최대 항목 수. 기본값은 max_workers * 4
+    """
+    def __init__(self, client, max_workers: int = 8, since=None, comments: bool = True, file_meta: bool = True,
+                 window: int = None, compresslevel: int = 6):
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self.since = _timestamp(since)
+        self.comments = comments
+        self.file_meta = file_meta
+        self.window = window or self.max_workers * 4
+        self.compresslevel = compresslevel
+        self.counts = {}
+        self._output = None
+
+    @staticmethod
+    def watermark(path: str):
+        """
+        이전 내보내기 파일의 watermark를 읽습니다. 파일이 없거나 끝까지 쓰이지 않았으면 None을 반환합니다.
+        """
+        watermark = None
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith('{"type": "end"'):
+                        watermark = json.loads(line).get("watermark")
+        except (OSError, EOFError, ValueError):
+            return None
+        return watermark
+
+    def _changed(self, item: dict) -> bool:
+        if self.since is None:
+            return True
+        changed_at = _changed_at(item)
+        return changed_at is None or changed_at > self.since
+
+    def _write(self, record_type: str, **fields):
+        self._output.write(json.dumps(dict(type=record_type, **fields), ensure_ascii=False, default=_plain) + "\n")
+        self.counts[record_type] = self.counts.get(record_type, 0) + 1
+
+    def export(self, path: str, wikis=None, drives=None, raw_dir: str = None) -> dict:
+        """
+        path에 내보내고 {"path", "watermark", "counts", "elapsed"}를 반환합니다.
+        파일은 임시 파일에 쓴 뒤 끝까지 쓰였을 때만 path로 옮깁니다.
+
+        :param wikis: 내보낼 위키 id 목록. None이면 iter_wikis의 모든 위키, []이면 위키를 내보내지 않습니다.
+        :param drives: 내보낼 드라이브 id 목록. None이면 get_drives로 조회한 모든 개인/프로젝트 드라이브(DRIVE_TYPES),
+            []이면 드라이브를 내보내지 않습니다.
+        :param raw_dir: 지정하면 내보낸 파일의 원본도 {raw_dir}/{드라이브 id}/{경로}에 동시에 내려받습니다.
+            경로의 각 이름에서 경로 구분자와 ".", ".."을 바꾸고, 파일 이름에는 "이름.{파일 id}.확장자"처럼 id를 붙입니다.
+        """
+        started, watermark = time.monotonic(), datetime.now(timezone.utc).isoformat()
+        self.counts = {}
+        temp_path = path + ".tmp"
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor, \
+                    ThreadPoolExecutor(max_workers=self.max_workers) as downloader, \
+                    gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=self.compresslevel) as output:
+                self._output = output
+                try:
+                    self._write("meta", version=FORMAT_VERSION, startedAt=watermark,
+                                since=datetime.fromtimestamp(self.since, timezone.utc).isoformat()
+                                if self.since is not None else None)
+                    if wikis is None:
+                        wikis = list(self.client.iter_wikis(max_workers=self.max_workers))
+                    for wiki in wikis:
+                        self._export_wiki(executor, wiki)
+                    if drives is None:
+                        drives = self._all_drives()
+                    downloads = deque()
+                    for drive in drives:
+                        self._export_drive(executor, downloader, drive, raw_dir, downloads)
+                    while downloads:
+                        downloads.popleft().result()
+                    self._write("end", watermark=watermark, counts=dict(self.counts))
+                finally:
+                    self._output = None
+            os.replace(temp_path, path)
+        except BaseException:
+            # 끝까지 쓰이지 않은 임시 파일은 남기지 않습니다.
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        return {"path": path, "watermark": watermark, "counts": self.counts, "elapsed": time.monotonic() - started}
+
+    def _all_drives(self) -> list:
+        """
+        DRIVE_TYPES의 드라이브를 모두 조회합니다. 여러 종류로 조회된 드라이브는 한 번만 포함합니다.
+        """
+        drives = {}
+        for drive_type in DRIVE_TYPES:
+            for drive in self.client.get_drives(type=drive_type).get("result") or []:
+                drives.setdefault(drive["id"], drive)
+        return list(drives.values())
+
+    def _export_wiki(self, executor: ThreadPoolExecutor, wiki):
+        wiki_id = wiki if isinstance(wiki, str) else wiki["id"]
+        self._write("wiki", wikiId=wiki_id, data=None if isinstance(wiki, str) else wiki)
+        # 목록 응답으로 바뀌지 않은 것을 알 수 있는 페이지는 본문과 댓글을 조회하지 않습니다.
+        pages = ((path, page) for path, page in self._walk_pages(executor, wiki_id) if self._changed(page))
+        for path, page, comments in _ordered(executor, (lambda path=path, page=page: self._fetch_page(
+                wiki_id, path, page) for path, page in pages), self.window):
+            if page is None:
+                continue
+            if self._changed(page):
+                self._write("page", wikiId=wiki_id, pageId=page["id"], path=path, data=page)
+            for comment in comments:
+                if self._changed(comment):
+                    self._write("comment", wikiId=wiki_id, pageId=page["id"], commentId=comment.get("id"),
+                                data=comment)
+
+    def _walk_pages(self, executor: ThreadPoolExecutor, wiki_id: str):
+        """
+        (경로, 페이지 요약)을 너비 우선 순서로 반환합니다. 하위 페이지 목록은 max_workers개까지 동시에 조회합니다.
+        """
+        waiting = deque([(None, "")])
+        running = deque()
+        while waiting or running:
+            while waiting and len(running) < self.max_workers:
+                parent_id, parent_path = waiting.popleft()
+                running.append((executor.submit(self._list_pages, wiki_id, parent_id), parent_path))
+            future, parent_path = running.popleft()
+            for page in future.result():
+                path = f"{parent_path}/{page['subject']}" if parent_path else page["subject"]
+                waiting.append((page["id"], path))
+                yield path, page
+
+    def _list_pages(self, wiki_id: str, parent_id: str) -> list:
+        return self.client.get_wiki_pages(wiki_id, parent_id).get("result") or []
+
+    def _fetch_page(self, wiki_id: str, path: str, summary: dict):
+        """
+        페이지 본문과 댓글을 가져옵니다. 그 사이 삭제된 페이지는 (경로, None, [])입니다.
+        """
+        try:
+            page = self.client.get_wiki_page(wiki_id, summary["id"]).get("result") or summary
+            comments = list(self.client.iter_wiki_comments(wiki_id, summary["id"], max_workers=1)) \
+                if self.comments else []
+        except requests.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                return path, None, []
+            raise
+        return path, page, comments
+
+    def _export_drive(self, executor: ThreadPoolExecutor, downloader: ThreadPoolExecutor, drive, raw_dir: str,
+                      downloads: deque):
+        if isinstance(drive, str):
+            drive = self.client.get_drive(drive).get("result") or {"id": drive}
+        drive_id = drive["id"]
+        self._write("drive", driveId=drive_id, data=drive)
+        # 목록 응답의 lastUpdatedAt으로 바뀌지 않은 파일은 메타를 조회하지 않습니다.
+        records = ((path, item) for path, item in DriveWalker(self.client, drive_id,
+                                                              max_workers=self.max_workers).walk()
+                   if self._changed(item))
+        for path, item in _ordered(executor, (lambda path=path, item=item: self._fetch_file(drive_id, path, item)
+                                              for path, item in records), self.window):
+            if item is None:
+                continue
+            raw = None
+            if raw_dir is not None and item.get("type") != "folder":
+                raw = _raw_path(drive_id, path, item)
+                downloads.append(downloader.submit(self._download, drive_id, item["id"], os.path.join(raw_dir, raw)))
+                while len(downloads) > self.window or (downloads and downloads[0].done()):
+                    downloads.popleft().result()
+            self._write("file", driveId=drive_id, fileId=item["id"], path=path, data=item, raw=raw)
+
+    def _fetch_file(self, drive_id: str, path: str, item: dict):
+        if not self.file_meta or item.get("type") == "folder":
+            return path, item
+        try:
+            return path, self.client.get_file_meta(drive_id, item["id"]).get("result") or item
+        except requests.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                return path, None
+            raise
+
+    def _download(self, drive_id: str, file_id: str, save_path: str):
+        os.makedirs(os.path.dirname(save_path), exist_ok=True)
+        self.client.download_file(drive_id, file_id, save_path)
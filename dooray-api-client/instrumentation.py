@@ -0,0 +1,276 @@
+import bisect
+import json
+import logging
+import threading
+import time
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+# 엔드포인트 템플릿에 그대로 남길 경로 구간. 나머지 구간은 id로 보고 {id}로 바꿉니다.
+STATIC_SEGMENTS = frozenset((
+    "common", "drive", "wiki", "project", "v1",
+    "members", "drives", "files", "copy", "move", "shared-links", "create-folder",
+    "wikis", "pages", "comments", "content", "referrers", "title",
+    "projects", "is-creatable", "email-addresses", "hooks", "milestones", "tags", "workflows", "delete",
+))
+# 지연 시간 히스토그램의 버킷 경계(초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(path: str) -> str:
+    """
+    요청 경로의 id 구간을 {id}로 바꿉니다. (/wiki/v1/wikis/123/pages -> /wiki/v1/wikis/{id}/pages)
+    """
+    segments = path.strip("/").split("/")
+    return "/" + "/".join(segment if segment in STATIC_SEGMENTS else "{id}" for segment in segments)
+
+
+class RequestEvent:
+    """
+    요청 시도 하나에 대한 정보. 재시도는 attempt가 1 이상인 별도의 이벤트로 기록됩니다.
+    """
+    __slots__ = ("method", "url", "template", "attempt", "started", "elapsed", "status", "error",
+                 "bytes_sent", "bytes_received")
+
+    def __init__(self, method: str, url: str, template: str, attempt: int):
+        self.method = method
+        self.url = url
+        self.template = template
+        self.attempt = attempt
+        self.started = time.monotonic()
+        self.elapsed = None
+        self.status = None
+        self.error = None
+        self.bytes_sent = 0
+        self.bytes_received = 0
+
+    def as_dict(self) -> dict:
+        return {
+            "method": self.method,
+            "endpoint": self.template,
+            "url": self.url,
+            "attempt": self.attempt,
+            "status": self.status,
+            "elapsed": round(self.elapsed, 6) if self.elapsed is not None else None,
+            "error": repr(self.error) if self.error is not None else None,
+            "bytesSent": self.bytes_sent,
+            "bytesReceived": self.bytes_received,
+        }
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self, size: int):
+        self.counts = [0] * size
+        self.count = 0
+        self.sum = 0.0
+
+
+class MetricsCollector:
+    """
+    (method, 엔드포인트 템플릿)별 지연 시간 히스토그램, 상태 코드, 307 리디렉션, 재시도,
+    전송 바이트 수를 집계합니다.
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._latency = {}
+        self._statuses = {}
+        self._redirects = {}
+        self._retries = {}
+        self._errors = {}
+        self._bytes_sent = {}
+        self._bytes_received = {}
+        self._lock = threading.Lock()
+
+    def observe(self, event: RequestEvent):
+        key = (event.method, event.template)
+        with self._lock:
+            if event.elapsed is not None:
+                histogram = self._latency.get(key)
+                if histogram is None:
+                    histogram = self._latency[key] = _Histogram(len(self.buckets))
+                index = bisect.bisect_left(self.buckets, event.elapsed)
+                if index < len(self.buckets):
+                    histogram.counts[index] += 1
+                histogram.count += 1
+                histogram.sum += event.elapsed
+            if event.status is not None:
+                status_key = key + (event.status,)
+                self._statuses[status_key] = self._statuses.get(status_key, 0) + 1
+                if event.status == 307:
+                    self._redirects[key] = self._redirects.get(key, 0) + 1
+            if event.error is not None:
+                self._errors[key] = self._errors.get(key, 0) + 1
+            if event.attempt:
+                self._retries[key] = self._retries.get(key, 0) + 1
+            self._add_bytes(key, event.bytes_sent, event.bytes_received)
+
+    def add_bytes(self, method: str, template: str, sent: int = 0, received: int = 0):
+        with self._lock:
+            self._add_bytes((method, template), sent, received)
+
+    def _add_bytes(self, key, sent: int, received: int):
+        if sent:
+            self._bytes_sent[key] = self._bytes_sent.get(key, 0) + sent
+        if received:
+            self._bytes_received[key] = self._bytes_received.get(key, 0) + received
+
+    def reset(self):
+        with self._lock:
+            for table in (self._latency, self._statuses, self._redirects, self._retries, self._errors,
+                          self._bytes_sent, self._bytes_received):
+                table.clear()
+
+    def snapshot(self) -> dict:
+        """
+        {"METHOD 템플릿": 집계} 형태의 dict를 반환합니다.
+        """
+        with self._lock:
+            keys = (set(self._latency) | set(self._redirects) | set(self._retries) | set(self._errors)
+                    | set(self._bytes_sent) | set(self._bytes_received)
+                    | {status_key[:2] for status_key in self._statuses})
+            result = {}
+            for key in sorted(keys):
+                histogram = self._latency.get(key)
+                entry = {
+                    "requests": histogram.count if histogram else 0,
+                    "latencySum": round(histogram.sum, 6) if histogram else 0.0,
+                    "statuses": {status: count for (method, template, status), count in sorted(self._statuses.items())
+                                 if (method, template) == key},
+                    "redirects": self._redirects.get(key, 0),
+                    "retries": self._retries.get(key, 0),
+                    "errors": self._errors.get(key, 0),
+                    "bytesSent": self._bytes_sent.get(key, 0),
+                    "bytesReceived": self._bytes_received.get(key, 0),
+                }
+                if histogram:
+                    entry["latencyBuckets"] = dict(zip(self.buckets, _cumulative(histogram.counts)))
+                result[f"{key[0]} {key[1]}"] = entry
+            return result
+
+    def to_prometheus(self, prefix: str = "dooray_client") -> str:
+        """
+        Prometheus 텍스트 형식(exposition format)으로 내보냅니다.
+        """
+        lines = []
+        with self._lock:
+            lines.append(f"# HELP {prefix}_request_duration_seconds Dooray API 요청 지연 시간")
+            lines.append(f"# TYPE {prefix}_request_duration_seconds histogram")
+            for (method, template), histogram in sorted(self._latency.items()):
+                labels = _labels(method=method, endpoint=template)
+                for bound, count in zip(self.buckets, _cumulative(histogram.counts)):
+                    lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {histogram.sum:.6f}")
+                lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {histogram.count}")
+            lines.append(f"# TYPE {prefix}_responses_total counter")
+            for (method, template, status), count in sorted(self._statuses.items()):
+                lines.append(f"{prefix}_responses_total{{{_labels(method=method, endpoint=template, status=status)}}} "
+                             f"{count}")
+            for name, table in (("redirects_total", self._redirects), ("retries_total", self._retries),
+                                ("errors_total", self._errors), ("bytes_sent_total", self._bytes_sent),
+                                ("bytes_received_total", self._bytes_received)):
+                lines.append(f"# TYPE {prefix}_{name} counter")
+                for (method, template), count in sorted(table.items()):
+                    lines.append(f"{prefix}_{name}{{{_labels(method=method, endpoint=template)}}} {count}")
+        return "\n".join(lines) + "\n"
+
+
+def _cumulative(counts):
+    total = 0
+    for count in counts:
+        total += count
+        yield total
+
+
+def _labels(**labels) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class LogExporter:
+    """
+    응답 이벤트마다 JSON 한 줄을 로그로 남기는 훅.
+
+        instrumentation.on_response(LogExporter(logging.getLogger("dooray")))
+    """
+    def __init__(self, logger: logging.Logger = None, level: int = logging.INFO, slow: float = None):
+        """
+        :param slow: 지정하면 이 시간(초) 이상 걸렸거나 실패한 요청만 기록합니다.
+        """
+        self.logger = logger or logging.getLogger("doorayapi")
+        self.level = level
+        self.slow = slow
+
+    def __call__(self, event: RequestEvent):
+        if self.slow is not None and event.error is None and (event.status or 0) < 400 \
+                and (event.elapsed or 0) < self.slow:
+            return
+        if self.logger.isEnabledFor(self.level):
+            self.logger.log(self.level, json.dumps(event.as_dict(), ensure_ascii=False))
+
+
+class Instrumentation:
+    """
+    요청/응답 훅과 지표 수집기.
+
+        instrumentation = Instrumentation()
+        instrumentation.on_response(LogExporter(slow=1.0))
+        client = DoorayAPIClient(token, instrumentation=instrumentation)
+        ...
+        print(instrumentation.metrics.to_prometheus())
+
+    _send를 거치는 모든 요청 시도(재시도, 307 리디렉션 확인 포함)가 기록됩니다.
+    클라이언트의 instrumentation이 None이면 아무것도 호출하지 않습니다.
+
+    :param metrics: 사용할 MetricsCollector. True이면 새로 만들고 False이면 수집하지 않습니다.
+    :param template: 요청 경로를 엔드포인트 템플릿으로 바꾸는 함수
+    """
+    def __init__(self, metrics=True, template=endpoint_template):
+        self.metrics = MetricsCollector() if metrics is True else (metrics or None)
+        self.template = template
+        self.request_hooks = []
+        self.response_hooks = []
+
+    def on_request(self, hook):
+        """
+        요청 전에 hook(event)를 호출합니다. 데코레이터로도 사용할 수 있습니다.
+        """
+        self.request_hooks.append(hook)
+        return hook
+
+    def on_response(self, hook):
+        """
+        응답(또는 예외) 후에 hook(event)를 호출합니다. 데코레이터로도 사용할 수 있습니다.
+        """
+        self.response_hooks.append(hook)
+        return hook
+
+    def start(self, method: str, url: str, attempt: int = 0, bytes_sent: int = 0) -> RequestEvent:
+        event = RequestEvent(method, url, self.template(urlsplit(url).path), attempt)
+        event.bytes_sent = bytes_sent
+        for hook in self.request_hooks:
+            hook(event)
+        return event
+
+    def finish(self, event: RequestEvent, status: int = None, error: Exception = None, bytes_received: int = 0):
+        event.elapsed = time.monotonic() - event.started
+        event.status = status
+        event.error = error
+        event.bytes_received = bytes_received
+        if self.metrics is not None:
+            self.metrics.observe(event)
+        for hook in self.response_hooks:
+            hook(event)
+
+    def add_bytes(self, method: str, url: str, sent: int = 0, received: int = 0):
+        """
+        스트리밍 전송처럼 응답 이후에 확정되는 바이트 수를 기록합니다.
+        """
+        if self.metrics is not None:
+            self.metrics.add_bytes(method, self.template(urlsplit(url).path), sent, received)
@@ -0,0 +1,219 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# 색인 종류와 멤버 필드
+KEYS = {
+    "email": "externalEmailAddress",
+    "userCode": "userCode",
+    "idProviderUserId": "idProviderUserId",
+}
+
+
+def _normalize(kind: str, value: str) -> str:
+    value = value.strip()
+    return value.lower() if kind == "email" else value
+
+
+def _plain(member) -> dict:
+    return member.to_dict() if hasattr(member, "to_dict") else dict(member)
+
+
+class MemberDirectory:
+    """
+    이메일, userCode, idProviderUserId로 멤버를 찾는 로컬 색인.
+
+        directory = MemberDirectory(client, ttl=3600)
+        members = directory.resolve_emails(["a@example.com", "b@example.com", ...])
+        client.create_wiki_page(wiki_id, parent_id, subject, content,
+                                referrers=MemberDirectory.referrers(members.values()))
+
+    색인에 없거나 만료된 값만 조회합니다. 이메일은 batch_size개씩 쉼표로 이어 get_members 한 번으로
+    조회하고, userCode/idProviderUserId는 값마다 한 번씩 조회합니다. 조회는 max_workers개까지 동시에
+    진행되며, 다른 스레드가 이미 조회 중인 값은 그 결과를 기다립니다.
+    찾지 못한 값도 negative_ttl 동안 기억해 다시 조회하지 않습니다.
+
+    :param ttl: 색인 항목의 유효 시간(초)
+    :param negative_ttl: 찾지 못한 값을 기억할 시간(초)
+    :param batch_size: get_members 한 번에 넣을 이메일 수
+    """
+    def __init__(self, client, ttl: float = 3600, negative_ttl: float = 300, batch_size: int = 50,
+                 max_workers: int = 4):
+        self.client = client
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self._index = {kind: {} for kind in KEYS}
+        self._pending = {kind: {} for kind in KEYS}
+        self._lock = threading.Lock()
+        self.requests = 0
+
+    def __len__(self):
+        return sum(1 for member, _ in self._index["email"].values() if member is not None)
+
+    def _store(self, member, expires_at: float):
+        for kind, field in KEYS.items():
+            value = member.get(field)
+            if value:
+                self._index[kind][_normalize(kind, value)] = (member, expires_at)
+
+    def add(self, members, ttl: float = None):
+        """
+        멤버 목록을 색인에 추가합니다.
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            for member in members:
+                self._store(member, expires_at)
+
+    def get(self, kind: str, value: str):
+        """
+        조회 없이 색인에서만 찾습니다. 없거나 만료되었으면 None을 반환합니다.
+        """
+        entry = self._index[kind].get(_normalize(kind, value))
+        if entry is None or entry[1] <= time.monotonic():
+            return None
+        return entry[0]
+
+    def resolve_emails(self, emails) -> dict:
+        return self.resolve("email", emails)
+
+    def resolve_user_codes(self, user_codes) -> dict:
+        return self.resolve("userCode", user_codes)
+
+    def resolve_id_provider_user_ids(self, user_ids) -> dict:
+        return self.resolve("idProviderUserId", user_ids)
+
+    def resolve(self, kind: str, values) -> dict:
+        """
+        {값: 멤버 또는 None}을 반환합니다. 키는 입력 값 그대로이며 중복은 한 번만 조회합니다.
+
+        :param kind: "email", "userCode", "idProviderUserId" 중 하나
+        """
+        if kind not in KEYS:
+            raise ValueError(f"지원하지 않는 색인입니다: {kind}")
+        keys = {value: _normalize(kind, value) for value in values}
+        found, waiting, missing = {}, {}, {}
+        now = time.monotonic()
+        with self._lock:
+            index, pending = self._index[kind], self._pending[kind]
+            for key in dict.fromkeys(keys.values()):
+                entry = index.get(key)
+                if entry is not None and entry[1] > now:
+                    found[key] = entry[0]
+                elif key in pending:
+                    waiting[key] = pending[key]
+                else:
+                    missing[key] = pending[key] = Future()
+
+        if missing:
+            self._fetch(kind, list(missing))
+        for key, future in list(missing.items()) + list(waiting.items()):
+            found[key] = future.result()
+        return {value: found[key] for value, key in keys.items()}
+
+    def _fetch(self, kind: str, keys: list):
+        """
+        keys를 조회해 색인에 저장하고, 조회 중 표시(_pending)의 Future에 결과를 전달합니다.
+        """
+        if kind == "email":
+            batches = [keys[i:i + self.batch_size] for i in range(0, len(keys), self.batch_size)]
+        else:
+            batches = [[key] for key in keys]
+        try:
+            if len(batches) > 1 and self.max_workers > 1:
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(batches))) as executor:
+                    results = list(executor.map(lambda batch: self._query(kind, batch), batches))
+            else:
+                results = [self._query(kind, batch) for batch in batches]
+        except Exception as error:
+            with self._lock:
+                for key in keys:
+                    self._pending[kind].pop(key).set_exception(error)
+            raise
+
+        now = time.monotonic()
+        with self._lock:
+            index, pending = self._index[kind], self._pending[kind]
+            for members in results:
+                for member in members:
+                    self._store(member, now + self.ttl)
+            for key in keys:
+                entry = index.get(key)
+                member = entry[0] if entry is not None and entry[1] > now else None
+                if member is None:
+                    index[key] = (None, now + self.negative_ttl)
+                pending.pop(key).set_result(member)
+
+    def _query(self, kind: str, batch: list) -> list:
+        with self._lock:
+            self.requests += 1
+        if kind == "email":
+            members = self.client.iter_members(externalEmailAddresses=",".join(batch), size=len(batch),
+                                               max_workers=1)
+        elif kind == "userCode":
+            members = self.client.iter_members(userCodeExact=batch[0], max_workers=1)
+        else:
+            members = self.client.iter_members(idProviderUserId=batch[0], max_workers=1)
+        return list(members)
+
+    def preload(self, max_workers: int = 8, **filters) -> int:
+        """
+        iter_members로 멤버 전체(또는 filters에 해당하는 멤버)를 미리 색인하고 멤버 수를 반환합니다.
+        """
+        members = list(self.client.iter_members(max_workers=max_workers, **filters))
+        self.add(members)
+        return len(members)
+
+    def save_snapshot(self, path: str):
+        """
+        유효한 색인 항목을 JSON 파일로 저장합니다. 다음 시작 시 load_snapshot으로 불러올 수 있습니다.
+        """
+        now = time.time()
+        with self._lock:
+            monotonic = time.monotonic()
+            entries, seen = [], set()
+            for index in self._index.values():
+                for member, expires_at in index.values():
+                    if member is not None and expires_at > monotonic and id(member) not in seen:
+                        seen.add(id(member))
+                        entries.append({"member": _plain(member), "expiresAt": now + expires_at - monotonic})
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"members": entries}, f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    def load_snapshot(self, path: str) -> int:
+        """
+        save_snapshot으로 저장한 파일에서 아직 만료되지 않은 항목을 불러오고 그 수를 반환합니다.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entries = json.load(f).get("members", [])
+        except (OSError, ValueError):
+            return 0
+        now, monotonic = time.time(), time.monotonic()
+        loaded = 0
+        with self._lock:
+            for entry in entries:
+                if entry["expiresAt"] > now:
+                    self._store(entry["member"], monotonic + entry["expiresAt"] - now)
+                    loaded += 1
+        return loaded
+
+    def clear(self):
+        with self._lock:
+            for index in self._index.values():
+                index.clear()
+
+    @staticmethod
+    def referrers(members) -> list:
+        """
+        멤버 목록을 create_wiki_page/update_wiki_page_referrers의 referrers 형식으로 바꿉니다.
+        찾지 못한 멤버(None)는 건너뜁니다.
+        """
+        return [{"type": "member", "member": {"organizationMemberId": member.get("id")}}
+                for member in members if member is not None]
@@ -0,0 +1,280 @@
+import json
+import re
+import sys
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson은 선택 의존성
+    orjson = None
+
+
+def json_loads(data):
+    """
+    JSON을 디코딩합니다. orjson이 설치되어 있으면 orjson을 사용합니다.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, (bytes, bytearray)):
+        data = data.decode("utf-8")
+    return json.loads(data)
+
+
+class Record(dict):
+    """
+    모델로 정의하지 않은 중첩 객체. dict 그대로이며 속성으로도 접근할 수 있습니다.
+    """
+    __slots__ = ()
+
+    def __getattr__(self, name):
+        try:
+            return _wrap(self[name], Record)
+        except KeyError:
+            raise AttributeError(name) from None
+
+
+_MISSING = object()
+
+
+def _wrap(value, model):
+    if isinstance(value, dict) and not isinstance(value, (Model, Record)):
+        return model.from_dict(value) if issubclass(model, Model) else model(value)
+    if isinstance(value, list):
+        return [_wrap(item, model) for item in value]
+    return value
+
+
+class Model:
+    """
+    __slots__ 기반 응답 모델의 기반 클래스.
+
+    fields에 선언한 필드만 슬롯에 저장하고 나머지 필드는 _extra에 보관합니다. 응답에 없던 필드의 슬롯은
+    비워 두며 None으로 읽힙니다. nested에 선언한 중첩 필드는 원본 dict로 두었다가 처음 접근할 때
+    모델로 변환합니다. interned에 선언한 필드
+    (type, driveId처럼 값의 종류가 적은 필드)의 문자열은 sys.intern으로 항목 간에 공유합니다.
+    dict처럼 item["key"], get("key")로도 접근할 수 있습니다.
+    """
+    __slots__ = ("_extra",)
+    fields = ()
+    nested = {}
+    interned = ()
+    _setters = ()
+    _field_set = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        setters = []
+        for name in cls.__dict__.get("fields", ()):
+            slot = _slot_name(cls, name)
+            setter = cls.__dict__[slot].__set__
+            if name in cls.interned:
+                setter = _interning(setter)
+            setters.append((name, setter))
+            if name in cls.nested:
+                setattr(cls, name, _NestedField(slot, cls.nested[name]))
+        cls._setters = tuple(setters)
+        cls._field_set = frozenset(cls.fields)
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        obj = cls.__new__(cls)
+        get = data.get
+        for key, setter in cls._setters:
+            value = get(key, _MISSING)
+            if value is not _MISSING:
+                setter(obj, value)
+        field_set = cls._field_set
+        if field_set.issuperset(data):
+            obj._extra = None
+        else:
+            obj._extra = {key: value for key, value in data.items() if key not in field_set}
+        return obj
+
+    def __getattr__(self, name):
+        # 응답에 없던 필드의 슬롯은 비워 두며 None으로 읽힙니다. (to_dict에서 값이 None인 필드와 구분)
+        if name in type(self)._field_set:
+            return None
+        raise AttributeError(name)
+
+    def __getitem__(self, key):
+        if key in self._field_set:
+            return getattr(self, key)
+        if self._extra is not None and key in self._extra:
+            return _wrap(self._extra[key], Record)
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        try:
+            value = self[key]
+        except KeyError:
+            return default
+        return default if value is None and key in self._field_set else value
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def to_dict(self) -> dict:
+        """
+        원본과 같은 형태의 dict로 되돌립니다.
+        """
+        data = {}
+        for key in self.fields:
+            try:
+                value = object.__getattribute__(self, _slot_name(type(self), key))
+            except AttributeError:
+                continue
+            data[key] = _unwrap(value)
+        if self._extra:
+            data.update(self._extra)
+        return data
+
+    def __eq__(self, other):
+        return type(self) is type(other) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        key = "id" if "id" in self._field_set else self.fields[0]
+        return f"{type(self).__name__}({key}={getattr(self, key)!r})"
+
+
+def _interning(setter):
+    def set_interned(obj, value):
+        setter(obj, sys.intern(value) if type(value) is str else value)
+    return set_interned
+
+
+def _slot_name(cls, key):
+    return "_" + key if key in cls.nested else key
+
+
+def _unwrap(value):
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_unwrap(item) for item in value]
+    return value
+
+
+class _NestedField:
+    """
+    슬롯에 저장된 원본 dict를 처음 접근할 때 모델로 변환해 다시 저장하는 디스크립터
+    """
+    __slots__ = ("slot", "model")
+
+    def __init__(self, slot: str, model):
+        self.slot = slot
+        self.model = model
+
+    def __get__(self, obj, owner):
+        if obj is None:
+            return self
+        try:
+            value = object.__getattribute__(obj, self.slot)
+        except AttributeError:
+            return None
+        if isinstance(value, (dict, list)) and not isinstance(value, (Model, Record)):
+            value = _wrap(value, self.model)
+            object.__setattr__(obj, self.slot, value)
+        return value
+
+
+def model(name: str, fields: tuple, nested: dict = None, interned: tuple = ()):
+    """
+    Model 하위 클래스를 만듭니다. 중첩 필드는 "_필드명" 슬롯에 저장됩니다.
+    """
+    nested = nested or {}
+    slots = tuple("_" + field if field in nested else field for field in fields)
+    return type(name, (Model,), {"__slots__": slots, "fields": tuple(fields), "nested": nested,
+                                 "interned": tuple(interned)})
+
+
+Body = model("Body", ("mimeType", "content"), interned=("mimeType",))
+Member = model("Member", ("id", "name", "userCode", "externalEmailAddress", "idProviderUserId", "nickname"))
+Drive = model("Drive", ("id", "projectId", "type", "name"), interned=("type",))
+DriveFile = model("DriveFile", ("id", "driveId", "name", "type", "subType", "mimeType", "size", "version",
+                                "createdAt", "lastUpdatedAt", "creator", "lastUpdater"),
+                  nested={"creator": Record, "lastUpdater": Record},
+                  interned=("driveId", "type", "subType", "mimeType"))
+SharedLink = model("SharedLink", ("id", "scope", "expiredAt", "createdAt", "creator"), nested={"creator": Record},
+                   interned=("scope",))
+Wiki = model("Wiki", ("id", "project", "name", "type", "scope", "home"),
+             nested={"project": Record, "home": Record})
+WikiPage = model("WikiPage", ("id", "wikiId", "version", "parentPageId", "subject", "root", "createdAt",
+                              "creator", "body", "referrers", "files", "images"),
+                 nested={"creator": Record, "body": Body, "referrers": Record, "files": Record,
+                         "images": Record},
+                 interned=("wikiId", "parentPageId"))
+WikiComment = model("WikiComment", ("id", "pageId", "createdAt", "modifiedAt", "creator", "body"),
+                    nested={"creator": Record, "body": Body}, interned=("pageId",))
+Project = model("Project", ("id", "code", "description", "state", "scope", "type", "organization", "drive", "wiki"),
+                nested={"organization": Record, "drive": Record, "wiki": Record},
+                interned=("state", "scope", "type"))
+Workflow = model("Workflow", ("id", "name", "order", "class", "names"), nested={"names": Record})
+Tag = model("Tag", ("id", "name", "color", "tagGroup"), nested={"tagGroup": Record})
+Milestone = model("Milestone", ("id", "name", "status", "startedAt", "endedAt", "closedAt", "createdAt"),
+                  interned=("status",))
+
+# (엔드포인트 정규식, 모델) - 먼저 일치하는 규칙을 사용합니다.
+ENDPOINT_MODELS = [(re.compile(pattern), result_model) for pattern, result_model in (
+    (r"^/common/v1/members(/[^/]+)?$", Member),
+    (r"^/drive/v1/drives(/[^/]+)?$", Drive),
+    (r"^/drive/v1/drives/[^/]+/files/[^/]+/shared-links(/.*)?$", SharedLink),
+    (r"^/drive/v1/drives/[^/]+/files(/[^/]+)?$", DriveFile),
+    (r"^/wiki/v1/wikis$", Wiki),
+    (r"^/wiki/v1/wikis/[^/]+/pages/[^/]+/comments(/[^/]+)?$", WikiComment),
+    (r"^/wiki/v1/wikis/[^/]+/pages(/[^/]+)?$", WikiPage),
+    (r"^/project/v1/projects(/[^/]+)?$", Project),
+    (r"^/project/v1/projects/[^/]+/workflows(/[^/]+)?$", Workflow),
+    (r"^/project/v1/projects/[^/]+/tags(/[^/]+)?$", Tag),
+    (r"^/project/v1/projects/[^/]+/milestones(/[^/]+)?$", Milestone),
+)]
+
+
+def model_for(endpoint: str):
+    for pattern, result_model in ENDPOINT_MODELS:
+        if pattern.match(endpoint):
+            return result_model
+    return Record
+
+
+class Response:
+    """
+    typed 모드의 API 응답. header/result/totalCount를 속성으로 제공하며 dict처럼도 접근할 수 있습니다.
+    """
+    __slots__ = ("header", "result", "totalCount")
+
+    def __init__(self, header, result, totalCount=None):
+        self.header = header
+        self.result = result
+        self.totalCount = totalCount
+
+    @classmethod
+    def from_dict(cls, data: dict, result_model=Record):
+        return cls(_wrap(data.get("header"), Record), _wrap(data.get("result"), result_model),
+                   data.get("totalCount"))
+
+    def __getitem__(self, key):
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def __iter__(self):
+        # 목록 응답은 결과 항목을 바로 순회할 수 있습니다.
+        return iter(self.result if isinstance(self.result, list) else [self.result])
+
+    def __len__(self):
+        return len(self.result) if isinstance(self.result, list) else int(self.result is not None)
+
+    def __repr__(self):
+        return f"Response(result={self.result!r}, totalCount={self.totalCount!r})"
+
+
+def parse_response(endpoint: str, data: dict) -> Response:
+    """
+    디코딩된 응답을 엔드포인트에 맞는 모델로 변환합니다.
+    """
+    if not isinstance(data, dict):
+        return data
+    return Response.from_dict(data, model_for(endpoint))
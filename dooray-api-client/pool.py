@@ -0,0 +1,310 @@
+import contextvars
+import copy
+import threading
+import time
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+
+from .client import DEFAULT_TIMEOUT, DoorayAPIClient
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy, parse_retry_after
+
+# 토큰을 격리하는 응답 상태 코드
+QUARANTINE_STATUSES = (401, 429)
+
+
+class _Pin:
+    """
+    하나의 작업(307 업로드/다운로드, Range 다운로드, 목록 순회)이 첫 요청에 사용한 토큰.
+    """
+    __slots__ = ("pool", "slot")
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.slot = None
+
+
+# 현재 작업의 _Pin. Range 구간과 페이지를 받는 작업 스레드에는 contextvars.copy_context()로 전달됩니다.
+_current_pin = contextvars.ContextVar("dooray_pool_pin", default=None)
+
+
+def _replayable(kwargs: dict) -> bool:
+    """
+    요청 본문을 다른 토큰으로 다시 보낼 수 있는지 확인합니다. 파일 핸들이나 스트림은 이미 읽혔을 수 있습니다.
+    """
+    if kwargs.get("files"):
+        return False
+    body = kwargs.get("data")
+    return body is None or hasattr(body, "rewind") or isinstance(body, (bytes, str, dict, list, tuple))
+
+
+class TokenSlot:
+    """
+    풀에 속한 토큰 하나. 자신의 DoorayAPIClient(커넥션 풀, 속도 제한, 재시도)와 사용량 통계를 가집니다.
+    """
+    def __init__(self, name: str, client: DoorayAPIClient):
+        self.name = name
+        self.client = client
+        self.in_flight = 0
+        self.requests = 0
+        self.errors = 0
+        self.throttled = 0
+        self.unauthorized = 0
+        self.busy_time = 0.0
+        self.quarantined_until = 0.0
+        self.created_at = time.monotonic()
+
+    @property
+    def authorization(self) -> str:
+        return self.client.headers["Authorization"]
+
+    def available(self, now: float) -> bool:
+        return self.quarantined_until <= now
+
+    def as_dict(self, now: float) -> dict:
+        wall = max(now - self.created_at, 1e-9)
+        if self.quarantined_until == float("inf"):
+            quarantined = "disabled"
+        else:
+            quarantined = round(max(0.0, self.quarantined_until - now), 3)
+        return {
+            "inFlight": self.in_flight,
+            "requests": self.requests,
+            "errors": self.errors,
+            "throttled": self.throttled,
+            "unauthorized": self.unauthorized,
+            "busyTime": round(self.busy_time, 3),
+            # 요청을 처리하던 시간의 합 / 경과 시간. 동시 요청이 있으면 1보다 클 수 있습니다.
+            "utilization": round(self.busy_time / wall, 3),
+            "quarantined": quarantined,
+        }
+
+
+class DoorayClientPool(DoorayAPIClient):
+    """
+    여러 API 토큰에 요청을 나눠 보내는 클라이언트. DoorayAPIClient의 모든 메서드를 그대로 사용할 수 있습니다.
+
+        pool = DoorayClientPool({"bot-a": token_a, "bot-b": token_b}, rate=20)
+        pool.route(private_drive_id, "bot-b")
+        files = list(pool.iter_files(drive_id, max_workers=8))
+        pool.stats()
+
+    토큰마다 별도의 커넥션 풀과 속도 제한(rate/families), 재시도 정책을 가지며, 요청 하나하나를
+    진행 중인 요청이 가장 적은 토큰으로 보냅니다.
+    route()로 지정한 리소스 id(드라이브, 위키, 프로젝트 등)가 경로에 포함된 요청은 항상 그 토큰으로 보냅니다.
+
+    307 리디렉션 뒤의 업로드/다운로드, Range 다운로드의 구간, 목록 순회(iter_*)의 페이지는 첫 요청과
+    같은 토큰으로 보내므로 한 토큰만 볼 수 있는 비공개 드라이브도 route() 없이 처리됩니다.
+
+    401 응답을 받은 토큰은 release()할 때까지, 429 응답을 받은 토큰은 Retry-After(없으면 quarantine초)
+    동안 격리하고, 고정 경로가 아니고 본문을 다시 보낼 수 있는 요청은 다른 토큰으로 다시 보냅니다.
+    429는 같은 토큰으로 재시도하지 않고 다른 토큰으로 넘기므로 토큰별 재시도 정책에서 제외됩니다.
+
+    :param tokens: 토큰 목록 또는 {이름: 토큰}. 목록이면 "token-0", "token-1", ... 이름을 붙입니다.
+    :param rate: 토큰별 초당 요청 수 (RateLimiter의 rate)
+    :param families: 토큰별 엔드포인트 계열 제한 (RateLimiter의 families)
+    :param quarantine: Retry-After가 없는 429 응답 후 토큰을 격리할 시간(초)
+    :param auth_quarantine: 401 응답 후 토큰을 격리할 시간(초). None이면 release()할 때까지 격리합니다.
+    :param rate_limiter: 모든 토큰의 요청에 함께 적용할 RateLimiter. 토큰을 고르기 전에 요청마다 적용되며
+        토큰별 rate/families 제한과 함께 사용할 수 있습니다.
+    """
+    def __init__(self, tokens, rate: float = None, families: dict = None, quarantine: float = 30.0,
+                 auth_quarantine: float = None, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_block: bool = False, timeout=DEFAULT_TIMEOUT, retry: RetryPolicy = None,
+                 rate_limiter: RateLimiter = None, **kwargs):
+        if not isinstance(tokens, dict):
+            tokens = {f"token-{index}": token for index, token in enumerate(tokens)}
+        if not tokens:
+            raise ValueError("토큰이 하나 이상 필요합니다.")
+        super().__init__(next(iter(tokens.values())), pool_connections=pool_connections,
+                         pool_maxsize=pool_maxsize, pool_block=pool_block, timeout=timeout,
+                         rate_limiter=rate_limiter, **kwargs)
+        self.quarantine = quarantine
+        self.auth_quarantine = auth_quarantine
+
+        retry = RetryPolicy() if retry is True else (None if retry is False else retry)
+        if retry is not None:
+            retry = copy.copy(retry)
+            retry.statuses = retry.statuses - {429}
+        self.slots = {}
+        for name, token in tokens.items():
+            limiter = RateLimiter(rate, families) if rate or families else None
+            client = DoorayAPIClient(token, pool_connections=pool_connections, pool_maxsize=pool_maxsize,
+                                     pool_block=pool_block, timeout=timeout, rate_limiter=limiter, retry=retry,
+                                     instrumentation=self.instrumentation)
+            self.slots[name] = TokenSlot(name, client)
+        self._order = list(self.slots)
+        self._routes = {}
+        self._lock = threading.Lock()
+
+    def client(self, name: str) -> DoorayAPIClient:
+        """
+        토큰 하나의 DoorayAPIClient를 반환합니다. 풀의 분배와 격리를 거치지 않습니다.
+        """
+        return self.slots[name].client
+
+    def route(self, resource_id: str, name: str):
+        """
+        경로에 resource_id가 포함된 요청을 항상 name 토큰으로 보냅니다.
+        """
+        if name not in self.slots:
+            raise ValueError(f"알 수 없는 토큰입니다: {name}")
+        with self._lock:
+            self._routes[resource_id] = name
+
+    def unroute(self, resource_id: str):
+        with self._lock:
+            self._routes.pop(resource_id, None)
+
+    def release(self, name: str):
+        """
+        격리된 토큰을 다시 사용합니다.
+        """
+        with self._lock:
+            self.slots[name].quarantined_until = 0.0
+
+    def _pinned(self, path: str):
+        if self._routes:
+            for segment in path.split("/"):
+                name = self._routes.get(segment)
+                if name is not None:
+                    return self.slots[name]
+        return None
+
+    def _acquire(self, pinned: TokenSlot = None, excluded=()) -> TokenSlot:
+        """
+        요청을 보낼 토큰을 고르고 진행 중인 요청 수를 늘립니다. 모든 토큰이 격리되어 있으면 풀릴 때까지 기다립니다.
+        """
+        while True:
+            now = time.monotonic()
+            with self._lock:
+                if pinned is not None:
+                    candidates = [pinned]
+                else:
+                    candidates = [slot for slot in self.slots.values() if slot.name not in excluded] \
+                        or list(self.slots.values())
+                ready = [slot for slot in candidates if slot.available(now)]
+                if ready:
+                    # 진행 중인 요청이 가장 적은 토큰, 같으면 지금까지 요청을 덜 보낸 토큰
+                    slot = min(ready, key=lambda item: (item.in_flight, item.requests))
+                    slot.in_flight += 1
+                    slot.requests += 1
+                    return slot
+                wake_at = min(slot.quarantined_until for slot in candidates)
+            if wake_at == float("inf"):
+                names = ", ".join(slot.name for slot in candidates)
+                raise RuntimeError(f"사용할 수 있는 토큰이 없습니다. (격리됨: {names})")
+            time.sleep(wake_at - now)
+
+    def _quarantine(self, slot: TokenSlot, status: int, retry_after: str = None):
+        if status == 401:
+            duration = float("inf") if self.auth_quarantine is None else self.auth_quarantine
+        else:
+            duration = parse_retry_after(retry_after)
+            duration = self.quarantine if duration is None else duration
+        with self._lock:
+            slot.quarantined_until = max(slot.quarantined_until, time.monotonic() + duration)
+
+    @contextmanager
+    def _sticky(self):
+        """
+        블록 안의 요청을 첫 요청이 사용한 토큰으로 보냅니다. 이미 고정된 작업 안이면 그 토큰을 그대로 씁니다.
+        """
+        pin = _current_pin.get()
+        if pin is not None and pin.pool is self:
+            yield pin
+            return
+        pin = _Pin(self)
+        reset = _current_pin.set(pin)
+        try:
+            yield pin
+        finally:
+            _current_pin.reset(reset)
+
+    def _send_file_with_redirect(self, *args, **kwargs):
+        with self._sticky():
+            return super()._send_file_with_redirect(*args, **kwargs)
+
+    def _get_file_with_redirect(self, *args, **kwargs):
+        with self._sticky():
+            return super()._get_file_with_redirect(*args, **kwargs)
+
+    def _get_file_ranged(self, *args, **kwargs):
+        with self._sticky():
+            return super()._get_file_ranged(*args, **kwargs)
+
+    def _iter_pages(self, fetch, size: int, max_workers: int, **kwargs):
+        # 제너레이터가 멈춘 동안 호출자의 다른 요청까지 고정되지 않도록 페이지 요청마다 고정합니다.
+        pin = _Pin(self)
+
+        def fetch_pinned(**page_kwargs):
+            reset = _current_pin.set(pin)
+            try:
+                return fetch(**page_kwargs)
+            finally:
+                _current_pin.reset(reset)
+
+        return super()._iter_pages(fetch_pinned, size, max_workers, **kwargs)
+
+    def _send(self, method: str, url: str, **kwargs):
+        """
+        토큰을 골라 그 토큰의 클라이언트로 전송합니다. 401/429이면 토큰을 격리하고, 본문을 다시 보낼 수 있으면
+        다른 토큰으로 다시 보냅니다.
+        """
+        path = urlsplit(url).path
+        pin = _current_pin.get()
+        if pin is not None and pin.pool is not self:
+            pin = None
+        pinned = self._pinned(path) or (pin.slot if pin is not None else None)
+        replayable = _replayable(kwargs)
+        tried = set()
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(path)
+            slot = self._acquire(pinned, tried)
+            headers = dict(kwargs.get("headers") or {}, Authorization=slot.authorization)
+            started = time.monotonic()
+            try:
+                response = slot.client._send(method, url, **dict(kwargs, headers=headers))
+            except Exception:
+                with self._lock:
+                    slot.errors += 1
+                raise
+            finally:
+                with self._lock:
+                    slot.in_flight -= 1
+                    slot.busy_time += time.monotonic() - started
+            if response.status_code not in QUARANTINE_STATUSES:
+                if pin is not None and pin.slot is None:
+                    pin.slot = slot
+                return response
+
+            with self._lock:
+                slot.errors += 1
+                if response.status_code == 401:
+                    slot.unauthorized += 1
+                else:
+                    slot.throttled += 1
+            self._quarantine(slot, response.status_code, response.headers.get("Retry-After"))
+            tried.add(slot.name)
+            # 고정 경로이거나 본문을 다시 보낼 수 없거나 모든 토큰을 시도했으면 응답을 그대로 돌려줍니다.
+            if pinned is not None or not replayable or len(tried) >= len(self.slots):
+                return response
+            response.close()
+            body = kwargs.get("data")
+            if hasattr(body, "rewind"):
+                body.rewind()
+
+    def stats(self) -> dict:
+        """
+        토큰별 사용량. {이름: {"inFlight", "requests", "errors", "throttled", "unauthorized", "busyTime",
+        "utilization", "quarantined"}}
+        """
+        now = time.monotonic()
+        with self._lock:
+            return {name: slot.as_dict(now) for name, slot in self.slots.items()}
+
+    def close(self):
+        super().close()
+        for slot in self.slots.values():
+            slot.client.close()
@@ -0,0 +1,162 @@
+import asyncio
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import DEFAULT_PAGE_SIZE
+
+MILESTONE_STATUSES = ("open", "closed")
+
+
+def _plain(value):
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def _name_index(items, *names) -> dict:
+    index = {}
+    for item in items:
+        for name in names:
+            value = item.get(name)
+            if value and value not in index:
+                index[value] = item.get("id")
+    return index
+
+
+class ProjectSnapshot:
+    """
+    프로젝트 하나의 메타 정보(프로젝트, 업무 상태, 태그, 마일스톤)를 한 번에 가져와 이름 → id로 색인합니다.
+
+        snapshot = ProjectSnapshot.load(client, project_id, max_workers=8)
+        snapshot.workflow_id("진행 중"), snapshot.tag_id("긴급"), snapshot.milestone_id("2024 Q3")
+        snapshot.save("project.json")
+        snapshot = ProjectSnapshot.from_file("project.json", max_age=600) or ProjectSnapshot.load(client, project_id)
+
+    업무 상태, 태그의 모든 페이지, 상태별 마일스톤의 모든 페이지를 동시에 조회합니다.
+    """
+    version = 1
+
+    def __init__(self, project_id: str, project: dict = None, workflows: list = None, tags: list = None,
+                 milestones: list = None, loaded_at: float = None):
+        self.project_id = project_id
+        self.project = project
+        self.workflows = workflows or []
+        self.tags = tags or []
+        self.milestones = milestones or []
+        self.loaded_at = time.time() if loaded_at is None else loaded_at
+        self._build_index()
+
+    def _build_index(self):
+        self.workflow_ids = _name_index(self.workflows, "name")
+        # 언어별 이름(names)으로도 찾을 수 있습니다.
+        for workflow in self.workflows:
+            for localized in workflow.get("names") or []:
+                self.workflow_ids.setdefault(localized.get("name"), workflow.get("id"))
+        self.tag_ids = _name_index(self.tags, "name")
+        self.milestone_ids = _name_index(self.milestones, "name")
+
+    @staticmethod
+    def _lookup(index: dict, kind: str, name: str) -> str:
+        try:
+            return index[name]
+        except KeyError:
+            raise KeyError(f"{kind} '{name}'을(를) 찾을 수 없습니다.") from None
+
+    def workflow_id(self, name: str) -> str:
+        return self._lookup(self.workflow_ids, "업무 상태", name)
+
+    def tag_id(self, name: str) -> str:
+        return self._lookup(self.tag_ids, "태그", name)
+
+    def milestone_id(self, name: str) -> str:
+        return self._lookup(self.milestone_ids, "마일스톤", name)
+
+    @property
+    def age(self) -> float:
+        return time.time() - self.loaded_at
+
+    @classmethod
+    def load(cls, client, project_id: str, max_workers: int = 4, size: int = DEFAULT_PAGE_SIZE,
+             milestone_statuses=MILESTONE_STATUSES, include_project: bool = True):
+        """
+        DoorayAPIClient로 스냅숏을 만듭니다. 각 목록의 나머지 페이지도 max_workers개까지 동시에 가져옵니다.
+        """
+        with ThreadPoolExecutor(max_workers=3 + len(milestone_statuses)) as executor:
+            project = executor.submit(client.get_project, project_id) if include_project else None
+            workflows = executor.submit(client.get_workflows, project_id)
+            tags = executor.submit(lambda: list(client.iter_tags(project_id, size=size, max_workers=max_workers)))
+            milestones = [executor.submit(lambda status=status: list(client.iter_milestones(
+                project_id, status=status, size=size, max_workers=max_workers))) for status in milestone_statuses]
+            return cls(project_id,
+                       project=project.result().get("result") if project is not None else None,
+                       workflows=workflows.result().get("result") or [],
+                       tags=tags.result(),
+                       milestones=[item for future in milestones for item in future.result()])
+
+    @classmethod
+    async def load_async(cls, client, project_id: str, max_workers: int = 4, size: int = DEFAULT_PAGE_SIZE,
+                         milestone_statuses=MILESTONE_STATUSES, include_project: bool = True):
+        """
+        AsyncDoorayAPIClient로 스냅숏을 만듭니다.
+        """
+        async def collect(items):
+            return [item async for item in items]
+
+        requests = [client.get_workflows(project_id),
+                    collect(client.iter_tags(project_id, size=size, max_workers=max_workers))]
+        requests += [collect(client.iter_milestones(project_id, status=status, size=size, max_workers=max_workers))
+                     for status in milestone_statuses]
+        if include_project:
+            requests.append(client.get_project(project_id))
+        results = await asyncio.gather(*requests)
+        project = results.pop().get("result") if include_project else None
+        workflows, tags, milestone_pages = results[0], results[1], results[2:]
+        return cls(project_id, project=project, workflows=workflows.get("result") or [], tags=tags,
+                   milestones=[item for items in milestone_pages for item in items])
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "projectId": self.project_id,
+            "loadedAt": self.loaded_at,
+            "project": _plain(self.project),
+            "workflows": _plain(list(self.workflows)),
+            "tags": _plain(list(self.tags)),
+            "milestones": _plain(list(self.milestones)),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        return cls(data["projectId"], project=data.get("project"), workflows=data.get("workflows"),
+                   tags=data.get("tags"), milestones=data.get("milestones"), loaded_at=data.get("loadedAt"))
+
+    def save(self, path: str):
+        temp_path = path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def from_file(cls, path: str, max_age: float = None):
+        """
+        save로 저장한 스냅숏을 읽습니다. 파일이 없거나 max_age초보다 오래되었으면 None을 반환합니다.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != cls.version:
+            return None
+        snapshot = cls.from_dict(data)
+        if max_age is not None and snapshot.age > max_age:
+            return None
+        return snapshot
+
+    def __repr__(self):
+        return (f"ProjectSnapshot({self.project_id!r}, workflows={len(self.workflows)}, tags={len(self.tags)}, "
+                f"milestones={len(self.milestones)})")
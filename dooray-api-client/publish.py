@@ -0,0 +1,326 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from .transfer import hash_file
+
+STATE_NAME = ".dooray-wiki.json"
+INDEX_NAMES = ("index.md", "README.md")
+IMAGE_PATTERN = re.compile(r"(!\[[^\]]*\]\()([^)\s]+)((?:\s+\"[^\"]*\")?\))")
+HEADING_PATTERN = re.compile(r"^[ \t]*#[ \t]+(.+?)[ \t]*#*[ \t]*$", re.MULTILINE)
+# ``` 또는 ~~~ 코드 블록. 닫는 줄이 없으면 문서 끝까지입니다.
+FENCE_PATTERN = re.compile(r"^[ ]{0,3}(([`~])\2{2,})[^\n]*(?:\n.*?(?:\n[ ]{0,3}\1\2*[ \t]*(?=\n|\Z))|.*\Z)",
+                           re.MULTILINE | re.DOTALL)
+
+
+def _fenced_spans(text: str) -> list:
+    """
+    코드 블록의 (시작, 끝) 위치 목록
+    """
+    return [match.span() for match in FENCE_PATTERN.finditer(text)]
+
+
+def _in_spans(position: int, spans: list) -> bool:
+    return any(start <= position < end for start, end in spans)
+
+
+def _find_heading(text: str):
+    """
+    코드 블록 밖의 첫 번째 "# 제목" 줄을 찾습니다. (코드의 "# 주석"은 제외)
+    """
+    spans = _fenced_spans(text)
+    return next((match for match in HEADING_PATTERN.finditer(text) if not _in_spans(match.start(), spans)), None)
+
+
+def _text_hash(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class LocalPage:
+    """
+    게시할 로컬 페이지 하나. 디렉터리는 index.md(또는 README.md)를 본문으로 하는 페이지가 됩니다.
+    """
+    __slots__ = ("relpath", "parent", "source", "subject", "content", "images")
+
+    def __init__(self, relpath: str, parent: str, source: str, subject: str):
+        self.relpath = relpath
+        self.parent = parent
+        self.source = source
+        self.subject = subject
+        self.content = ""
+        self.images = []
+
+    @property
+    def depth(self) -> int:
+        return self.relpath.count("/")
+
+
+class PublishSummary:
+    def __init__(self):
+        self.created = 0
+        self.updated_titles = 0
+        self.updated_contents = 0
+        self.unchanged = 0
+        self.images_uploaded = 0
+        self.images_reused = 0
+        self.images_attached = 0
+        self.elapsed = 0.0
+        self.errors = []
+        self._lock = threading.Lock()
+
+    def add(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def add_error(self, relpath: str, error: Exception):
+        with self._lock:
+            self.errors.append((relpath, error))
+
+    def as_dict(self) -> dict:
+        return {
+            "created": self.created,
+            "updatedTitles": self.updated_titles,
+            "updatedContents": self.updated_contents,
+            "unchanged": self.unchanged,
+            "imagesUploaded": self.images_uploaded,
+            "imagesReused": self.images_reused,
+            "imagesAttached": self.images_attached,
+            "elapsed": round(self.elapsed, 3),
+            "errors": [{"path": path, "error": str(error)} for path, error in self.errors],
+        }
+
+
+class WikiPublisher:
+    """
+    로컬 Markdown 디렉터리를 위키 페이지 트리로 게시합니다.
+
+        publisher = WikiPublisher(client, wiki_id, root_page_id, "./docs", max_workers=8)
+        print(publisher.run().as_dict())
+
+    디렉터리 구조가 parentPageId 트리가 되고, 페이지 제목은 코드 블록 밖의 첫 번째 "# 제목" 줄(없으면 파일 이름)입니다.
+    마지막으로 게시한 제목/본문의 해시를 상태 파일에 기록해 두고, 바뀐 페이지에만
+    update_wiki_page_title / update_wiki_page_content를 호출합니다. 새 페이지는 깊이별로 동시에 생성합니다.
+
+    본문(코드 블록 제외)에서 상대 경로로 참조한 이미지는 upload_wiki_file로 한 번만 올리고, 내용 해시로 중복을 제거해
+    image_url 형식의 주소로 바꿔 씁니다. 새 페이지에는 attachFileIds로 첨부하고, 이미 게시한 페이지의
+    본문에 새로 참조한 이미지는 upload_wiki_page_file로 그 페이지에 첨부한 파일 주소를 사용합니다.
+
+    :param state_path: 상태 파일 경로. 기본값은 local_dir/.dooray-wiki.json
+    :param image_url: 업로드한 이미지를 가리킬 주소 형식. {file_id}가 파일 id로 치환됩니다.
+    """
+    def __init__(self, client, wiki_id: str, root_page_id: str, local_dir: str, state_path: str = None,
+                 max_workers: int = 4, image_url: str = "/files/{file_id}"):
+        self.client = client
+        self.wiki_id = wiki_id
+        self.root_page_id = root_page_id
+        self.local_dir = os.path.abspath(local_dir)
+        self.state_path = state_path or os.path.join(self.local_dir, STATE_NAME)
+        self.max_workers = max_workers
+        self.image_url = image_url
+        self._lock = threading.Lock()
+        self.pages, self.images = self._load_state()
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return {}, {}
+        if state.get("wikiId") != self.wiki_id or state.get("rootPageId") != self.root_page_id:
+            return {}, {}
+        return state.get("pages", {}), state.get("images", {})
+
+    def save_state(self):
+        with self._lock:
+            state = {"wikiId": self.wiki_id, "rootPageId": self.root_page_id, "pages": self.pages,
+                     "images": self.images}
+            temp_path = self.state_path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False, sort_keys=True)
+            os.replace(temp_path, self.state_path)
+
+    def scan(self):
+        """
+        로컬 디렉터리를 훑어 {상대 경로: LocalPage}를 반환합니다.
+        """
+        pages = {}
+        for root, dirnames, filenames in os.walk(self.local_dir):
+            dirnames.sort()
+            relroot = os.path.relpath(root, self.local_dir).replace(os.sep, "/")
+            relroot = "" if relroot == "." else relroot
+            index_name = next((name for name in INDEX_NAMES if name in filenames), None)
+            if relroot:
+                parent = relroot.rpartition("/")[0]
+                source = os.path.join(root, index_name) if index_name else None
+                pages[relroot] = LocalPage(relroot, parent, source, os.path.basename(root))
+            for filename in sorted(filenames):
+                if not filename.endswith(".md") or (relroot and filename == index_name):
+                    continue
+                relpath = f"{relroot}/{filename[:-3]}" if relroot else filename[:-3]
+                pages[relpath] = LocalPage(relpath, relroot, os.path.join(root, filename), filename[:-3])
+        # Markdown 파일이 하나도 없는 디렉터리(이미지 폴더 등)는 페이지로 만들지 않습니다.
+        used = set()
+        for page in pages.values():
+            if page.source is not None:
+                parent = page.relpath
+                while parent and parent not in used:
+                    used.add(parent)
+                    parent = parent.rpartition("/")[0]
+        pages = {relpath: page for relpath, page in pages.items() if relpath in used}
+        for page in pages.values():
+            self._read(page)
+        return pages
+
+    def _read(self, page: LocalPage):
+        if page.source is None:
+            return
+        with open(page.source, "r", encoding="utf-8") as f:
+            page.content = f.read()
+        heading = _find_heading(page.content)
+        if heading:
+            page.subject = heading.group(1)
+        base_dir = os.path.dirname(page.source)
+        spans = _fenced_spans(page.content)
+        for match in IMAGE_PATTERN.finditer(page.content):
+            if _in_spans(match.start(), spans):
+                continue
+            target = match.group(2)
+            if "://" in target or target.startswith(("/", "#", "data:")):
+                continue
+            path = os.path.normpath(os.path.join(base_dir, target))
+            if os.path.isfile(path):
+                page.images.append((target, path))
+
+    def _upload_images(self, summary: PublishSummary, pages: dict, executor: ThreadPoolExecutor) -> dict:
+        """
+        참조된 이미지를 해시로 중복 제거해 올리고 {로컬 경로: 파일 id}를 반환합니다.
+        """
+        paths = sorted({path for page in pages.values() for _, path in page.images})
+        hashes = dict(zip(paths, executor.map(hash_file, paths)))
+        missing = {}
+        for path, digest in hashes.items():
+            if digest in self.images:
+                summary.add(images_reused=1)
+            else:
+                missing.setdefault(digest, path)
+
+        def upload(item):
+            digest, path = item
+            try:
+                result = self.client.upload_wiki_file(self.wiki_id, path)
+            except Exception as error:
+                summary.add_error(os.path.relpath(path, self.local_dir), error)
+                return
+            with self._lock:
+                self.images[digest] = result["result"]["id"]
+            summary.add(images_uploaded=1)
+
+        list(executor.map(upload, missing.items()))
+        return {path: self.images.get(digest) for path, digest in hashes.items()}
+
+    def _render(self, page: LocalPage, image_ids: dict, attachments: dict = None):
+        """
+        이미지 참조를 업로드한 파일 주소로 바꾼 본문과 첨부 파일 id 목록을 반환합니다.
+
+        :param attachments: {위키 파일 id: 페이지에 첨부한 파일 id}. 있으면 첨부한 파일 주소를 사용합니다.
+        """
+        if not page.images:
+            return page.content, []
+        attachments = attachments or {}
+        targets = {target: attachments.get(image_ids.get(path), image_ids.get(path)) for target, path in page.images}
+        spans = _fenced_spans(page.content)
+
+        def replace(match):
+            file_id = None if _in_spans(match.start(), spans) else targets.get(match.group(2))
+            if file_id is None:
+                return match.group(0)
+            return match.group(1) + self.image_url.format(file_id=file_id) + match.group(3)
+
+        attach_ids = sorted({file_id for file_id in targets.values() if file_id})
+        return IMAGE_PATTERN.sub(replace, page.content), attach_ids
+
+    def run(self) -> PublishSummary:
+        """
+        게시를 실행하고 요약을 반환합니다.
+        """
+        started = time.monotonic()
+        summary = PublishSummary()
+        pages = self.scan()
+        levels = {}
+        for page in pages.values():
+            levels.setdefault(page.depth, []).append(page)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                image_ids = self._upload_images(summary, pages, executor)
+                # 부모 페이지 id가 정해져야 자식을 만들 수 있으므로 깊이 순으로 처리합니다.
+                for depth in sorted(levels):
+                    list(executor.map(lambda page: self._publish(summary, page, image_ids), levels[depth]))
+        finally:
+            self.save_state()
+            summary.elapsed = time.monotonic() - started
+        return summary
+
+    def _parent_id(self, page: LocalPage):
+        if not page.parent:
+            return self.root_page_id
+        parent = self.pages.get(page.parent)
+        return parent["pageId"] if parent else None
+
+    def _publish(self, summary: PublishSummary, page: LocalPage, image_ids: dict):
+        try:
+            content, attach_ids = self._render(page, image_ids)
+            subject_hash, content_hash = _text_hash(page.subject), _text_hash(content)
+            state = self.pages.get(page.relpath)
+            if state is None:
+                parent_id = self._parent_id(page)
+                if parent_id is None:
+                    raise Exception(f"상위 페이지가 게시되지 않았습니다: {page.parent}")
+                result = self.client.create_wiki_page(self.wiki_id, parent_id, page.subject, content,
+                                                      attachFileIds=attach_ids or None)
+                state = {"pageId": result["result"]["id"],
+                         "attachments": {file_id: file_id for file_id in attach_ids}}
+                summary.add(created=1)
+            else:
+                state = dict(state)
+                content, content_hash = self._attach_new_images(summary, page, image_ids, state)
+                changed = False
+                if state.get("subjectHash") != subject_hash:
+                    self.client.update_wiki_page_title(self.wiki_id, state["pageId"], page.subject)
+                    summary.add(updated_titles=1)
+                    changed = True
+                if state.get("contentHash") != content_hash:
+                    self.client.update_wiki_page_content(self.wiki_id, state["pageId"], content)
+                    summary.add(updated_contents=1)
+                    changed = True
+                if not changed:
+                    summary.add(unchanged=1)
+            with self._lock:
+                self.pages[page.relpath] = dict(state, subjectHash=subject_hash, contentHash=content_hash)
+        except Exception as error:
+            summary.add_error(page.relpath, error)
+
+    def _attach_new_images(self, summary: PublishSummary, page: LocalPage, image_ids: dict, state: dict):
+        """
+        게시된 페이지의 본문이 바뀌었으면 새로 참조한 이미지를 그 페이지에 첨부하고 (본문, 해시)를 반환합니다.
+        update_wiki_page_content는 attachFileIds를 받지 않으므로 페이지 파일로 올려 첨부합니다.
+        """
+        attachments = dict(state.get("attachments") or {})
+        content, _ = self._render(page, image_ids, attachments)
+        content_hash = _text_hash(content)
+        if state.get("contentHash") == content_hash:
+            return content, content_hash
+        for path in dict.fromkeys(path for _, path in page.images):
+            file_id = image_ids.get(path)
+            if file_id is None or file_id in attachments:
+                continue
+            result = self.client.upload_wiki_page_file(self.wiki_id, state["pageId"], path)
+            attachments[file_id] = result["result"]["id"]
+            summary.add(images_attached=1)
+        state["attachments"] = attachments
+        content, _ = self._render(page, image_ids, attachments)
+        return content, _text_hash(content)
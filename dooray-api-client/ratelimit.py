@@ -0,0 +1,82 @@
+import asyncio
+import threading
+import time
+
+FAMILIES = ("drive", "wiki", "project", "common")
+
+
+class TokenBucket:
+    """
+    초당 rate개의 토큰이 채워지고 최대 capacity개까지 모이는 토큰 버킷.
+
+    reserve()는 토큰을 미리 예약하고 기다려야 할 시간을 반환하므로 스레드와
+    asyncio 양쪽에서 같은 버킷을 공유할 수 있습니다.
+    """
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1) -> float:
+        """
+        토큰을 예약하고 요청을 보내기 전까지 기다려야 하는 시간(초)을 반환합니다.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, tokens: float = 1):
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """
+    엔드포인트 계열(drive, wiki, project, common)별 토큰 버킷으로 요청 속도를 제한합니다.
+
+        limiter = RateLimiter(rate=20, families={"wiki": 5, "drive": TokenBucket(10, capacity=30)})
+
+    :param rate: families에 지정하지 않은 계열에 적용할 초당 요청 수. None이면 제한하지 않습니다.
+    :param families: {계열: 초당 요청 수 또는 TokenBucket}
+    """
+    def __init__(self, rate: float = None, families: dict = None, capacity: float = None):
+        self._buckets = {}
+        for family, limit in (families or {}).items():
+            self._buckets[family] = limit if isinstance(limit, TokenBucket) else TokenBucket(limit, capacity)
+        self._default = TokenBucket(rate, capacity) if rate else None
+
+    @staticmethod
+    def family(path: str) -> str:
+        """
+        요청 경로의 첫 구간으로 계열을 구합니다. (/wiki/v1/... -> "wiki")
+        """
+        family = path.lstrip("/").split("/", 1)[0]
+        return family if family in FAMILIES else "common"
+
+    def bucket(self, path: str):
+        return self._buckets.get(self.family(path), self._default)
+
+    def acquire(self, path: str):
+        bucket = self.bucket(path)
+        if bucket is not None:
+            bucket.acquire()
+
+    async def acquire_async(self, path: str):
+        bucket = self.bucket(path)
+        if bucket is not None:
+            await bucket.acquire_async()
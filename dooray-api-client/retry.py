@@ -0,0 +1,69 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "PUT", "DELETE", "OPTIONS"))
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+
+
+class RetryPolicy:
+    """
+    429/5xx 응답과 연결 오류를 지수 백오프 + 지터로 재시도하는 정책.
+
+    기본적으로 멱등 메서드만 재시도합니다. 429는 서버가 요청을 처리하지 않았다는 의미이므로
+    메서드와 관계없이 재시도합니다. Retry-After 헤더가 있으면 그 시간만큼 기다립니다.
+
+    :param max_retries: 최대 재시도 횟수
+    :param backoff_factor: n번째 재시도의 최대 대기 시간은 backoff_factor * 2 ** n 초
+    :param max_backoff: 대기 시간 상한(초). Retry-After도 이 값과 max_retry_after 중 큰 값으로 제한됩니다.
+    :param jitter: True이면 0 ~ 백오프 사이에서 무작위로 대기합니다. (full jitter)
+    """
+    def __init__(self, max_retries: int = 3, backoff_factor: float = 0.5, max_backoff: float = 30.0,
+                 jitter: bool = True, statuses=RETRY_STATUSES, methods=IDEMPOTENT_METHODS,
+                 max_retry_after: float = 120.0):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.methods = frozenset(method.upper() for method in methods)
+        self.max_retry_after = max_retry_after
+
+    def should_retry(self, method: str, attempt: int, status: int = None) -> bool:
+        """
+        attempt번째(0부터) 시도의 결과를 재시도할지 판단합니다. status가 None이면 연결 오류입니다.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if status is None:
+            return method.upper() in self.methods
+        if status not in self.statuses:
+            return False
+        return status == 429 or method.upper() in self.methods
+
+    def delay(self, attempt: int, retry_after: str = None) -> float:
+        """
+        다음 재시도까지 기다릴 시간(초)
+        """
+        wait = parse_retry_after(retry_after)
+        if wait is not None:
+            return min(wait, max(self.max_backoff, self.max_retry_after))
+        backoff = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, backoff) if self.jitter else backoff
+
+
+def parse_retry_after(value: str):
+    """
+    Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환합니다.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
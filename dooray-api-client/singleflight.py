@@ -0,0 +1,98 @@
+import asyncio
+import threading
+
+# 실행하던 호출자가 취소되어 결과 없이 끝났음을 기다리는 호출자에게 알리는 표식
+_ABANDONED = object()
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    동시에 진행 중인 같은 키의 호출을 하나로 합치는 단일 비행(single-flight) 그룹.
+
+    먼저 들어온 호출만 실제로 실행되고, 그 사이에 들어온 같은 키의 호출은 결과(또는 예외)를
+    함께 받습니다. 모든 호출자가 같은 결과 객체를 공유하므로 결과를 수정하지 않아야 합니다.
+
+    calls는 실제로 실행된 호출 수, deduplicated는 합쳐져서 생략된 호출 수입니다.
+    """
+    def __init__(self):
+        self._calls = {}
+        self._async_calls = {}
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.deduplicated = 0
+
+    def do(self, key, fn):
+        """
+        key에 대해 진행 중인 호출이 있으면 그 결과를 기다리고, 없으면 fn()을 실행합니다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.deduplicated += 1
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as error:
+            call.error = error
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    async def do_async(self, key, coroutine_fn):
+        """
+        do()의 asyncio 버전. coroutine_fn()은 코루틴을 반환해야 합니다.
+
+        실행 중인 호출자가 취소되어도 기다리던 호출자들은 취소되지 않으며, 그중 하나가 호출을 이어받아 실행합니다.
+        """
+        future = self._async_calls.get(key)
+        while future is not None:
+            self.deduplicated += 1
+            result = await asyncio.shield(future)
+            if result is not _ABANDONED:
+                return result
+            # 실행하던 호출자가 취소되었으므로 먼저 깨어난 호출자가 다시 실행합니다.
+            self.deduplicated -= 1
+            future = self._async_calls.get(key)
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_calls[key] = future
+        self.calls += 1
+        try:
+            result = await coroutine_fn()
+        except asyncio.CancelledError:
+            del self._async_calls[key]
+            future.set_result(_ABANDONED)
+            raise
+        except BaseException as error:
+            del self._async_calls[key]
+            future.set_exception(error)
+            # 기다리는 호출자가 없어도 경고가 나지 않도록 예외를 회수합니다.
+            future.exception()
+            raise
+        del self._async_calls[key]
+        future.set_result(result)
+        return result
+
+    def stats(self) -> dict:
+        return {"calls": self.calls, "deduplicated": self.deduplicated}
@@ -0,0 +1,471 @@
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from .singleflight import SingleFlight
+from .transfer import hash_file
+
+MANIFEST_NAME = ".dooray-sync.json"
+
+
+class SyncManifest:
+    """
+    마지막 동기화 상태를 기록하는 로컬 매니페스트.
+
+    files는 {상대 경로: {"id", "size", "mtime", "hash"}}, folders는 {상대 경로: 폴더 id}입니다.
+    reconciled는 delete=True 동기화가 기록된 모든 원격 폴더를 조회해 원격에만 있는 항목까지 정리했는지 여부입니다.
+    """
+    version = 1
+
+    def __init__(self, path: str, drive_id: str = None, root_folder_id: str = None, files: dict = None,
+                 folders: dict = None, reconciled: bool = False):
+        self.path = path
+        self.drive_id = drive_id
+        self.root_folder_id = root_folder_id
+        self.files = files or {}
+        self.folders = folders or {}
+        self.reconciled = reconciled
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str, drive_id: str, root_folder_id: str):
+        """
+        매니페스트를 읽습니다. 없거나 다른 드라이브/폴더의 매니페스트이면 빈 매니페스트를 반환합니다.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            saved = None
+        if (not saved or saved.get("version") != cls.version or saved.get("driveId") != drive_id
+                or saved.get("rootFolderId") != root_folder_id):
+            return cls(path, drive_id, root_folder_id)
+        return cls(path, drive_id, root_folder_id, saved.get("files"), saved.get("folders"),
+                   saved.get("reconciled", False))
+
+    def save(self):
+        with self._lock:
+            data = {
+                "version": self.version,
+                "driveId": self.drive_id,
+                "rootFolderId": self.root_folder_id,
+                "files": self.files,
+                "folders": self.folders,
+                "reconciled": self.reconciled,
+            }
+            temp_path = self.path + ".tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False, sort_keys=True)
+            os.replace(temp_path, self.path)
+
+    def set_file(self, relpath: str, entry: dict):
+        with self._lock:
+            self.files[relpath] = entry
+
+    def remove_file(self, relpath: str):
+        with self._lock:
+            self.files.pop(relpath, None)
+
+    def set_folder(self, relpath: str, folder_id: str):
+        with self._lock:
+            self.folders[relpath] = folder_id
+
+    def remove_folder(self, relpath: str):
+        """
+        폴더와 그 아래의 파일, 폴더 항목을 모두 제거합니다.
+        """
+        prefix = relpath + "/"
+        with self._lock:
+            self.folders.pop(relpath, None)
+            for entries in (self.files, self.folders):
+                for key in [key for key in entries if key.startswith(prefix)]:
+                    del entries[key]
+
+
+class SyncSummary:
+    """
+    동기화 한 번의 결과 요약
+    """
+    def __init__(self, dry_run: bool = False):
+        self.dry_run = dry_run
+        self.created_folders = 0
+        self.uploaded = 0
+        self.updated = 0
+        self.deleted = 0
+        self.deleted_folders = 0
+        self.unchanged = 0
+        self.bytes_uploaded = 0
+        self.bytes_skipped = 0
+        self.upload_seconds = 0.0
+        self.elapsed = 0.0
+        self.errors = []
+        self._lock = threading.Lock()
+
+    def add_error(self, relpath: str, error: Exception):
+        with self._lock:
+            self.errors.append((relpath, error))
+
+    def add(self, **counts):
+        with self._lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    @property
+    def seconds_saved(self) -> float:
+        """
+        변경되지 않은 파일을 이번 실행의 평균 업로드 속도로 올렸다면 걸렸을 시간(추정치)
+        """
+        if not self.bytes_uploaded or not self.upload_seconds:
+            return 0.0
+        return self.bytes_skipped / (self.bytes_uploaded / self.upload_seconds)
+
+    def as_dict(self) -> dict:
+        return {
+            "dryRun": self.dry_run,
+            "createdFolders": self.created_folders,
+            "uploaded": self.uploaded,
+            "updated": self.updated,
+            "deleted": self.deleted,
+            "deletedFolders": self.deleted_folders,
+            "unchanged": self.unchanged,
+            "bytesUploaded": self.bytes_uploaded,
+            "bytesSkipped": self.bytes_skipped,
+            "secondsSaved": round(self.seconds_saved, 3),
+            "elapsed": round(self.elapsed, 3),
+            "errors": [{"path": path, "error": str(error)} for path, error in self.errors],
+        }
+
+
+class SyncAction:
+    __slots__ = ("kind", "relpath", "size", "mtime", "hash", "file_id")
+
+    def __init__(self, kind: str, relpath: str, size: int = 0, mtime: float = 0.0, hash: str = None,
+                 file_id: str = None):
+        self.kind = kind
+        self.relpath = relpath
+        self.size = size
+        self.mtime = mtime
+        self.hash = hash
+        self.file_id = file_id
+
+    def __repr__(self):
+        return f"SyncAction({self.kind!r}, {self.relpath!r})"
+
+
+class DriveSync:
+    """
+    로컬 디렉터리를 Dooray 드라이브 폴더로 증분 동기화합니다.
+
+        sync = DriveSync(client, drive_id, folder_id, "./reports", max_workers=8)
+        print(sync.run().as_dict())
+
+    매니페스트에 기록된 크기/수정 시각이 같은 파일은 네트워크 호출 없이 건너뛰고, 달라진 파일은
+    해시를 비교해 내용이 바뀐 경우에만 새 버전을 올립니다. 매니페스트에 없는 파일은 원격 폴더의
+    같은 이름 파일을 찾아 새 버전으로 올리거나 새로 업로드합니다.
+    매니페스트는 실행 중에도 save_interval초마다 저장되므로 중단된 뒤 다시 실행하면 끝난 파일은 건너뜁니다.
+
+    :param manifest_path: 매니페스트 파일 경로. 기본값은 local_dir/.dooray-sync.json
+    :param max_workers: 동시에 진행할 업로드/삭제 수
+    :param delete: True이면 로컬에 없는 파일과 폴더를 원격에서도 삭제합니다.
+        매니페스트에 기록된 항목뿐 아니라 동기화하는 원격 폴더에만 있는 항목도 삭제합니다.
+        원격 폴더 목록은 처음 delete=True로 실행할 때만 모두 조회하고, 이후에는 로컬 내용이 바뀐 폴더와
+        이번 실행에서 원격의 같은 이름 폴더와 연결된 폴더만 조회합니다.
+    :param dry_run: True이면 변경 없이 수행할 작업만 계산합니다.
+    :param save_interval: 실행 중 매니페스트를 저장할 최소 간격(초). 0이면 파일 하나가 끝날 때마다 저장합니다.
+    """
+    def __init__(self, client, drive_id: str, root_folder_id: str, local_dir: str, manifest_path: str = None,
+                 max_workers: int = 4, delete: bool = False, dry_run: bool = False, save_interval: float = 5.0):
+        self.client = client
+        self.drive_id = drive_id
+        self.root_folder_id = root_folder_id
+        self.local_dir = os.path.abspath(local_dir)
+        self.manifest_path = manifest_path or os.path.join(self.local_dir, MANIFEST_NAME)
+        self.max_workers = max_workers
+        self.delete = delete
+        self.dry_run = dry_run
+        self.save_interval = save_interval
+        self.manifest = SyncManifest.load(self.manifest_path, drive_id, root_folder_id)
+        self._remote_children = {}
+        self._children_lock = threading.Lock()
+        self._listing = SingleFlight()
+        self._saved_at = time.monotonic()
+        self._save_lock = threading.Lock()
+
+    def _scan(self):
+        """
+        로컬 트리를 훑어 (폴더 상대 경로 목록, {파일 상대 경로: os.stat_result})를 반환합니다.
+        """
+        folders, files = [], {}
+        manifest_path = os.path.abspath(self.manifest_path)
+        for root, dirnames, filenames in os.walk(self.local_dir):
+            dirnames.sort()
+            relroot = os.path.relpath(root, self.local_dir).replace(os.sep, "/")
+            relroot = "" if relroot == "." else relroot
+            if relroot:
+                folders.append(relroot)
+            for filename in sorted(filenames):
+                path = os.path.join(root, filename)
+                if path == manifest_path or path.startswith(manifest_path + ".") or not os.path.isfile(path):
+                    continue
+                files[f"{relroot}/{filename}" if relroot else filename] = os.stat(path)
+        return folders, files
+
+    def plan(self):
+        """
+        로컬 트리와 매니페스트를 비교해 (새 폴더 목록, 작업 목록)을 반환합니다.
+        내용이 바뀌지 않은 파일은 "unchanged" 작업으로 포함됩니다.
+        """
+        return self._plan(*self._scan())
+
+    def _plan(self, folders: list, files: dict):
+        new_folders = [folder for folder in folders if folder not in self.manifest.folders]
+        actions = []
+        for relpath, stat in files.items():
+            entry = self.manifest.files.get(relpath)
+            if entry is None:
+                actions.append(SyncAction("upload", relpath, stat.st_size, stat.st_mtime))
+                continue
+            if entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+                actions.append(SyncAction("unchanged", relpath, stat.st_size, stat.st_mtime, entry.get("hash"),
+                                          entry["id"]))
+                continue
+            digest = hash_file(os.path.join(self.local_dir, relpath))
+            kind = "unchanged" if digest == entry.get("hash") else "update"
+            actions.append(SyncAction(kind, relpath, stat.st_size, stat.st_mtime, digest, entry["id"]))
+        if self.delete:
+            kept = set(folders) | {""}
+            # 상위 폴더까지 사라진 경우 가장 위의 폴더 하나만 삭제합니다.
+            removed = sorted(folder for folder in self.manifest.folders
+                             if folder not in kept and folder.rpartition("/")[0] in kept)
+            for relpath in removed:
+                actions.append(SyncAction("delete_folder", relpath, file_id=self.manifest.folders[relpath]))
+            for relpath, entry in self.manifest.files.items():
+                if relpath not in files and not any(relpath.startswith(folder + "/") for folder in removed):
+                    actions.append(SyncAction("delete", relpath, entry["size"], file_id=entry["id"]))
+        return new_folders, actions
+
+    def _remote_extras(self, folders: list, files: dict, new_folders: list, actions: list) -> list:
+        """
+        동기화하는 원격 폴더에만 있는 파일과 폴더의 삭제 작업을 반환합니다.
+
+        매니페스트가 reconciled이면 로컬 내용이 바뀐 폴더와 원격의 같은 이름 폴더를 재사용하게 될
+        새 폴더만 조회하고, 아니면 루트와 로컬에 남아 있는 모든 폴더를 조회합니다.
+        """
+        local = {(parent, name, "file") for parent, _, name in (relpath.rpartition("/") for relpath in files)}
+        local |= {(parent, name, "folder") for parent, _, name in (relpath.rpartition("/") for relpath in folders)}
+        planned = {action.file_id for action in actions if action.file_id}
+        remote_ids = {"": self.root_folder_id}
+        remote_ids.update((folder, self.manifest.folders[folder]) for folder in folders
+                          if folder in self.manifest.folders)
+        if self.manifest.reconciled:
+            changed = {action.relpath.rpartition("/")[0] for action in actions if action.kind != "unchanged"}
+            changed |= {folder.rpartition("/")[0] for folder in new_folders}
+        else:
+            changed = set(remote_ids)
+        new_folders = set(new_folders)
+        extras = []
+        # 상위 폴더가 하위 폴더보다 먼저 오도록 정렬합니다.
+        for relpath in sorted(set(remote_ids) | new_folders):
+            if relpath in new_folders:
+                parent, _, name = relpath.rpartition("/")
+                existing = self._find_remote_child(remote_ids[parent], name, "folder") \
+                    if parent in remote_ids else None
+                if existing is None:
+                    continue
+                remote_ids[relpath] = existing["id"]
+            elif relpath not in changed:
+                continue
+            listing = self._remote_listing(remote_ids[relpath])
+            for (file_type, name), item in sorted(listing.items(), key=lambda pair: pair[0][1] or ""):
+                if file_type not in ("file", "folder") or (relpath, name, file_type) in local \
+                        or item["id"] in planned:
+                    continue
+                child = f"{relpath}/{name}" if relpath else name
+                extras.append(SyncAction("delete" if file_type == "file" else "delete_folder", child,
+                                         item.get("size") or 0, file_id=item["id"]))
+        return extras
+
+    def run(self) -> SyncSummary:
+        """
+        동기화를 실행하고 요약을 반환합니다.
+        """
+        started = time.monotonic()
+        summary = SyncSummary(self.dry_run)
+        folders, files = self._scan()
+        new_folders, actions = self._plan(folders, files)
+        try:
+            if self.delete:
+                actions += self._remote_extras(folders, files, new_folders, actions)
+            if self.dry_run:
+                self._summarize_dry_run(summary, new_folders, actions)
+                return summary
+            failed = self._create_folders(summary, new_folders)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for action in actions:
+                    if action.relpath.startswith(failed):
+                        # 만들지 못한 폴더의 하위 항목은 이번 실행에서 건너뜁니다.
+                        continue
+                    if action.kind == "unchanged":
+                        self._mark_unchanged(summary, action)
+                    else:
+                        executor.submit(self._apply, summary, action)
+            if self.delete and not summary.errors:
+                self.manifest.reconciled = True
+        finally:
+            if not self.dry_run:
+                self.manifest.save()
+            summary.elapsed = time.monotonic() - started
+        return summary
+
+    def _summarize_dry_run(self, summary: SyncSummary, new_folders: list, actions: list):
+        summary.created_folders = len(new_folders)
+        for action in actions:
+            if action.kind == "unchanged":
+                summary.add(unchanged=1, bytes_skipped=action.size)
+            elif action.kind == "delete":
+                summary.add(deleted=1)
+            elif action.kind == "delete_folder":
+                summary.add(deleted_folders=1)
+            else:
+                summary.add(bytes_uploaded=action.size, **{"uploaded" if action.kind == "upload" else "updated": 1})
+
+    def _mark_unchanged(self, summary: SyncSummary, action: SyncAction):
+        entry = self.manifest.files[action.relpath]
+        if entry["mtime"] != action.mtime:
+            # 내용은 같고 수정 시각만 바뀐 경우 다음 실행에서 해시를 다시 계산하지 않도록 갱신
+            self.manifest.set_file(action.relpath, dict(entry, mtime=action.mtime))
+        summary.add(unchanged=1, bytes_skipped=action.size)
+
+    def _folder_id(self, relpath: str) -> str:
+        return self.manifest.folders[relpath] if relpath else self.root_folder_id
+
+    def _remote_listing(self, folder_id: str) -> dict:
+        """
+        원격 폴더의 {(type, name): 항목}을 반환합니다. 폴더별 목록은 한 번만 조회하며,
+        같은 폴더를 동시에 찾으면 조회 하나를 함께 기다립니다. 다른 폴더의 조회는 막지 않습니다.
+        """
+        with self._children_lock:
+            children = self._remote_children.get(folder_id)
+        if children is None:
+            children = self._listing.do(folder_id, lambda: self._list_remote(folder_id))
+        return children
+
+    def _list_remote(self, folder_id: str) -> dict:
+        children = {}
+        for item in self.client.iter_files(self.drive_id, parentId=folder_id):
+            children[(item.get("type"), item.get("name"))] = item
+        with self._children_lock:
+            return self._remote_children.setdefault(folder_id, children)
+
+    def _find_remote_child(self, folder_id: str, name: str, file_type: str):
+        """
+        원격 폴더에서 이름이 같은 항목을 찾습니다.
+        """
+        return self._remote_listing(folder_id).get((file_type, name))
+
+    def _checkpoint(self):
+        """
+        마지막 저장 후 save_interval초가 지났으면 매니페스트를 저장합니다.
+        """
+        with self._save_lock:
+            now = time.monotonic()
+            if now - self._saved_at < self.save_interval:
+                return
+            self._saved_at = now
+        self.manifest.save()
+
+    def _create_folders(self, summary: SyncSummary, new_folders: list) -> tuple:
+        """
+        새 폴더를 만들고, 만들지 못한 폴더의 하위 경로 접두사("폴더/") 튜플을 반환합니다.
+        실패는 summary.errors에 기록하며 그 폴더의 하위 폴더는 만들지 않습니다.
+        """
+        # 상위 폴더가 먼저 만들어지도록 깊이 순으로 처리하고, 같은 깊이는 동시에 처리합니다.
+        levels = {}
+        for folder in new_folders:
+            levels.setdefault(folder.count("/"), []).append(folder)
+        failed = ()
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for depth in sorted(levels):
+                futures = [(folder, executor.submit(self._create_folder, summary, folder))
+                           for folder in levels[depth] if not folder.startswith(failed)]
+                for folder, future in futures:
+                    try:
+                        future.result()
+                    except Exception as error:
+                        summary.add_error(folder, error)
+                        failed += (folder + "/",)
+        return failed
+
+    def _create_folder(self, summary: SyncSummary, relpath: str):
+        parent, _, name = relpath.rpartition("/")
+        parent_id = self._folder_id(parent)
+        existing = self._find_remote_child(parent_id, name, "folder")
+        if existing is not None:
+            folder_id = existing["id"]
+            if not self.delete:
+                # 원격에만 있는 항목을 확인하지 않은 폴더이므로 다음 delete=True 실행에서 모두 조회합니다.
+                self.manifest.reconciled = False
+        else:
+            folder_id = self.client.create_folder(self.drive_id, parent_id, name)["result"]["id"]
+            # 새로 만든 폴더는 비어 있으므로 목록을 조회하지 않습니다.
+            with self._children_lock:
+                self._remote_children[folder_id] = {}
+            summary.add(created_folders=1)
+        self.manifest.set_folder(relpath, folder_id)
+
+    def _apply(self, summary: SyncSummary, action: SyncAction):
+        try:
+            if action.kind in ("delete", "delete_folder"):
+                self._remove(summary, action)
+            else:
+                self._push(summary, action)
+        except Exception as error:
+            summary.add_error(action.relpath, error)
+            return
+        self._checkpoint()
+
+    def _remove(self, summary: SyncSummary, action: SyncAction):
+        try:
+            self.client.delete_file(self.drive_id, action.file_id)
+        except requests.HTTPError as error:
+            # 이미 원격에서 삭제된 항목이면 매니페스트에서만 제거합니다.
+            if error.response is None or error.response.status_code != 404:
+                raise
+        if action.kind == "delete_folder":
+            self.manifest.remove_folder(action.relpath)
+            summary.add(deleted_folders=1)
+        else:
+            self.manifest.remove_file(action.relpath)
+            summary.add(deleted=1)
+
+    def _push(self, summary: SyncSummary, action: SyncAction):
+        path = os.path.join(self.local_dir, action.relpath)
+        digest = action.hash or hash_file(path)
+        parent, _, name = action.relpath.rpartition("/")
+        file_id = action.file_id
+        if file_id is None:
+            existing = self._find_remote_child(self._folder_id(parent), name, "file")
+            file_id = existing["id"] if existing is not None else None
+
+        started = time.monotonic()
+        result = None
+        if file_id is not None:
+            try:
+                result = self.client.update_file_version(self.drive_id, file_id, path)
+            except requests.HTTPError as error:
+                # 원격에서 삭제된 파일이면 새로 업로드합니다.
+                if error.response is None or error.response.status_code != 404:
+                    raise
+        if result is None:
+            result = self.client.upload_file(self.drive_id, self._folder_id(parent), path)
+            summary.add(uploaded=1)
+        else:
+            summary.add(updated=1)
+        summary.add(bytes_uploaded=action.size, upload_seconds=time.monotonic() - started)
+        file_id = (result.get("result") or {}).get("id") or file_id
+        self.manifest.set_file(action.relpath, {"id": file_id, "size": action.size, "mtime": action.mtime,
+                                                "hash": digest})
@@ -0,0 +1,270 @@
+import asyncio
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+import uuid
+
+
+class TransferResult(dict):
+    """
+    파일 전송 API의 응답(dict)에 전송 통계를 덧붙인 결과입니다.
+
+    dict로서는 기존 응답(response.json())과 동일하게 사용할 수 있습니다.
+    """
+    def __init__(self, response: dict, bytes_transferred: int, elapsed: float):
+        super().__init__(response)
+        self.bytes_transferred = bytes_transferred
+        self.elapsed = elapsed
+
+    @property
+    def throughput(self) -> float:
+        """
+        초당 전송 바이트 수
+        """
+        if self.elapsed <= 0:
+            return float(self.bytes_transferred)
+        return self.bytes_transferred / self.elapsed
+
+
+class MultipartEncoder:
+    """
+    파일 하나와 일반 필드로 구성된 multipart/form-data 본문을 스트리밍하는 file-like 객체.
+
+    본문 전체를 메모리에 만들지 않고 read() 요청마다 필요한 만큼만 파일에서 읽습니다.
+    len 속성으로 전체 길이를 미리 알려주므로 requests가 Content-Length를 설정합니다.
+
+    :param progress: progress(전송한 바이트, 전체 바이트) 형태의 콜백
+    """
+    def __init__(self, file_field: str, file_path: str, fields: dict = None, progress=None,
+                 chunk_size: int = 1024 * 1024):
+        self.boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.file_path = file_path
+        self.progress = progress
+        self.chunk_size = chunk_size
+
+        head = b""
+        for name, value in (fields or {}).items():
+            head += (f"--{self.boundary}\r\n"
+                     f"Content-Disposition: form-data; name=\"{name}\"\r\n\r\n"
+                     f"{value}\r\n").encode("utf-8")
+        filename = os.path.basename(file_path)
+        # urllib3와 같은 HTML5 방식: 이름은 UTF-8 그대로 두고 따옴표만 이스케이프
+        quoted_filename = filename.replace('"', "%22")
+        file_type = mimetypes.guess_type(filename)[0] or "application/octet-stream"
+        head += (f"--{self.boundary}\r\n"
+                 f"Content-Disposition: form-data; name=\"{file_field}\"; filename=\"{quoted_filename}\"\r\n"
+                 f"Content-Type: {file_type}\r\n\r\n").encode("utf-8")
+        self._head = head
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self.file_size = os.path.getsize(file_path)
+        self.len = len(self._head) + self.file_size + len(self._tail)
+
+        self._file = open(file_path, "rb")
+        self._lock = threading.Lock()
+        self.bytes_read = 0
+
+    def __len__(self):
+        return self.len
+
+    def rewind(self):
+        """
+        처음부터 다시 읽을 수 있도록 위치를 되돌립니다. (리디렉션 후 재전송용)
+        """
+        with self._lock:
+            self._file.seek(0)
+            self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data, position = self._read(size)
+        self._report(data, position)
+        return data
+
+    def _read(self, size: int):
+        with self._lock:
+            if size is None or size < 0:
+                size = self.len - self.bytes_read
+            chunks = []
+            remaining = size
+            while remaining > 0 and self.bytes_read < self.len:
+                position = self.bytes_read
+                head_end = len(self._head)
+                file_end = head_end + self.file_size
+                if position < head_end:
+                    chunk = self._head[position:position + remaining]
+                elif position < file_end:
+                    chunk = self._file.read(min(remaining, file_end - position))
+                    if not chunk:
+                        raise IOError(f"업로드 중 파일 크기가 변경되었습니다: {self.file_path}")
+                else:
+                    offset = position - file_end
+                    chunk = self._tail[offset:offset + remaining]
+                chunks.append(chunk)
+                self.bytes_read += len(chunk)
+                remaining -= len(chunk)
+            return b"".join(chunks), self.bytes_read
+
+    def _report(self, data: bytes, position: int):
+        if data and self.progress is not None:
+            self.progress(position, self.len)
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+    async def aiter_chunks(self):
+        """
+        aiohttp 요청 본문으로 사용할 수 있는 비동기 제너레이터.
+
+        파일 읽기는 이벤트 루프를 막지 않도록 기본 executor에서 실행하고,
+        progress 콜백은 이벤트 루프에서 호출합니다.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk, position = await loop.run_in_executor(None, self._read, self.chunk_size)
+            if not chunk:
+                return
+            self._report(chunk, position)
+            yield chunk
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def split_ranges(size: int, segments: int, min_segment_size: int):
+    """
+    0..size-1 바이트를 최대 segments개의 (start, end) 구간으로 나눕니다. end는 포함 범위입니다.
+    """
+    if size <= 0:
+        return []
+    segment_size = max(min_segment_size, -(-size // max(1, segments)))
+    return [(start, min(start + segment_size, size) - 1) for start in range(0, size, segment_size)]
+
+
+class DownloadState:
+    """
+    구간 다운로드의 진행 상태. 이어받기를 위해 JSON 파일로 저장됩니다.
+
+    segments는 [start, end, 받은 바이트 수] 목록이며, 저장된 진행분까지만 신뢰합니다.
+    """
+    def __init__(self, path: str, size: int, segments: list, save_every: int = 16 * 1024 * 1024):
+        self.path = path
+        self.size = size
+        self.segments = segments
+        self.save_every = save_every
+        self._lock = threading.Lock()
+        self._unsaved = 0
+
+    @classmethod
+    def create(cls, path: str, size: int, segments: int, min_segment_size: int):
+        return cls(path, size, [[start, end, 0] for start, end in split_ranges(size, segments, min_segment_size)])
+
+    @classmethod
+    def load(cls, path: str, size: int):
+        """
+        저장된 상태를 읽습니다. 없거나 파일 크기가 달라졌으면 None을 반환합니다.
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if saved.get("size") != size:
+            return None
+        return cls(path, size, saved["segments"])
+
+    def pending(self):
+        """
+        아직 다 받지 못한 구간의 인덱스 목록
+        """
+        return [index for index, (start, end, done) in enumerate(self.segments) if start + done <= end]
+
+    def received(self) -> int:
+        """
+        각 구간에 실제로 받아 쓴 바이트 수의 합
+        """
+        with self._lock:
+            return sum(done for _, _, done in self.segments)
+
+    def advance(self, index: int, nbytes: int):
+        with self._lock:
+            self.segments[index][2] += nbytes
+            self._unsaved += nbytes
+            if self._unsaved >= self.save_every:
+                self._save_locked()
+
+    def save(self):
+        with self._lock:
+            self._save_locked()
+
+    def _save_locked(self):
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"size": self.size, "segments": self.segments}, f)
+        os.replace(temp_path, self.path)
+        self._unsaved = 0
+
+    def remove(self):
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class SegmentedFile:
+    """
+    크기를 미리 할당한 출력 파일. 여러 스레드가 서로 다른 위치에 동시에 쓸 수 있습니다.
+    """
+    def __init__(self, path: str, size: int):
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o644)
+        self._lock = threading.Lock()
+        if os.fstat(self._fd).st_size != size:
+            os.ftruncate(self._fd, size)
+            if size and hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(self._fd, 0, size)
+                except OSError:
+                    # 파일시스템이 지원하지 않으면 sparse 파일로 둡니다.
+                    pass
+
+    def write_at(self, offset: int, data: bytes):
+        data = memoryview(data)
+        if hasattr(os, "pwrite"):
+            while data:
+                written = os.pwrite(self._fd, data, offset)
+                data = data[written:]
+                offset += written
+            return
+        with self._lock:
+            os.lseek(self._fd, offset, os.SEEK_SET)
+            while data:
+                data = data[os.write(self._fd, data):]
+
+    def close(self):
+        os.close(self._fd)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+def hash_file(path: str, algorithm: str = "sha256", chunk_size: int = 1024 * 1024) -> str:
+    """
+    파일을 chunk_size 단위로 읽어 해시를 계산합니다. 파일 크기와 관계없이 메모리 사용량이 일정합니다.
+    """
+    digest = hashlib.new(algorithm)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
@@ -0,0 +1,159 @@
+import gzip
+import json
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+
+class DriveIndex:
+    """
+    드라이브 탐색 결과의 경로 ↔ id 색인.
+
+    항목마다 (path, type, size, lastUpdatedAt)만 보관하므로 원본 응답보다 훨씬 작고,
+    이전 탐색의 색인과 diff()로 비교해 변경 사항을 찾을 수 있습니다.
+    """
+    def __init__(self, entries: dict = None):
+        self.entries = entries or {}
+        self._path_to_id = {entry[0]: file_id for file_id, entry in self.entries.items()}
+
+    @classmethod
+    def from_walk(cls, records):
+        index = cls()
+        for path, item in records:
+            index.add(path, item)
+        return index
+
+    def add(self, path: str, item: dict):
+        file_id = item["id"]
+        self.entries[file_id] = (path, item.get("type"), item.get("size"), item.get("lastUpdatedAt"))
+        self._path_to_id[path] = file_id
+
+    def remove(self, file_id: str):
+        entry = self.entries.pop(file_id, None)
+        if entry is not None and self._path_to_id.get(entry[0]) == file_id:
+            del self._path_to_id[entry[0]]
+
+    def relocate(self, old_path: str, new_path: str):
+        """
+        이름이 바뀌거나 옮겨진 폴더의 하위 항목 경로를 old_path에서 new_path 아래로 바꿉니다.
+        """
+        prefix = old_path + "/"
+        for file_id, entry in list(self.entries.items()):
+            if entry[0].startswith(prefix):
+                path = new_path + "/" + entry[0][len(prefix):]
+                if self._path_to_id.get(entry[0]) == file_id:
+                    del self._path_to_id[entry[0]]
+                self.entries[file_id] = (path,) + tuple(entry[1:])
+                self._path_to_id[path] = file_id
+
+    def id_of(self, path: str):
+        return self._path_to_id.get(path.strip("/"))
+
+    def path_of(self, file_id: str):
+        entry = self.entries.get(file_id)
+        return entry[0] if entry is not None else None
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, path: str):
+        return path.strip("/") in self._path_to_id
+
+    def diff(self, previous: "DriveIndex") -> dict:
+        """
+        previous 이후의 변경 사항을 반환합니다. 파일 id 기준으로 비교하므로 이름 변경/이동은 moved로 구분됩니다.
+        """
+        added, removed, modified, moved = [], [], [], []
+        for file_id, entry in self.entries.items():
+            old = previous.entries.get(file_id)
+            if old is None:
+                added.append(entry[0])
+                continue
+            if old[0] != entry[0]:
+                moved.append((old[0], entry[0]))
+            if old[2:] != entry[2:]:
+                modified.append(entry[0])
+        for file_id, entry in previous.entries.items():
+            if file_id not in self.entries:
+                removed.append(entry[0])
+        return {"added": sorted(added), "removed": sorted(removed), "modified": sorted(modified),
+                "moved": sorted(moved)}
+
+    def save(self, path: str):
+        """
+        gzip으로 압축한 JSON 파일로 저장합니다.
+        """
+        with gzip.open(path, "wt", encoding="utf-8") as f:
+            json.dump({file_id: list(entry) for file_id, entry in self.entries.items()}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: str):
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return cls({file_id: tuple(entry) for file_id, entry in json.load(f).items()})
+
+
+class DriveWalker:
+    """
+    드라이브의 폴더 트리를 너비 우선으로 탐색하며 (경로, 파일) 레코드를 하나씩 반환합니다.
+
+        walker = DriveWalker(client, drive_id, max_workers=8, max_depth=3)
+        for path, item in walker.walk():
+            ...
+        index = walker.build_index()
+
+    폴더 목록 조회는 최대 max_workers개까지 동시에 진행되며, 결과는 폴더 순서대로 반환됩니다.
+
+    :param root_id: 탐색을 시작할 폴더 id. None이면 드라이브 최상위부터 탐색합니다.
+    :param max_depth: 최대 깊이. 시작 폴더의 자식이 깊이 1입니다.
+    :param type: 반환할 항목의 type (예: "folder", "file"). 탐색 자체는 모든 폴더에 대해 진행됩니다.
+    :param subTypes: 반환할 항목의 subType 목록(쉼표로 구분)
+    """
+    def __init__(self, client, drive_id: str, root_id: str = None, max_workers: int = 8, max_depth: int = None,
+                 type: str = None, subTypes: str = None, page_size: int = 100):
+        self.client = client
+        self.drive_id = drive_id
+        self.root_id = root_id
+        self.max_workers = max_workers
+        self.max_depth = max_depth
+        self.type = type
+        self.sub_types = set(subTypes.split(",")) if subTypes else None
+        self.page_size = page_size
+
+    def _list(self, folder_id: str):
+        return list(self.client.iter_files(self.drive_id, parentId=folder_id, size=self.page_size, max_workers=1))
+
+    def _matches(self, item: dict) -> bool:
+        if self.type is not None and item.get("type") != self.type:
+            return False
+        if self.sub_types is not None and item.get("subType") not in self.sub_types:
+            return False
+        return True
+
+    def walk(self):
+        """
+        (경로, 파일) 레코드를 너비 우선 순서로 반환하는 제너레이터
+        """
+        waiting = deque([(self.root_id, "", 0)])
+        running = deque()
+        executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+        try:
+            while waiting or running:
+                while waiting and len(running) < self.max_workers:
+                    folder_id, path, depth = waiting.popleft()
+                    running.append((executor.submit(self._list, folder_id), path, depth))
+                future, parent_path, depth = running.popleft()
+                for item in future.result():
+                    path = f"{parent_path}/{item['name']}" if parent_path else item["name"]
+                    if item.get("type") == "folder" and (self.max_depth is None or depth + 1 < self.max_depth):
+                        waiting.append((item["id"], path, depth + 1))
+                    if self._matches(item):
+                        yield path, item
+        finally:
+            for future, _, _ in running:
+                future.cancel()
+            executor.shutdown(wait=True)
+
+    def build_index(self) -> DriveIndex:
+        """
+        전체를 탐색해 DriveIndex를 만듭니다. 이전 색인과 diff()로 비교하면 변경 사항을 얻을 수 있습니다.
+        """
+        return DriveIndex.from_walk(self.walk())
@@ -0,0 +1,525 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs, urlsplit
+
+import requests
+
+from .models import json_loads
+
+logger = logging.getLogger("doorayapi")
+
+MAX_BODY = 1024 * 1024
+# 이벤트 종류가 들어 있는 필드. 앞에서부터 먼저 있는 값을 사용합니다.
+TYPE_FIELDS = ("hookEventType", "webhookType", "eventType", "type")
+ID_FIELDS = ("hookEventId", "eventId", "id")
+STATUS_TEXT = {200: "OK", 400: "Bad Request", 403: "Forbidden", 404: "Not Found", 405: "Method Not Allowed",
+               413: "Payload Too Large"}
+
+
+def _object_id(payload: dict, name: str, field: str):
+    value = payload.get(name)
+    if isinstance(value, dict) and value.get("id"):
+        return str(value["id"])
+    return str(payload[field]) if payload.get(field) else None
+
+
+class HookEvent:
+    """
+    Dooray! Hook 요청 본문 하나를 해석한 결과.
+
+    이벤트 종류와 관련 리소스 id(project_id, post_id, wiki_id, page_id, drive_id, file_id, parent_id)를
+    {"project": {"id": ...}} 형태의 객체 필드 또는 "projectId" 같은 id 필드에서 찾습니다.
+    count는 합쳐진(coalesce) 같은 리소스의 이벤트 수입니다.
+    """
+    __slots__ = ("type", "payload", "key", "received_at", "count", "project_id", "post_id", "wiki_id", "page_id",
+                 "drive_id", "file_id", "parent_id")
+
+    def __init__(self, payload: dict, received_at: float = None):
+        self.payload = payload
+        self.received_at = time.time() if received_at is None else received_at
+        self.count = 1
+        self.type = next((str(payload[field]) for field in TYPE_FIELDS if payload.get(field)), "unknown")
+        self.project_id = _object_id(payload, "project", "projectId")
+        self.post_id = _object_id(payload, "post", "postId")
+        self.wiki_id = _object_id(payload, "wiki", "wikiId")
+        self.page_id = _object_id(payload, "page", "pageId")
+        self.drive_id = _object_id(payload, "drive", "driveId")
+        self.file_id = _object_id(payload, "file", "fileId")
+        page, file = payload.get("page") or {}, payload.get("file") or {}
+        self.wiki_id = self.wiki_id or page.get("wikiId")
+        self.drive_id = self.drive_id or file.get("driveId")
+        self.parent_id = page.get("parentPageId") or file.get("parentId") or payload.get("parentId")
+
+        event_id = next((payload[field] for field in ID_FIELDS if payload.get(field)), None)
+        if event_id is None:
+            # id가 없으면 본문 전체로 중복을 판단합니다.
+            canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+            event_id = hashlib.sha1(canonical).hexdigest()
+        self.key = str(event_id)
+
+    @property
+    def resource(self) -> tuple:
+        """
+        이벤트가 가리키는 가장 구체적인 리소스. 같은 종류, 같은 리소스의 이벤트는 하나로 합쳐집니다.
+        """
+        if self.page_id:
+            return "page", self.wiki_id, self.page_id
+        if self.file_id:
+            return "file", self.drive_id, self.file_id
+        if self.post_id:
+            return "post", self.project_id, self.post_id
+        for kind in ("wiki", "drive", "project"):
+            value = getattr(self, f"{kind}_id")
+            if value:
+                return (kind, value)
+        return ("event", self.key)
+
+    def endpoints(self) -> list:
+        """
+        이벤트로 바뀌었을 수 있는 API 엔드포인트. ResponseCache.invalidate는 상위 목록도 함께 지웁니다.
+        """
+        endpoints = []
+        if self.wiki_id:
+            endpoints.append(f"/wiki/v1/wikis/{self.wiki_id}/pages" + (f"/{self.page_id}" if self.page_id else ""))
+        if self.drive_id:
+            endpoints.append(f"/drive/v1/drives/{self.drive_id}/files" + (f"/{self.file_id}" if self.file_id else ""))
+        if self.project_id:
+            endpoints.append(f"/project/v1/projects/{self.project_id}/posts" +
+                             (f"/{self.post_id}" if self.post_id else ""))
+        return endpoints
+
+    def merge(self, other: "HookEvent"):
+        self.payload = other.payload
+        self.received_at = other.received_at
+        self.parent_id = other.parent_id or self.parent_id
+        self.count += other.count
+
+    def __repr__(self):
+        return f"HookEvent({self.type!r}, {self.resource!r}, count={self.count})"
+
+
+class HookReceiver:
+    """
+    Dooray! Hook(create_hook으로 등록한 URL)을 받는 asyncio HTTP 서버.
+
+        receiver = HookReceiver(port=8080, token="secret", coalesce=1.0)
+        receiver.on("*", invalidate_cache(client.cache))
+        receiver.on("postCreated", lambda event: print(event.post_id))
+        receiver.run()  # 또는 async with receiver: ...
+
+        client.create_hook(project_id, "https://example.com:8080/?token=secret", ["postCreated"])
+
+    요청 본문을 큐에 넣은 즉시 200으로 응답하고, 처리는 응답과 별도로 진행합니다.
+    dedupe_ttl초 안에 다시 받은 같은 이벤트(같은 id 또는 같은 본문)는 버리고,
+    coalesce초 동안 모인 같은 종류, 같은 리소스의 이벤트는 마지막 본문 하나로 합쳐 처리합니다.
+
+    핸들러는 받은 순서대로 하나씩 호출됩니다. 코루틴 함수는 이벤트 루프에서, 일반 함수는 스레드 풀에서
+    실행되므로 클라이언트 호출처럼 블로킹되는 작업도 그대로 핸들러로 쓸 수 있습니다.
+
+    :param token: 지정하면 URL의 token 쿼리 값이 같은 요청만 받습니다.
+    :param record: 받은 본문을 NDJSON으로 덧붙여 기록할 파일 경로. replay()로 다시 재생할 수 있습니다.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, path: str = "/", token: str = None,
+                 coalesce: float = 0.5, dedupe_ttl: float = 600, dedupe_size: int = 10000, record: str = None,
+                 max_body: int = MAX_BODY, max_workers: int = 4):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.token = token
+        self.coalesce = coalesce
+        self.dedupe_ttl = dedupe_ttl
+        self.dedupe_size = dedupe_size
+        self.record = record
+        self.max_body = max_body
+        self.max_workers = max_workers
+        self._handlers = []
+        self._seen = OrderedDict()
+        self._pending = OrderedDict()
+        self._flush_handle = None
+        self._tasks = set()
+        self._server = None
+        self._executor = None
+        self._record_file = None
+        self._dispatch_lock = None
+
+        self.received = 0
+        self.duplicates = 0
+        self.coalesced = 0
+        self.dispatched = 0
+        self.rejected = 0
+        self.errors = 0
+
+    def on(self, event_type="*", handler=None, batch: bool = False):
+        """
+        핸들러를 등록합니다. 데코레이터로도 사용할 수 있습니다.
+
+        :param event_type: 이벤트 종류, 종류 목록 또는 "*"(모든 이벤트)
+        :param batch: True이면 한 번에 모인 이벤트 목록으로 한 번만 호출합니다.
+        """
+        types = None if event_type == "*" else ({event_type} if isinstance(event_type, str) else set(event_type))
+
+        def register(fn):
+            self._handlers.append((types, fn, batch))
+            return fn
+
+        return register(handler) if handler is not None else register
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}{self.path}"
+
+    async def start(self):
+        self._executor = ThreadPoolExecutor(max_workers=max(1, self.max_workers))
+        self._dispatch_lock = asyncio.Lock()
+        if self.record:
+            self._record_file = open(self.record, "a", encoding="utf-8")
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        """
+        서버를 닫고 남은 이벤트를 모두 처리합니다.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.flush()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self._record_file is not None:
+            self._record_file.close()
+            self._record_file = None
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.stop()
+
+    async def serve_forever(self):
+        async with self:
+            await self._server.serve_forever()
+
+    def run(self):
+        """
+        serve_forever를 실행합니다. Ctrl+C로 종료할 수 있습니다.
+        """
+        try:
+            asyncio.run(self.serve_forever())
+        except KeyboardInterrupt:
+            pass
+
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b"\r\n\r\n")
+                except (asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+                    break
+                request_line, *lines = head.decode("latin-1").split("\r\n")
+                method, target, version = (request_line.split(" ", 2) + ["", ""])[:3]
+                headers = {}
+                for line in lines:
+                    if ":" in line:
+                        name, value = line.split(":", 1)
+                        headers[name.strip().lower()] = value.strip()
+
+                try:
+                    if headers.get("transfer-encoding", "").lower() == "chunked":
+                        body = await self._read_chunked(reader)
+                    else:
+                        length = int(headers.get("content-length") or 0)
+                        if length < 0:
+                            raise ValueError(length)
+                        body = await reader.readexactly(length) if length <= self.max_body else None
+                except ValueError:
+                    self.rejected += 1
+                    status, body = 400, None
+                else:
+                    if body is None or len(body) > self.max_body:
+                        status = 413
+                    else:
+                        status = self._accept(method, target, body)
+
+                # 본문을 끝까지 읽지 못했으면 다음 요청의 시작을 알 수 없으므로 연결을 닫습니다.
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close" \
+                    and body is not None and status != 413
+                response = json.dumps({"ok": status == 200}).encode("utf-8")
+                writer.write((f"{version or 'HTTP/1.1'} {status} {STATUS_TEXT[status]}\r\n"
+                              f"Content-Type: application/json\r\nContent-Length: {len(response)}\r\n"
+                              f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n").encode("latin-1")
+                             + response)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _read_chunked(self, reader: asyncio.StreamReader):
+        chunks, size = [], 0
+        while True:
+            length = int((await reader.readline()).split(b";")[0].strip() or b"0", 16)
+            if length == 0:
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                return b"".join(chunks)
+            size += length
+            if size > self.max_body:
+                return None
+            chunks.append(await reader.readexactly(length))
+            await reader.readline()
+
+    def _accept(self, method: str, target: str, body: bytes) -> int:
+        split = urlsplit(target)
+        if split.path != self.path:
+            status = 404
+        elif method != "POST":
+            status = 405
+        elif self.token is not None and not hmac.compare_digest(
+                (parse_qs(split.query).get("token", [""])[-1]).encode("utf-8"), self.token.encode("utf-8")):
+            status = 403
+        else:
+            try:
+                payload = json_loads(body)
+            except ValueError:
+                payload = None
+            if isinstance(payload, dict):
+                self.feed(payload)
+                return 200
+            status = 400
+        self.rejected += 1
+        return status
+
+    def feed(self, payload: dict, received_at: float = None) -> bool:
+        """
+        본문 하나를 처리 대기열에 넣습니다. 이벤트 루프 안에서 호출해야 하며, 중복이면 False를 반환합니다.
+        """
+        event = HookEvent(payload, received_at)
+        self.received += 1
+        now = time.monotonic()
+        while self._seen and (len(self._seen) >= self.dedupe_size
+                              or next(iter(self._seen.values())) <= now - self.dedupe_ttl):
+            self._seen.popitem(last=False)
+        if event.key in self._seen:
+            self.duplicates += 1
+            return False
+        self._seen[event.key] = now
+        if self._record_file is not None:
+            self._record_file.write(json.dumps({"receivedAt": event.received_at, "payload": payload},
+                                               ensure_ascii=False) + "\n")
+            self._record_file.flush()
+
+        coalesce_key = (event.type, event.resource)
+        pending = self._pending.get(coalesce_key)
+        if pending is not None:
+            pending.merge(event)
+            self.coalesced += 1
+        else:
+            self._pending[coalesce_key] = event
+        if self._flush_handle is None:
+            loop = asyncio.get_running_loop()
+            self._flush_handle = loop.call_later(self.coalesce, self._schedule_flush)
+        return True
+
+    def _schedule_flush(self):
+        self._flush_handle = None
+        task = asyncio.ensure_future(self._dispatch_pending())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch_pending(self):
+        events = list(self._pending.values())
+        self._pending.clear()
+        if self._dispatch_lock is None:
+            self._dispatch_lock = asyncio.Lock()
+        async with self._dispatch_lock:
+            if events:
+                await self._dispatch(events)
+
+    async def flush(self):
+        """
+        대기 중인 이벤트를 바로 핸들러에 전달하고, 진행 중인 처리가 끝날 때까지 기다립니다.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        await self._dispatch_pending()
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def _dispatch(self, events: list):
+        loop = asyncio.get_running_loop()
+        for types, handler, batch in self._handlers:
+            matched = [event for event in events if types is None or event.type in types]
+            if not matched:
+                continue
+            for argument in ([matched] if batch else matched):
+                try:
+                    if asyncio.iscoroutinefunction(handler):
+                        await handler(argument)
+                    else:
+                        await loop.run_in_executor(self._executor, handler, argument)
+                except Exception:
+                    self.errors += 1
+                    logger.exception("Hook 핸들러 %r 실행 중 오류가 발생했습니다.", handler)
+        self.dispatched += len(events)
+
+    def stats(self) -> dict:
+        return {"received": self.received, "duplicates": self.duplicates, "coalesced": self.coalesced,
+                "dispatched": self.dispatched, "rejected": self.rejected, "errors": self.errors,
+                "pending": len(self._pending)}
+
+
+def invalidate_cache(cache):
+    """
+    이벤트가 가리키는 엔드포인트(와 상위 목록)의 ResponseCache 항목을 지우는 핸들러.
+    """
+    async def handler(event: HookEvent):
+        for endpoint in event.endpoints():
+            cache.invalidate(endpoint)
+
+    return handler
+
+
+def refresh_wiki_tree(crawler, tree):
+    """
+    바뀐 페이지만 WikiCrawler.refresh로 다시 가져오는 배치 핸들러. (receiver.on("*", ..., batch=True))
+    트리에 없는 새 페이지는 상위 페이지를 다시 가져와 추가합니다.
+    """
+    def handler(events: list):
+        page_ids = []
+        for event in events:
+            if event.wiki_id != crawler.wiki_id or not event.page_id:
+                continue
+            page_id = event.page_id if event.page_id in tree else event.parent_id
+            if page_id in tree:
+                page_ids.append(page_id)
+        if page_ids:
+            crawler.refresh(tree, page_ids)
+
+    return handler
+
+
+def refresh_drive_index(client, index, drive_id: str, root_id: str = None):
+    """
+    바뀐 파일만 get_file_meta로 다시 가져와 DriveIndex를 갱신하는 배치 핸들러.
+    삭제된 파일은 색인에서 제거하고, 이름이 바뀌거나 옮겨진 폴더는 하위 항목의 경로도 바꿉니다.
+    상위 폴더가 색인에 없는 파일은 건너뜁니다.
+
+    :param root_id: DriveWalker의 root_id. 이 폴더 바로 아래 파일의 경로는 파일 이름입니다.
+        None이면 드라이브 최상위 폴더(parentId가 없는 폴더)를 처음 만났을 때 확인해 사용합니다.
+    """
+    roots = {root_id} if root_id is not None else set()
+    not_roots = set()
+
+    def is_root(folder_id: str) -> bool:
+        if folder_id in roots:
+            return True
+        if root_id is not None or folder_id is None or folder_id in not_roots:
+            return False
+        # DriveWalker(root_id=None)의 색인에는 최상위 폴더가 없으므로 parentId가 없는 폴더인지 확인합니다.
+        folder = client.get_file_meta(drive_id, folder_id).get("result") or {}
+        if folder.get("parentId") is None:
+            roots.add(folder_id)
+            return True
+        not_roots.add(folder_id)
+        return False
+
+    def handler(events: list):
+        for file_id in dict.fromkeys(event.file_id for event in events
+                                     if event.drive_id == drive_id and event.file_id):
+            try:
+                item = client.get_file_meta(drive_id, file_id).get("result") or {}
+            except requests.HTTPError as error:
+                if error.response is not None and error.response.status_code == 404:
+                    index.remove(file_id)
+                    continue
+                raise
+            parent_id = item.get("parentId")
+            parent_path = index.path_of(parent_id)
+            if parent_path is None:
+                if not is_root(parent_id):
+                    continue
+                parent_path = ""
+            path = f"{parent_path}/{item['name']}" if parent_path else item["name"]
+            old_path = index.path_of(file_id)
+            index.remove(file_id)
+            index.add(path, item)
+            if old_path is not None and old_path != path and item.get("type") == "folder":
+                index.relocate(old_path, path)
+
+    return handler
+
+
+def load_recording(path: str):
+    """
+    HookReceiver(record=...)가 기록한 파일에서 (receivedAt, 본문)을 하나씩 읽습니다.
+    본문만 한 줄씩 있는 NDJSON 파일도 읽을 수 있습니다.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record = json.loads(line)
+                if set(record) == {"receivedAt", "payload"}:
+                    yield record["receivedAt"], record["payload"]
+                else:
+                    yield None, record
+
+
+async def replay(target, payloads, speed: float = None) -> int:
+    """
+    기록된 본문을 다시 보내고 보낸 수를 반환합니다. 테스트나 핸들러 개발에 사용합니다.
+
+        await replay(receiver, load_recording("hooks.ndjson"))              # 서버를 거치지 않고 바로 전달
+        await replay("http://127.0.0.1:8080/?token=secret", load_recording("hooks.ndjson"), speed=10)
+
+    :param target: HookReceiver 또는 Hook URL. URL이면 keep-alive 연결 하나로 HTTP 요청을 보냅니다.
+    :param payloads: 본문 또는 (receivedAt, 본문) 목록
+    :param speed: 지정하면 기록된 receivedAt 간격을 speed배 빠르게 재현합니다. 없으면 쉬지 않고 보냅니다.
+    """
+    reader = writer = None
+    if not isinstance(target, HookReceiver):
+        split = urlsplit(target)
+        reader, writer = await asyncio.open_connection(split.hostname, split.port or 80)
+        request_target = split.path or "/"
+        if split.query:
+            request_target += "?" + split.query
+    sent, previous = 0, None
+    try:
+        for item in payloads:
+            received_at, payload = item if isinstance(item, tuple) else (None, item)
+            if speed and received_at is not None and previous is not None and received_at > previous:
+                await asyncio.sleep((received_at - previous) / speed)
+            previous = received_at if received_at is not None else previous
+            if writer is None:
+                target.feed(payload)
+            else:
+                body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+                writer.write((f"POST {request_target} HTTP/1.1\r\nHost: {split.netloc}\r\n"
+                              f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n")
+                             .encode("latin-1") + body)
+                await writer.drain()
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = next((int(line.split(b":", 1)[1]) for line in head.split(b"\r\n")
+                               if line.lower().startswith(b"content-length:")), 0)
+                await reader.readexactly(length)
+                status = int(head.split(b" ", 2)[1])
+                if status != 200:
+                    raise ValueError(f"Hook 요청이 {status}로 거부되었습니다.")
+            sent += 1
+    finally:
+        if writer is not None:
+            writer.close()
+    if isinstance(target, HookReceiver):
+        await target.flush()
+    return sent
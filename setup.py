@@ -1,13 +1,19 @@
 # setup.py
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name="dooray-api-client",  # 패키지 이름
     version="0.1.0",  # 버전 번호
-    packages=find_packages(),  # 자동으로 서브패키지 포함
+    # 소스 디렉터리 이름(dooray-api-client)과 달리 doorayapi로 설치합니다.
+    packages=["doorayapi"],
+    package_dir={"doorayapi": "dooray-api-client"},
     install_requires=[  # 의존성 라이브러리
         "requests>=2.25.1",
     ],
+    extras_require={  # 선택 의존성
+        "async": ["aiohttp>=3.7"],
+        "fast": ["orjson>=3"],
+    },
     author="Mr21percent",
     author_email="mr21percent@gmail.com",
     description="A Python client for interacting with Dooray! API",
@@ -0,0 +1,24 @@
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+import bootstrap  # noqa: E402,F401  (설치 없이 doorayapi를 불러옵니다)
+from doorayapi.client import DoorayAPIClient  # noqa: E402
+from mock_server import MockDooray  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    with MockDooray(files=50) as server:
+        yield server
+
+
+@pytest.fixture
+def client(server):
+    with DoorayAPIClient("test-token") as client:
+        client.base_url = server.base_url
+        yield client
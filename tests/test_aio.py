@@ -0,0 +1,115 @@
+import asyncio
+import threading
+
+import aiohttp
+import pytest
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID, MockDooray
+
+from doorayapi.aio import AsyncDoorayAPIClient
+from doorayapi.instrumentation import Instrumentation
+from doorayapi.transfer import MultipartEncoder
+
+
+def connect(server, **options):
+    client = AsyncDoorayAPIClient("test-token", **options)
+    client.base_url = server.base_url
+    return client
+
+
+def test_requests_and_pages(server):
+    async def run():
+        async with connect(server) as client:
+            drive = await client.get_drive(DRIVE_ID)
+            items = [item async for item in client.iter_files(DRIVE_ID, parentId=ROOT_FOLDER_ID, size=20)]
+            with pytest.raises(aiohttp.ClientResponseError) as error:
+                await client.get_file_meta(DRIVE_ID, "missing")
+            return drive, items, error.value.status
+
+    drive, items, status = asyncio.run(run())
+    assert drive["result"]["id"] == DRIVE_ID
+    assert len(items) == 50 and len({item["id"] for item in items}) == 50
+    assert status == 404
+
+
+def test_upload_and_download_round_trip(server, tmp_path):
+    upload = tmp_path / "upload.bin"
+    upload.write_bytes(bytes(range(256)) * 4000)
+    progress = []
+
+    async def run():
+        async with connect(server) as client:
+            result = await client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, str(upload),
+                                              progress=lambda sent, total: progress.append((sent, total)))
+            file_id = result["result"]["id"]
+            await client.download_file(DRIVE_ID, file_id, str(tmp_path / "one.bin"))
+            await client.download_file(DRIVE_ID, file_id, str(tmp_path / "four.bin"), segments=4)
+
+    asyncio.run(run())
+    assert (tmp_path / "one.bin").read_bytes() == upload.read_bytes()
+    assert (tmp_path / "four.bin").read_bytes() == upload.read_bytes()
+    assert progress[-1][0] == progress[-1][1] > 1024000
+
+
+def test_upload_reads_file_off_the_event_loop(server, tmp_path, monkeypatch):
+    upload = tmp_path / "upload.bin"
+    upload.write_bytes(b"x" * 4 * 1024 * 1024)
+    read = MultipartEncoder._read
+    read_threads, progress_threads = set(), set()
+
+    def slow_read(self, size):
+        # 느린 디스크를 흉내 냅니다. 이벤트 루프에서 읽으면 아래 타이머가 멈춥니다.
+        read_threads.add(threading.get_ident())
+        threading.Event().wait(0.05)
+        return read(self, size)
+
+    monkeypatch.setattr(MultipartEncoder, "_read", slow_read)
+
+    async def tick(stop: asyncio.Event, ticks: list):
+        while not stop.is_set():
+            ticks.append(None)
+            await asyncio.sleep(0.005)
+
+    async def run():
+        stop, ticks = asyncio.Event(), []
+        ticker = asyncio.ensure_future(tick(stop, ticks))
+        async with connect(server) as client:
+            await client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, str(upload),
+                                     progress=lambda sent, total: progress_threads.add(threading.get_ident()))
+        stop.set()
+        await ticker
+        return len(ticks)
+
+    ticks = asyncio.run(run())
+    loop_thread = threading.get_ident()
+    assert read_threads and loop_thread not in read_threads
+    # progress 콜백은 이벤트 루프 스레드에서 호출합니다.
+    assert progress_threads == {loop_thread}
+    assert ticks >= 20
+
+
+def test_max_concurrency_limits_requests_in_flight():
+    instrumentation = Instrumentation(metrics=False)
+    lock = threading.Lock()
+    in_flight, peak = [0], [0]
+
+    def started(event):
+        with lock:
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+
+    def finished(event):
+        with lock:
+            in_flight[0] -= 1
+
+    instrumentation.on_request(started)
+    instrumentation.on_response(finished)
+
+    async def run():
+        async with connect(server, max_concurrency=3, instrumentation=instrumentation) as client:
+            return await asyncio.gather(*(client.get_drive(DRIVE_ID) for _ in range(12)))
+
+    with MockDooray(files=0, latency=0.05) as server:
+        results = asyncio.run(run())
+        assert server.requests == 12
+    assert len(results) == 12
+    assert peak[0] == 3
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+import requests
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID
+
+from doorayapi.aio import AsyncDoorayAPIClient
+from doorayapi.cache import ResponseCache
+from doorayapi.client import DoorayAPIClient
+
+
+@pytest.fixture
+def cached_client(server):
+    with DoorayAPIClient("test-token", cache=ResponseCache(ttl=60)) as client:
+        client.base_url = server.base_url
+        yield client
+
+
+def test_get_is_cached(server, cached_client):
+    cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)
+    requests_before = server.requests
+    cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)
+    assert server.requests == requests_before
+    assert cached_client.cache.hits == 1
+
+
+def test_successful_write_invalidates_listing(server, cached_client):
+    before = cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)["totalCount"]
+    cached_client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "new")
+    assert cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)["totalCount"] == before + 1
+
+
+def test_failed_write_keeps_cache(server, cached_client):
+    cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)
+    with pytest.raises(requests.HTTPError):
+        cached_client.delete_file(DRIVE_ID, "missing")
+    assert cached_client.cache.invalidations == 0
+    requests_before = server.requests
+    cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)
+    assert server.requests == requests_before
+
+
+def test_upload_invalidates_listing(server, cached_client, tmp_path):
+    path = tmp_path / "upload.txt"
+    path.write_text("hello")
+    before = cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)["totalCount"]
+    cached_client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, str(path))
+    assert cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)["totalCount"] == before + 1
+
+
+def test_async_client_accepts_client_options(server):
+    async def run():
+        async with AsyncDoorayAPIClient("test-token", cache=True, retry=True, coalesce=True) as client:
+            client.base_url = server.base_url
+            first = await client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)
+            await client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "new")
+            second = await client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)
+            return client, first, second
+
+    client, first, second = asyncio.run(run())
+    assert client.retry is not None and client.singleflight is not None
+    assert second["totalCount"] == first["totalCount"] + 1
+
+
+def test_cached_results_are_independent(server, cached_client):
+    first = cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)
+    first["result"].clear()
+    second = cached_client.get_files(DRIVE_ID, parentId=ROOT_FOLDER_ID)
+    assert cached_client.cache.hits == 1
+    assert second["result"] and second is not first
+
+
+def test_get_invalidated_while_in_flight_is_not_stored():
+    cache = ResponseCache(ttl=60)
+    key, _, _ = cache.lookup("/drive/v1/drives/d/files", {"parentId": "p"})
+    assert key[0] == "GET"
+    generation = cache.generation
+    cache.invalidate("/drive/v1/drives/d/files/f/move")
+    cache.store(key, b"{}", generation=generation)
+    assert len(cache) == 0 and cache.stale == 1
+
+    # 관련 없는 경로의 무효화는 저장을 막지 않습니다.
+    generation = cache.generation
+    cache.invalidate("/wiki/v1/wikis/w/pages/p")
+    cache.store(key, b"{}", generation=generation)
+    assert len(cache) == 1
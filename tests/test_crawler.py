@@ -0,0 +1,25 @@
+from mock_server import ROOT_PAGE_ID, WIKI_ID
+
+from doorayapi.crawler import WikiCrawler
+
+
+def test_refresh_moves_page_to_new_parent(server, client):
+    guide = client.create_wiki_page(WIKI_ID, ROOT_PAGE_ID, "Guide", "")["result"]["id"]
+    archive = client.create_wiki_page(WIKI_ID, ROOT_PAGE_ID, "Archive", "")["result"]["id"]
+    install = client.create_wiki_page(WIKI_ID, guide, "Install", "")["result"]["id"]
+    client.create_wiki_page(WIKI_ID, install, "Linux", "")
+
+    crawler = WikiCrawler(client, WIKI_ID, max_workers=4)
+    tree = crawler.crawl()
+    assert tree.find("Home/Guide/Install/Linux") is not None
+
+    server.state.pages[install]["parentPageId"] = archive
+    crawler.refresh(tree, [install])
+
+    assert tree.get(install).parent_id == archive
+    assert install not in tree.get(guide).children
+    assert install in tree.get(archive).children
+    assert tree.find("Home/Archive/Install/Linux") is not None
+    assert tree.find("Home/Guide/Install") is None and tree.find("Home/Guide/Install/Linux") is None
+    assert [node.path for node in tree.walk(archive)] == ["Home/Archive", "Home/Archive/Install",
+                                                         "Home/Archive/Install/Linux"]
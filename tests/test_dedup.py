@@ -0,0 +1,87 @@
+import json
+
+import pytest
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID
+
+from doorayapi.dedup import UploadDeduplicator, UploadStore
+
+
+@pytest.fixture
+def upload(tmp_path):
+    path = tmp_path / "template.bin"
+    path.write_bytes(b"t" * 1000)
+    return str(path)
+
+
+def test_same_drive_copy_is_recorded(server, client, upload, tmp_path):
+    folder_id = client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "copies")["result"]["id"]
+    with UploadDeduplicator(client, str(tmp_path / "uploads.json")) as dedup:
+        assert dedup.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload).deduplicated is None
+        copied = dedup.upload_file(DRIVE_ID, folder_id, upload)
+        assert copied.deduplicated == "copied"
+        again = dedup.upload_file(DRIVE_ID, folder_id, upload)
+        assert again.deduplicated == "reused"
+        assert again["result"]["id"] == copied["result"]["id"]
+        assert dedup.store.get(f"drive:{DRIVE_ID}:{ROOT_FOLDER_ID}", dedup.store.hash(upload))
+    assert server.state.files[copied["result"]["id"]]["parentId"] == folder_id
+
+
+def test_copy_gets_the_requested_name(server, client, upload, tmp_path):
+    folder_id = client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "copies")["result"]["id"]
+    renamed = tmp_path / "renamed.bin"
+    renamed.write_bytes(b"t" * 1000)
+    with UploadDeduplicator(client, str(tmp_path / "uploads.json")) as dedup:
+        dedup.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+        # 다른 폴더로 복사한 파일과 같은 폴더에 다른 이름으로 만든 복사본 모두 요청한 이름을 가집니다.
+        elsewhere = dedup.upload_file(DRIVE_ID, folder_id, str(renamed))
+        beside = dedup.upload_file(DRIVE_ID, ROOT_FOLDER_ID, str(renamed))
+        assert (elsewhere.deduplicated, beside.deduplicated) == ("copied", "copied")
+        assert dedup.upload_file(DRIVE_ID, ROOT_FOLDER_ID, str(renamed)).deduplicated == "reused"
+    for result, parent_id in ((elsewhere, folder_id), (beside, ROOT_FOLDER_ID)):
+        item = server.state.files[result["result"]["id"]]
+        assert (item["name"], item["parentId"]) == ("renamed.bin", parent_id)
+
+
+def test_without_copy_uploads_into_the_requested_folder(server, client, upload, tmp_path):
+    folder_id = client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "elsewhere")["result"]["id"]
+    with UploadDeduplicator(client, str(tmp_path / "uploads.json"), copy=False) as dedup:
+        dedup.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+        result = dedup.upload_file(DRIVE_ID, folder_id, upload)
+        assert result.deduplicated is None
+        assert dedup.upload_file(DRIVE_ID, folder_id, upload).deduplicated == "reused"
+    assert server.state.files[result["result"]["id"]]["parentId"] == folder_id
+
+
+def test_records_are_appended_and_resumed(client, upload, tmp_path):
+    store_path = str(tmp_path / "uploads.json")
+    dedup = UploadDeduplicator(client, store_path)
+    first = dedup.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+    # 기록은 로그에만 덧붙이고 전체 파일은 다시 쓰지 않습니다.
+    with open(store_path + ".log", encoding="utf-8") as f:
+        assert [json.loads(line)["op"] for line in f] == ["hash", "put"]
+    with pytest.raises(OSError):
+        open(store_path)
+
+    resumed = UploadDeduplicator(client, store_path)
+    assert resumed.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)["result"]["id"] == first["result"]["id"]
+    resumed.close()
+    dedup.close()
+    with open(store_path, encoding="utf-8") as f:
+        assert json.load(f)["version"] == UploadStore.version
+
+
+def test_store_compacts_log(tmp_path):
+    store = UploadStore(str(tmp_path / "uploads.json"), journal=True, compact_after=3)
+    for i in range(5):
+        store.put("drive:d:p", f"digest-{i}", {"id": f"file-{i}", "size": 1})
+    store.close()
+    reloaded = UploadStore(str(tmp_path / "uploads.json"))
+    assert len(reloaded.scopes["drive:d:p"]) == 5
+
+
+def test_file_hashes_are_journaled(tmp_path, upload, monkeypatch):
+    store = UploadStore(str(tmp_path / "uploads.json"), journal=True)
+    digest = store.hash(upload)
+    # close()하지 않고 다시 불러와도 로그에서 해시를 복원하므로 파일을 다시 읽지 않습니다.
+    monkeypatch.setattr("doorayapi.dedup.hash_file", lambda path: pytest.fail("파일을 다시 해시했습니다."))
+    assert UploadStore(str(tmp_path / "uploads.json")).hash(upload) == digest
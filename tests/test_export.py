@@ -0,0 +1,60 @@
+import gzip
+import json
+import os
+import time
+
+import pytest
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID, ROOT_PAGE_ID, WIKI_ID
+
+from doorayapi.export import Exporter
+
+
+def test_raw_paths_stay_inside_raw_dir(server, client, tmp_path):
+    with server.state.lock:
+        evil = server.state._add_file("../../evil.bin", ROOT_FOLDER_ID, b"evil")
+        first = server.state._add_file("same.txt", ROOT_FOLDER_ID, b"one")
+        second = server.state._add_file("same.txt", ROOT_FOLDER_ID, b"two")
+    raw_dir = tmp_path / "raw"
+    Exporter(client, file_meta=False).export(str(tmp_path / "export.ndjson.gz"), wikis=[], drives=[DRIVE_ID],
+                                             raw_dir=str(raw_dir))
+    drive_dir = raw_dir / DRIVE_ID
+    assert (drive_dir / f".._.._evil.{evil['id']}.bin").read_bytes() == b"evil"
+    assert (drive_dir / f"same.{first['id']}.txt").read_bytes() == b"one"
+    assert (drive_dir / f"same.{second['id']}.txt").read_bytes() == b"two"
+    assert not (tmp_path / "evil.bin").exists()
+
+
+def test_full_export_includes_project_drives(server, client, tmp_path):
+    server.state.drives.append({"id": "project-drive", "type": "project", "name": "project"})
+    path = str(tmp_path / "export.ndjson.gz")
+    Exporter(client, file_meta=False).export(path, wikis=[])
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        drive_ids = [record["driveId"] for record in map(json.loads, f) if record["type"] == "drive"]
+    assert drive_ids == [DRIVE_ID, "project-drive"]
+
+
+def test_failed_export_removes_temp_file(client, tmp_path, monkeypatch):
+    def fail(**params):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(client, "get_drives", fail)
+    path = str(tmp_path / "export.ndjson.gz")
+    with pytest.raises(RuntimeError):
+        Exporter(client).export(path, wikis=[])
+    assert os.listdir(tmp_path) == []
+
+
+def test_incremental_skips_unchanged_pages(server, client, tmp_path, monkeypatch):
+    first = Exporter(client).export(str(tmp_path / "full.ndjson.gz"), wikis=[WIKI_ID], drives=[])
+    time.sleep(0.01)
+    client.create_wiki_page(WIKI_ID, None, "New", "body")
+
+    fetched = []
+    get_wiki_page = client.get_wiki_page
+    monkeypatch.setattr(client, "get_wiki_page",
+                        lambda wiki_id, page_id: fetched.append(page_id) or get_wiki_page(wiki_id, page_id))
+    summary = Exporter(client, since=first["watermark"]).export(str(tmp_path / "delta.ndjson.gz"),
+                                                                wikis=[WIKI_ID], drives=[])
+    assert ROOT_PAGE_ID not in fetched
+    assert len(fetched) == 1
+    assert summary["counts"]["page"] == 1
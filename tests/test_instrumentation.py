@@ -0,0 +1,121 @@
+import json
+import logging
+
+import pytest
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID
+
+from doorayapi.client import DoorayAPIClient
+from doorayapi.instrumentation import Instrumentation, LogExporter, MetricsCollector, RequestEvent, endpoint_template
+from doorayapi.retry import RetryPolicy
+
+
+def event(method, template, elapsed, status=None, attempt=0, error=None, sent=0, received=0):
+    item = RequestEvent(method, "http://api" + template, template, attempt)
+    item.elapsed, item.status, item.error = elapsed, status, error
+    item.bytes_sent, item.bytes_received = sent, received
+    return item
+
+
+@pytest.fixture
+def metrics():
+    metrics = MetricsCollector(buckets=(0.1, 1.0))
+    for item in (event("GET", "/drive/v1/drives/{id}", 0.05, 200, received=10),
+                 event("GET", "/drive/v1/drives/{id}", 0.5, 503),
+                 event("GET", "/drive/v1/drives/{id}", 2.0, 200, attempt=1, received=10),
+                 event("POST", "/drive/v1/drives/{id}/files", 0.25, 307, sent=100),
+                 event("POST", "/drive/v1/drives/{id}/files", 0.0625, error=IOError("reset"))):
+        metrics.observe(item)
+    metrics.add_bytes("POST", "/drive/v1/drives/{id}/files", sent=50)
+    return metrics
+
+
+def test_endpoint_template_collapses_ids():
+    assert endpoint_template("/wiki/v1/wikis/123/pages/456/comments") == "/wiki/v1/wikis/{id}/pages/{id}/comments"
+    assert endpoint_template("/drive/v1/drives/d1/files/f1/shared-links") == \
+        "/drive/v1/drives/{id}/files/{id}/shared-links"
+    assert endpoint_template("/project/v1/projects/p1/milestones/") == "/project/v1/projects/{id}/milestones"
+    assert endpoint_template("/common/v1/members") == "/common/v1/members"
+
+
+def test_snapshot_aggregates_per_method_and_template(metrics):
+    assert metrics.snapshot() == {
+        "GET /drive/v1/drives/{id}": {
+            "requests": 3, "latencySum": 2.55, "statuses": {200: 2, 503: 1}, "redirects": 0, "retries": 1,
+            "errors": 0, "bytesSent": 0, "bytesReceived": 20, "latencyBuckets": {0.1: 1, 1.0: 2},
+        },
+        "POST /drive/v1/drives/{id}/files": {
+            "requests": 2, "latencySum": 0.3125, "statuses": {307: 1}, "redirects": 1, "retries": 0,
+            "errors": 1, "bytesSent": 150, "bytesReceived": 0, "latencyBuckets": {0.1: 1, 1.0: 2},
+        },
+    }
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+def test_prometheus_exposition(metrics):
+    get = 'method="GET",endpoint="/drive/v1/drives/{id}"'
+    post = 'method="POST",endpoint="/drive/v1/drives/{id}/files"'
+    assert metrics.to_prometheus(prefix="t").splitlines() == [
+        "# HELP t_request_duration_seconds Dooray API 요청 지연 시간",
+        "# TYPE t_request_duration_seconds histogram",
+        f't_request_duration_seconds_bucket{{{get},le="0.1"}} 1',
+        f't_request_duration_seconds_bucket{{{get},le="1.0"}} 2',
+        f't_request_duration_seconds_bucket{{{get},le="+Inf"}} 3',
+        f"t_request_duration_seconds_sum{{{get}}} 2.550000",
+        f"t_request_duration_seconds_count{{{get}}} 3",
+        f't_request_duration_seconds_bucket{{{post},le="0.1"}} 1',
+        f't_request_duration_seconds_bucket{{{post},le="1.0"}} 2',
+        f't_request_duration_seconds_bucket{{{post},le="+Inf"}} 2',
+        f"t_request_duration_seconds_sum{{{post}}} 0.312500",
+        f"t_request_duration_seconds_count{{{post}}} 2",
+        "# TYPE t_responses_total counter",
+        f't_responses_total{{{get},status="200"}} 2',
+        f't_responses_total{{{get},status="503"}} 1',
+        f't_responses_total{{{post},status="307"}} 1',
+        "# TYPE t_redirects_total counter",
+        f"t_redirects_total{{{post}}} 1",
+        "# TYPE t_retries_total counter",
+        f"t_retries_total{{{get}}} 1",
+        "# TYPE t_errors_total counter",
+        f"t_errors_total{{{post}}} 1",
+        "# TYPE t_bytes_sent_total counter",
+        f"t_bytes_sent_total{{{post}}} 150",
+        "# TYPE t_bytes_received_total counter",
+        f"t_bytes_received_total{{{get}}} 20",
+    ]
+
+
+def test_client_records_templated_requests(server, tmp_path):
+    upload = tmp_path / "upload.bin"
+    upload.write_bytes(b"u" * 1000)
+    instrumentation = Instrumentation()
+    started = []
+    instrumentation.on_request(started.append)
+    with DoorayAPIClient("test-token", instrumentation=instrumentation,
+                         retry=RetryPolicy(backoff_factor=0, jitter=False)) as client:
+        client.base_url = server.base_url
+        server.fail_requests = 1
+        client.get_drive(DRIVE_ID)
+        client.get_drive("other-drive")
+        client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, str(upload))
+
+    snapshot = instrumentation.metrics.snapshot()
+    drives = snapshot["GET /drive/v1/drives/{id}"]
+    assert (drives["requests"], drives["retries"], drives["statuses"]) == (3, 1, {200: 2, 503: 1})
+    # 업로드 확인 요청의 307과 파일 서버로 보낸 본문이 같은 템플릿에 기록됩니다.
+    files = snapshot["POST /drive/v1/drives/{id}/files"]
+    assert (files["requests"], files["redirects"], files["statuses"]) == (2, 1, {200: 1, 307: 1})
+    assert files["bytesSent"] > 1000
+    assert len(started) == 5
+
+
+def test_log_exporter_writes_json_and_filters_fast_requests(caplog):
+    exporter = LogExporter(logging.getLogger("doorayapi.test"), slow=1.0)
+    with caplog.at_level(logging.INFO, logger="doorayapi.test"):
+        exporter(event("GET", "/drive/v1/drives/{id}", 0.01, 200))
+        exporter(event("GET", "/drive/v1/drives/{id}", 0.01, 503))
+        exporter(event("GET", "/drive/v1/drives/{id}", 2.0, 200))
+    records = [json.loads(record.getMessage()) for record in caplog.records]
+    assert [(record["status"], record["elapsed"]) for record in records] == [(503, 0.01), (200, 2.0)]
+    assert records[0]["endpoint"] == "/drive/v1/drives/{id}"
+    assert records[0]["url"] == "http://api/drive/v1/drives/{id}"
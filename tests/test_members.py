@@ -0,0 +1,114 @@
+import threading
+import time
+
+import pytest
+from mock_server import MockDooray
+
+from doorayapi.client import DoorayAPIClient
+from doorayapi.members import MemberDirectory
+
+
+def emails(count: int, start: int = 0) -> list:
+    return [f"user{i}@example.com" for i in range(start, start + count)]
+
+
+def test_emails_are_batched_and_deduplicated(server, client):
+    directory = MemberDirectory(client, batch_size=10)
+    wanted = emails(25) + ["USER0@example.com", " user1@example.com "]
+    members = directory.resolve_emails(wanted)
+    assert directory.requests == 3
+    assert server.requests == 3
+    assert list(members) == wanted
+    assert members["USER0@example.com"]["id"] == "member-0"
+    assert members[" user1@example.com "]["userCode"] == "user1"
+    assert len(directory) == 25
+
+    # 색인된 멤버는 다른 키로 찾아도 조회하지 않습니다.
+    assert directory.resolve_user_codes(["user3"])["user3"]["id"] == "member-3"
+    assert directory.resolve_emails(emails(5))["user4@example.com"]["id"] == "member-4"
+    assert server.requests == 3
+
+
+def test_user_codes_and_idp_ids_are_looked_up_one_by_one(server, client):
+    directory = MemberDirectory(client)
+    members = directory.resolve_user_codes(["user1", "user2"])
+    assert members["user2"]["externalEmailAddress"] == "user2@example.com"
+    assert directory.resolve_id_provider_user_ids(["idp-5"])["idp-5"]["id"] == "member-5"
+    assert directory.requests == 3
+    with pytest.raises(ValueError):
+        directory.resolve("nickname", ["x"])
+
+
+def test_unknown_members_are_cached_for_negative_ttl(server, client):
+    directory = MemberDirectory(client, negative_ttl=0.2)
+    assert directory.resolve_emails(["nobody@example.com"]) == {"nobody@example.com": None}
+    assert directory.resolve_emails(["nobody@example.com"]) == {"nobody@example.com": None}
+    assert directory.requests == 1
+    time.sleep(0.25)
+    directory.resolve_emails(["nobody@example.com"])
+    assert directory.requests == 2
+
+
+def test_concurrent_lookups_share_one_request():
+    with MockDooray(files=0, members=10, latency=0.2) as server:
+        with DoorayAPIClient("test-token") as client:
+            client.base_url = server.base_url
+            directory = MemberDirectory(client)
+            barrier = threading.Barrier(4)
+            results = []
+
+            def resolve():
+                barrier.wait()
+                results.append(directory.resolve_emails(["user1@example.com"])["user1@example.com"]["id"])
+
+            threads = [threading.Thread(target=resolve) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        assert results == ["member-1"] * 4
+        assert (directory.requests, server.requests) == (1, 1)
+
+
+def test_failed_lookup_is_not_cached(client, monkeypatch):
+    directory = MemberDirectory(client)
+    iter_members = client.iter_members
+
+    def failing(**params):
+        raise IOError("down")
+
+    monkeypatch.setattr(client, "iter_members", failing)
+    with pytest.raises(IOError):
+        directory.resolve_emails(["user1@example.com"])
+    monkeypatch.setattr(client, "iter_members", iter_members)
+    assert directory.resolve_emails(["user1@example.com"])["user1@example.com"]["id"] == "member-1"
+
+
+def test_snapshot_round_trip_and_expiry(server, client, tmp_path):
+    path = str(tmp_path / "members.json")
+    directory = MemberDirectory(client)
+    directory.resolve_emails(emails(3) + ["nobody@example.com"])
+    directory.save_snapshot(path)
+
+    restored = MemberDirectory(client)
+    # 찾지 못한 값은 저장하지 않습니다.
+    assert restored.load_snapshot(path) == 3
+    requests_before = server.requests
+    assert restored.resolve_emails(emails(3))["user2@example.com"]["id"] == "member-2"
+    assert restored.get("idProviderUserId", "idp-1")["id"] == "member-1"
+    assert server.requests == requests_before
+
+    short = MemberDirectory(client, ttl=0.1)
+    short.resolve_emails(emails(2))
+    short.save_snapshot(path)
+    time.sleep(0.15)
+    assert MemberDirectory(client).load_snapshot(path) == 0
+    assert MemberDirectory(client).load_snapshot(str(tmp_path / "missing.json")) == 0
+
+
+def test_referrers_skip_unknown_members():
+    members = [{"id": "member-1"}, None, {"id": "member-2"}]
+    assert MemberDirectory.referrers(members) == [
+        {"type": "member", "member": {"organizationMemberId": "member-1"}},
+        {"type": "member", "member": {"organizationMemberId": "member-2"}},
+    ]
@@ -0,0 +1,17 @@
+import time
+
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID
+
+
+def test_listing_returns_seeded_files(client, server):
+    items = list(client.iter_files(DRIVE_ID, parentId=ROOT_FOLDER_ID, size=20))
+    assert len(items) == 50
+    assert len({item["id"] for item in items}) == 50
+
+
+def test_requests_are_not_delayed_by_nagle(client):
+    started = time.monotonic()
+    for _ in range(20):
+        client.get_drive(DRIVE_ID)
+    # 지연 ACK(약 40ms)를 기다리면 20번에 0.8초 이상 걸립니다.
+    assert time.monotonic() - started < 0.5
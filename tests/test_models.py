@@ -0,0 +1,95 @@
+import types
+
+import pytest
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID, ROOT_PAGE_ID, WIKI_ID
+
+import doorayapi.models
+from doorayapi.client import DoorayAPIClient
+from doorayapi.models import (Body, Drive, DriveFile, Record, Response, Tag, WikiPage, json_loads,
+                              parse_response)
+
+
+@pytest.fixture
+def typed(server):
+    with DoorayAPIClient("test-token", typed=True) as client:
+        client.base_url = server.base_url
+        yield client
+
+
+def test_typed_responses_match_dict_responses(client, typed):
+    for call, result_model in ((lambda c: c.get_drive(DRIVE_ID), Drive),
+                               (lambda c: c.get_wiki_page(WIKI_ID, ROOT_PAGE_ID), WikiPage)):
+        plain, model = call(client), call(typed)
+        assert isinstance(model, Response)
+        assert isinstance(model.result, result_model)
+        assert model.result.to_dict() == plain["result"]
+        assert model["header"]["isSuccessful"] is True
+
+    plain, model = client.get_tags("project-1", size=20), typed.get_tags("project-1", size=20)
+    assert all(isinstance(item, Tag) for item in model)
+    assert [item.to_dict() for item in model] == plain["result"]
+    assert len(model) == 20
+    assert model.get("totalCount") == plain["totalCount"]
+
+
+def test_typed_iterators_yield_models(client, typed):
+    plain = list(client.iter_files(DRIVE_ID, parentId=ROOT_FOLDER_ID, size=20))
+    models = list(typed.iter_files(DRIVE_ID, parentId=ROOT_FOLDER_ID, size=20))
+    assert all(isinstance(item, DriveFile) for item in models)
+    assert [item.to_dict() for item in models] == plain
+    assert models[0]["name"] == models[0].name == plain[0]["name"]
+
+
+def test_nested_fields_are_decoded_on_first_access():
+    data = {"id": "p1", "subject": "Home", "body": {"mimeType": "text/x-markdown", "content": "# hi"},
+            "creator": {"type": "member", "member": {"organizationMemberId": "m1"}}}
+    page = WikiPage.from_dict(data)
+    assert type(object.__getattribute__(page, "_body")) is dict
+    assert isinstance(page.body, Body)
+    assert object.__getattribute__(page, "_body") is page.body
+    assert page["body"]["content"] == "# hi"
+    assert page.creator.member.organizationMemberId == "m1"
+    assert page.to_dict() == data
+
+
+def test_model_mapping_access_and_round_trip():
+    data = {"id": "f1", "name": "a.txt", "type": "file", "size": 3, "custom": {"flag": True}}
+    item = DriveFile.from_dict(data)
+    assert item["name"] == item.get("name") == "a.txt"
+    assert isinstance(item["custom"], Record) and item["custom"].flag is True
+    assert item.get("mimeType") is None and item.get("mimeType", "x") == "x"
+    assert "size" in item and "mimeType" not in item
+    with pytest.raises(KeyError):
+        item["missing"]
+    assert item.to_dict() == data
+    assert DriveFile.from_dict(dict(data)) == item
+    assert repr(item) == "DriveFile(id='f1')"
+    # 값이 None인 필드와 응답에 없던 필드를 구분해 되돌립니다.
+    assert DriveFile.from_dict({"id": "f3", "size": None}).to_dict() == {"id": "f3", "size": None}
+    # 종류가 적은 필드의 문자열은 항목 간에 공유됩니다.
+    other = DriveFile.from_dict({"id": "f2", "type": "".join(["fi", "le"])})
+    assert other.type is item.type
+
+
+def test_parse_response_picks_model_by_endpoint():
+    data = {"header": {"isSuccessful": True}, "result": [{"id": "1"}], "totalCount": 1}
+    assert isinstance(parse_response("/drive/v1/drives/d/files", data).result[0], DriveFile)
+    assert isinstance(parse_response("/drive/v1/drives", data).result[0], Drive)
+    assert isinstance(parse_response("/unknown/v1/things", data).result[0], Record)
+    single = parse_response("/common/v1/members/1", {"header": {}, "result": {"id": "1"}})
+    assert len(single) == 1 and list(single)[0]["id"] == "1"
+    with pytest.raises(KeyError):
+        single["missing"]
+    assert parse_response("/common/v1/members", ["not", "a", "dict"]) == ["not", "a", "dict"]
+
+
+def test_json_loads_uses_orjson_when_available(monkeypatch):
+    calls = []
+    fake = types.SimpleNamespace(loads=lambda data: calls.append(data) or {"fast": True})
+    monkeypatch.setattr(doorayapi.models, "orjson", fake)
+    assert json_loads(b"{}") == {"fast": True}
+    assert calls == [b"{}"]
+
+    monkeypatch.setattr(doorayapi.models, "orjson", None)
+    assert json_loads('{"a": 1}'.encode("utf-8")) == {"a": 1}
+    assert json_loads('{"이름": "값"}') == {"이름": "값"}
@@ -0,0 +1,38 @@
+import asyncio
+
+import pytest
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID, MockDooray
+
+from doorayapi.aio import AsyncDoorayAPIClient
+from doorayapi.client import DoorayAPIClient
+
+
+@pytest.fixture
+def capped_server():
+    # 서버는 size=100을 요청해도 50개씩만 돌려줍니다.
+    with MockDooray(files=1000, max_page_size=50) as server:
+        yield server
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_iter_files_when_server_caps_page_size(capped_server, max_workers):
+    with DoorayAPIClient("test-token") as client:
+        client.base_url = capped_server.base_url
+        items = list(client.iter_files(DRIVE_ID, parentId=ROOT_FOLDER_ID, size=100, max_workers=max_workers))
+    assert len(items) == 1000
+    assert len({item["id"] for item in items}) == 1000
+
+
+def test_async_iter_files_when_server_caps_page_size(capped_server):
+    async def collect():
+        async with AsyncDoorayAPIClient("test-token") as client:
+            client.base_url = capped_server.base_url
+            return [item async for item in client.iter_files(DRIVE_ID, parentId=ROOT_FOLDER_ID, size=100)]
+
+    items = asyncio.run(collect())
+    assert len(items) == 1000
+    assert len({item["id"] for item in items}) == 1000
+
+
+def test_iter_files_smaller_than_one_page(client):
+    assert len(list(client.iter_files(DRIVE_ID, parentId=ROOT_FOLDER_ID, size=100))) == 50
@@ -0,0 +1,52 @@
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID
+
+from doorayapi.pool import DoorayClientPool
+
+
+class CountingLimiter:
+    def __init__(self):
+        self.paths = []
+
+    def acquire(self, path: str):
+        self.paths.append(path)
+
+
+def test_shared_rate_limiter_applies_to_every_token(server):
+    limiter = CountingLimiter()
+    with DoorayClientPool(["token-a", "token-b"], rate=1000, rate_limiter=limiter) as pool:
+        pool.base_url = server.base_url
+        counts = []
+        for _ in range(2):
+            items = list(pool.iter_files(DRIVE_ID, parentId=ROOT_FOLDER_ID, size=10, max_workers=2))
+            assert len(items) == 50
+            counts.append(dict(server.token_requests))
+        stats = pool.stats()
+    assert len(limiter.paths) == 10
+    assert all(slot["requests"] > 0 for slot in stats.values())
+    # 한 번의 순회는 첫 페이지의 토큰으로 모든 페이지를 받고, 다음 순회는 다른 토큰으로 보냅니다.
+    assert counts[0] in ({"token-a": 5}, {"token-b": 5})
+    assert counts[1] == {"token-a": 5, "token-b": 5}
+
+
+def test_ranged_download_keeps_first_token(server, tmp_path):
+    file_id = next(item["id"] for item in server.state.files.values() if item["type"] == "file")
+    with DoorayClientPool(["token-a", "token-b"]) as pool:
+        pool.base_url = server.base_url
+        pool.download_file(DRIVE_ID, file_id, str(tmp_path / "file.bin"), segments=4, resume=True)
+    # 메타 정보, 307 확인, Range 구간 요청이 모두 같은 토큰으로 전송됩니다.
+    assert len(server.token_requests) == 1
+
+
+def test_file_bodies_are_not_resent_to_another_token(server, tmp_path):
+    path = tmp_path / "body.bin"
+    path.write_bytes(b"x" * 100)
+    server.revoked_tokens.add("token-a")
+    with DoorayClientPool(["token-a", "token-b"]) as pool:
+        pool.base_url = server.base_url
+        url = f"{server.base_url}/drive/v1/drives/{DRIVE_ID}/files"
+        with open(path, "rb") as f:
+            response = pool._send("POST", url, params={"parentId": ROOT_FOLDER_ID}, files={"file": f})
+        stats = pool.stats()
+    assert response.status_code == 401
+    assert stats["token-0"]["unauthorized"] == 1
+    assert stats["token-1"]["requests"] == 0
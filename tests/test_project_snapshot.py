@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import pytest
+from mock_server import MockDooray
+
+from doorayapi.aio import AsyncDoorayAPIClient
+from doorayapi.client import DoorayAPIClient
+from doorayapi.project_snapshot import ProjectSnapshot
+
+PROJECT_ID = "project-1"
+
+
+@pytest.fixture
+def paged():
+    # 태그 200개를 4페이지로 나눠 돌려줍니다.
+    with MockDooray(files=0, max_page_size=50) as server:
+        server.state.milestones.append({"id": "milestone-closed", "name": "done", "status": "closed"})
+        yield server
+
+
+def connect(server, client_class=DoorayAPIClient, **options):
+    client = client_class("test-token", **options)
+    client.base_url = server.base_url
+    return client
+
+
+def test_load_fetches_every_page_and_indexes_names(paged):
+    with connect(paged) as client:
+        snapshot = ProjectSnapshot.load(client, PROJECT_ID, max_workers=4)
+    assert (len(snapshot.workflows), len(snapshot.tags), len(snapshot.milestones)) == (3, 200, 51)
+    assert snapshot.project["code"] == "bench"
+    assert snapshot.workflow_id("working") == "workflow-1"
+    assert snapshot.tag_id("tag199") == "tag-199"
+    assert snapshot.milestone_id("m3") == "milestone-3"
+    assert snapshot.milestone_id("done") == "milestone-closed"
+    with pytest.raises(KeyError, match="tag-none"):
+        snapshot.tag_id("tag-none")
+
+
+def test_load_async_matches_load(paged):
+    async def run():
+        async with connect(paged, AsyncDoorayAPIClient) as client:
+            return await ProjectSnapshot.load_async(client, PROJECT_ID, include_project=False)
+
+    snapshot = asyncio.run(run())
+    with connect(paged) as client:
+        expected = ProjectSnapshot.load(client, PROJECT_ID, include_project=False)
+    assert snapshot.project is None
+    assert dict(snapshot.to_dict(), loadedAt=None) == dict(expected.to_dict(), loadedAt=None)
+
+
+def test_typed_snapshot_saves_plain_json(paged, tmp_path):
+    with connect(paged, typed=True) as client:
+        snapshot = ProjectSnapshot.load(client, PROJECT_ID)
+    assert snapshot.tag_id("tag5") == "tag-5"
+    path = str(tmp_path / "project.json")
+    snapshot.save(path)
+    with open(path, encoding="utf-8") as f:
+        saved = json.load(f)
+    assert saved["tags"][5] == {"id": "tag-5", "name": "tag5", "color": "ffffff"}
+    assert saved["project"]["code"] == "bench"
+
+
+def test_save_and_restore_with_max_age(tmp_path):
+    path = str(tmp_path / "project.json")
+    snapshot = ProjectSnapshot(PROJECT_ID, workflows=[
+        {"id": "w1", "name": "Doing", "names": [{"locale": "ko_KR", "name": "진행 중"}]},
+        {"id": "w2", "name": "Doing"},
+    ], tags=[{"id": "t1", "name": "긴급"}])
+    snapshot.save(path)
+
+    restored = ProjectSnapshot.from_file(path, max_age=600)
+    assert restored.to_dict() == snapshot.to_dict()
+    # 이름이 겹치면 먼저 나온 항목을, 언어별 이름으로도 찾습니다.
+    assert restored.workflow_id("Doing") == restored.workflow_id("진행 중") == "w1"
+    assert restored.tag_id("긴급") == "t1"
+
+    ProjectSnapshot(PROJECT_ID, loaded_at=snapshot.loaded_at - 120).save(path)
+    assert ProjectSnapshot.from_file(path, max_age=60) is None
+    assert ProjectSnapshot.from_file(path).age >= 120
+
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(dict(snapshot.to_dict(), version=ProjectSnapshot.version + 1), f)
+    assert ProjectSnapshot.from_file(path) is None
+    assert ProjectSnapshot.from_file(str(tmp_path / "missing.json")) is None
@@ -0,0 +1,40 @@
+from mock_server import ROOT_PAGE_ID, WIKI_ID
+
+from doorayapi.publish import HEADING_PATTERN, WikiPublisher
+
+
+def test_heading_after_front_text():
+    assert HEADING_PATTERN.search("intro\n\n# Title #\nbody").group(1) == "Title"
+
+
+def test_code_fences_are_not_titles_or_images(server, client, tmp_path):
+    (tmp_path / "setup.md").write_text("```sh\n# install deps\necho '![a](a.png)'\n```\n\n# Setup\n\n![a](a.png)\n")
+    (tmp_path / "a.png").write_bytes(b"a")
+    publisher = WikiPublisher(client, WIKI_ID, ROOT_PAGE_ID, str(tmp_path))
+    assert publisher.run().errors == []
+    page = server.state.pages[publisher.pages["setup"]["pageId"]]
+    assert page["subject"] == "Setup"
+    content = page["body"]["content"]
+    assert "echo '![a](a.png)'" in content
+    assert content.count("/files/") == 1
+
+
+def test_update_attaches_new_images(server, client, tmp_path):
+    (tmp_path / "guide.md").write_text("# Guide\n\n![a](a.png)\n")
+    (tmp_path / "a.png").write_bytes(b"a")
+    (tmp_path / "b.png").write_bytes(b"b")
+    first = WikiPublisher(client, WIKI_ID, ROOT_PAGE_ID, str(tmp_path)).run()
+    assert (first.created, first.images_uploaded, first.errors) == (1, 1, [])
+
+    (tmp_path / "guide.md").write_text("# Guide\n\n![a](a.png)\n![b](b.png)\n")
+    publisher = WikiPublisher(client, WIKI_ID, ROOT_PAGE_ID, str(tmp_path))
+    second = publisher.run()
+    assert (second.updated_contents, second.images_attached, second.errors) == (1, 1, [])
+    state = publisher.pages["guide"]
+    attached = [file_id for wiki_id, file_id in state["attachments"].items() if wiki_id != file_id]
+    assert len(attached) == 1
+    content = server.state.pages[state["pageId"]]["body"]["content"]
+    assert f"/files/{attached[0]}" in content
+
+    third = WikiPublisher(client, WIKI_ID, ROOT_PAGE_ID, str(tmp_path)).run()
+    assert (third.unchanged, third.images_attached, third.updated_contents) == (1, 0, 0)
@@ -0,0 +1,75 @@
+import asyncio
+import time
+
+import pytest
+from mock_server import DRIVE_ID, WIKI_ID, MockDooray
+
+from doorayapi.client import DoorayAPIClient
+from doorayapi.ratelimit import RateLimiter, TokenBucket
+
+
+def test_bucket_reserves_burst_then_paces():
+    bucket = TokenBucket(10, capacity=2)
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    # 버킷이 비면 다음 토큰이 채워질 때까지의 시간을 돌려줍니다.
+    assert bucket.reserve() == pytest.approx(0.1, abs=0.02)
+    assert bucket.reserve() == pytest.approx(0.2, abs=0.02)
+
+
+def test_bucket_rejects_non_positive_rate():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_bucket_paces_threads_and_coroutines():
+    bucket = TokenBucket(20, capacity=1)
+    started = time.monotonic()
+    for _ in range(6):
+        bucket.acquire()
+    assert time.monotonic() - started >= 0.2
+
+    async def run():
+        await asyncio.gather(*(bucket.acquire_async() for _ in range(6)))
+
+    started = time.monotonic()
+    asyncio.run(run())
+    assert time.monotonic() - started >= 0.2
+
+
+def test_limiter_picks_bucket_per_family():
+    wiki = TokenBucket(5)
+    limiter = RateLimiter(families={"wiki": wiki})
+    assert RateLimiter.family("/wiki/v1/wikis") == "wiki"
+    assert RateLimiter.family("/drive/v1/drives/1/files") == "drive"
+    assert RateLimiter.family("/unknown/v1") == "common"
+    assert limiter.bucket("/wiki/v1/wikis/1/pages") is wiki
+    assert limiter.bucket("/drive/v1/drives") is None
+
+    limited = RateLimiter(rate=3, families={"wiki": 5})
+    assert limited.bucket("/drive/v1/drives").rate == 3
+    assert limited.bucket("/wiki/v1/wikis").rate == 5
+
+
+def test_limiter_paces_only_its_family(server):
+    limiter = RateLimiter(families={"wiki": 10}, capacity=1)
+    with DoorayAPIClient("test-token", rate_limiter=limiter) as client:
+        client.base_url = server.base_url
+        started = time.monotonic()
+        for _ in range(5):
+            client.get_drive(DRIVE_ID)
+        assert time.monotonic() - started < 0.3
+
+        started = time.monotonic()
+        for _ in range(5):
+            client.get_wiki_pages(WIKI_ID)
+        assert time.monotonic() - started >= 0.35
+
+
+def test_limiter_stays_under_server_limit():
+    with MockDooray(files=0, token_rate=5) as server:
+        with DoorayAPIClient("test-token", rate_limiter=RateLimiter(rate=4, capacity=1)) as client:
+            client.base_url = server.base_url
+            for _ in range(8):
+                client.get_drive(DRIVE_ID)
+        assert (server.requests, server.errors) == (8, 0)
@@ -0,0 +1,121 @@
+import asyncio
+import json
+
+import pytest
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID
+
+import doorayapi.client
+from doorayapi.aio import AsyncDoorayAPIClient
+from doorayapi.batch import BatchExecutor
+
+
+def test_ranged_download_resumes_from_saved_state(server, client, tmp_path):
+    file_id = next(item["id"] for item in server.state.files.values() if item["type"] == "file")
+    content = server.state.contents[file_id]
+    save_path = str(tmp_path / "file.bin")
+    half = len(content) // 2
+    # 앞 절반을 받은 뒤 중단된 상태를 만듭니다.
+    with open(save_path + ".part", "wb") as f:
+        f.write(content[:half] + b"\0" * (len(content) - half))
+    with open(save_path + ".part.json", "w", encoding="utf-8") as f:
+        json.dump({"size": len(content), "segments": [[0, len(content) - 1, half]]}, f)
+
+    client.download_file(DRIVE_ID, file_id, save_path, resume=True)
+    with open(save_path, "rb") as f:
+        assert f.read() == content
+    assert server.bytes_out == len(content) - half
+    assert not (tmp_path / "file.bin.part.json").exists()
+
+
+def test_segmented_download(server, client, tmp_path, monkeypatch):
+    monkeypatch.setattr(doorayapi.client, "MIN_SEGMENT_SIZE", 1024)
+    file_id = next(item["id"] for item in server.state.files.values() if item["type"] == "file")
+    save_path = str(tmp_path / "file.bin")
+    client.download_file(DRIVE_ID, file_id, save_path, segments=4)
+    with open(save_path, "rb") as f:
+        assert f.read() == server.state.contents[file_id]
+
+
+def test_truncated_segment_fails_and_resumes(server, client, tmp_path, monkeypatch):
+    monkeypatch.setattr(doorayapi.client, "MIN_SEGMENT_SIZE", 1024)
+    file_id = next(item["id"] for item in server.state.files.values() if item["type"] == "file")
+    save_path = str(tmp_path / "file.bin")
+    server.truncate_ranges = 10
+    with pytest.raises(IOError, match="바이트만 받았습니다"):
+        client.download_file(DRIVE_ID, file_id, save_path, segments=4)
+    assert not (tmp_path / "file.bin").exists()
+    assert (tmp_path / "file.bin.part.json").exists()
+
+    # 잘린 구간은 받은 곳부터 이어받습니다.
+    server.truncate_ranges = 0
+    client.download_file(DRIVE_ID, file_id, save_path, segments=4, resume=True)
+    with open(save_path, "rb") as f:
+        assert f.read() == server.state.contents[file_id]
+
+
+def test_async_truncated_segment_fails(server, tmp_path):
+    async def run():
+        async with AsyncDoorayAPIClient("test-token") as client:
+            client.base_url = server.base_url
+            await client.download_file(DRIVE_ID, file_id, str(tmp_path / "file.bin"), resume=True)
+
+    file_id = next(item["id"] for item in server.state.files.values() if item["type"] == "file")
+    server.truncate_ranges = 10
+    with pytest.raises(IOError, match="바이트만 받았습니다"):
+        asyncio.run(run())
+    assert not (tmp_path / "file.bin").exists()
+
+
+def test_batch_resumes_from_checkpoint(server, client, tmp_path, monkeypatch):
+    file_id = next(item["id"] for item in server.state.files.values() if item["type"] == "file")
+    operations = [
+        {"id": "archive", "op": "create_folder", "drive_id": DRIVE_ID, "folder_id": ROOT_FOLDER_ID,
+         "folder_name": "archive"},
+        {"id": "mv", "op": "move", "drive_id": DRIVE_ID, "file_id": file_id,
+         "destination_file_id": {"$ref": "archive"}},
+    ]
+    checkpoint = str(tmp_path / "batch.json")
+    move_file = client.move_file
+
+    def interrupted(**kwargs):
+        raise ConnectionError("interrupted")
+
+    monkeypatch.setattr(client, "move_file", interrupted)
+    first = BatchExecutor(client, checkpoint_path=checkpoint).run(operations)
+    assert [item.id for item in first.failed] == ["mv"]
+
+    monkeypatch.setattr(client, "move_file", move_file)
+    second = BatchExecutor(client, checkpoint_path=checkpoint).run(operations)
+    assert second.ok
+    archive = [item for item in second if item.id == "archive"][0]
+    assert archive.resumed
+    folders = [item for item in server.state.files.values() if item.get("name") == "archive"]
+    assert len(folders) == 1
+    assert server.state.files[file_id]["parentId"] == folders[0]["id"]
+
+
+def test_batch_journals_created_folders_before_interrupt(server, client, tmp_path, monkeypatch):
+    file_id = next(item["id"] for item in server.state.files.values() if item["type"] == "file")
+    operations = [
+        {"id": "archive", "op": "create_folder", "drive_id": DRIVE_ID, "folder_id": ROOT_FOLDER_ID,
+         "folder_name": "archive"},
+        {"id": "mv", "op": "move", "drive_id": DRIVE_ID, "file_id": file_id,
+         "destination_file_id": {"$ref": "archive"}},
+    ]
+    checkpoint = str(tmp_path / "batch.json")
+    move_file = client.move_file
+    seen = {}
+
+    def interrupted(**kwargs):
+        # 전체 체크포인트를 쓰기 전이어도 생성한 폴더는 이미 로그에 기록되어 있습니다.
+        seen.update(BatchExecutor(client, checkpoint_path=checkpoint)._load_checkpoint())
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(client, "move_file", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        BatchExecutor(client, checkpoint_path=checkpoint, checkpoint_every=1000).run(operations)
+    assert list(seen) == ["archive"]
+
+    monkeypatch.setattr(client, "move_file", move_file)
+    assert BatchExecutor(client, checkpoint_path=checkpoint).run(operations).ok
+    assert len([item for item in server.state.files.values() if item.get("name") == "archive"]) == 1
@@ -0,0 +1,118 @@
+import asyncio
+import time
+from email.utils import formatdate
+
+import pytest
+import requests
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID, MockDooray
+
+from doorayapi.aio import AsyncDoorayAPIClient
+from doorayapi.client import DoorayAPIClient
+from doorayapi.retry import RetryPolicy, parse_retry_after
+
+
+def no_wait(max_retries: int = 3) -> RetryPolicy:
+    return RetryPolicy(max_retries=max_retries, backoff_factor=0, jitter=False)
+
+
+def test_should_retry_by_method_and_status():
+    policy = RetryPolicy(max_retries=2)
+    assert policy.should_retry("GET", 0, 503)
+    assert policy.should_retry("put", 1, 502)
+    assert not policy.should_retry("GET", 2, 503)
+    assert not policy.should_retry("GET", 0, 404)
+    # POST는 429(처리되지 않음)만 재시도합니다.
+    assert not policy.should_retry("POST", 0, 503)
+    assert policy.should_retry("POST", 0, 429)
+    # status None은 연결 오류입니다.
+    assert policy.should_retry("DELETE", 0)
+    assert not policy.should_retry("POST", 0)
+
+
+def test_delay_backs_off_and_honors_retry_after():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False, max_retry_after=10)
+    assert [policy.delay(attempt) for attempt in range(4)] == [0.5, 1.0, 2.0, 3]
+    assert all(0 <= RetryPolicy(backoff_factor=0.5).delay(2) <= 2.0 for _ in range(20))
+    assert policy.delay(0, "4") == 4.0
+    assert policy.delay(0, "600") == 10
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("3") == 3.0
+    assert parse_retry_after("-1") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(formatdate(time.time() + 30, usegmt=True)) == pytest.approx(30, abs=2)
+    assert parse_retry_after(formatdate(time.time() - 30, usegmt=True)) == 0.0
+
+
+def test_retries_idempotent_requests_up_to_max():
+    with MockDooray(files=0, error_rate=1.0) as server:
+        with DoorayAPIClient("test-token", retry=no_wait(2)) as client:
+            client.base_url = server.base_url
+            with pytest.raises(requests.HTTPError):
+                client.get_drive(DRIVE_ID)
+            assert server.requests == 3
+
+            with pytest.raises(requests.HTTPError):
+                client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "once")
+            assert server.requests == 4
+
+
+def test_recovers_after_transient_errors(server):
+    server.fail_requests = 2
+    with DoorayAPIClient("test-token", retry=no_wait()) as client:
+        client.base_url = server.base_url
+        assert client.get_drive(DRIVE_ID)["result"]["id"] == DRIVE_ID
+    assert (server.requests, server.errors) == (3, 2)
+
+
+def test_waits_for_retry_after_on_429():
+    with MockDooray(files=0, token_rate=1) as server:
+        with DoorayAPIClient("test-token", retry=no_wait()) as client:
+            client.base_url = server.base_url
+            client.get_drive(DRIVE_ID)
+            started = time.monotonic()
+            client.get_drive(DRIVE_ID)
+            # 모의 서버는 Retry-After: 1로 응답합니다.
+            assert time.monotonic() - started >= 0.9
+        assert server.errors == 1
+
+
+@pytest.fixture
+def upload(tmp_path):
+    path = tmp_path / "upload.bin"
+    path.write_bytes(bytes(range(256)) * 400)
+    return str(path)
+
+
+def test_upload_body_is_rewound_before_retry(upload):
+    with MockDooray(files=0, error_status=429) as server:
+        with DoorayAPIClient("test-token", retry=no_wait()) as client:
+            client.base_url = server.base_url
+            file_id = client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)["result"]["id"]
+            client.update_file_version(DRIVE_ID, file_id, upload)
+            # 다음 요청은 기억한 파일 서버로 바로 보내는 본문 전송이며, 본문이 읽힌 뒤 429로 실패합니다.
+            server.fail_requests = 1
+            client.update_file_version(DRIVE_ID, file_id, upload)
+        assert server.errors == 1
+        with open(upload, "rb") as f:
+            assert server.state.contents[file_id] == f.read()
+        assert server.state.files[file_id]["version"] == 3
+
+
+def test_async_upload_body_is_rewound_before_retry(upload):
+    async def run():
+        async with AsyncDoorayAPIClient("test-token", retry=no_wait()) as client:
+            client.base_url = server.base_url
+            file_id = (await client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload))["result"]["id"]
+            await client.update_file_version(DRIVE_ID, file_id, upload)
+            server.fail_requests = 1
+            await client.update_file_version(DRIVE_ID, file_id, upload)
+            return file_id
+
+    with MockDooray(files=0, error_status=429) as server:
+        file_id = asyncio.run(run())
+        assert server.errors == 1
+        with open(upload, "rb") as f:
+            assert server.state.contents[file_id] == f.read()
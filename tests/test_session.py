@@ -0,0 +1,78 @@
+import threading
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID, MockDooray
+
+from doorayapi.client import DoorayAPIClient
+
+
+def connections(client, url):
+    # 호스트(포트)별로 지금까지 연 연결 수
+    pools = client.session.get_adapter(url).poolmanager.pools
+    port = urlsplit(url).port
+    return sum(pools[key].num_connections for key in pools.keys() if key.key_port == port)
+
+
+def test_api_and_redirect_targets_reuse_pooled_connections(server, client, tmp_path):
+    upload = tmp_path / "upload.bin"
+    upload.write_bytes(b"x" * 1000)
+    for _ in range(5):
+        client.get_drive(DRIVE_ID)
+    file_id = client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, str(upload))["result"]["id"]
+    client.update_file_version(DRIVE_ID, file_id, str(upload))
+    for name in ("a.bin", "b.bin", "c.bin"):
+        client.download_file(DRIVE_ID, file_id, str(tmp_path / name))
+
+    # API 서버와 307 대상(파일 서버) 모두 연결 하나로 모든 요청을 처리합니다.
+    assert connections(client, server.base_url) == 1
+    assert connections(client, server.file_url) == 1
+    assert (tmp_path / "c.bin").read_bytes() == upload.read_bytes()
+
+
+def test_session_is_created_lazily_and_shared_across_threads(server):
+    client = DoorayAPIClient("test-token", pool_maxsize=3, pool_block=True)
+    client.base_url = server.base_url
+    assert client._session is None
+    sessions = []
+
+    def work():
+        sessions.append(client.session)
+        for _ in range(5):
+            client.get_drive(DRIVE_ID)
+
+    threads = [threading.Thread(target=work) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len({id(session) for session in sessions}) == 1
+    assert server.requests == 40
+    # pool_block=True이면 스레드가 더 많아도 호스트당 pool_maxsize개의 연결만 엽니다.
+    assert client.session.get_adapter(server.base_url).poolmanager.connection_pool_kw["maxsize"] == 3
+    assert 1 <= connections(client, server.base_url) <= 3
+    client.close()
+
+
+def test_close_and_context_manager_recreate_session(server):
+    with DoorayAPIClient("test-token") as client:
+        client.base_url = server.base_url
+        client.get_drive(DRIVE_ID)
+        first = client.session
+    assert client._session is None
+
+    # 닫은 뒤 요청이 오면 새 세션을 만듭니다.
+    client.get_drive(DRIVE_ID)
+    assert client.session is not first
+    client.close()
+    client.close()
+    assert client._session is None
+
+
+def test_timeout_applies_to_every_request():
+    with MockDooray(files=0, latency=0.5) as server:
+        with DoorayAPIClient("test-token", timeout=(1, 0.1)) as client:
+            client.base_url = server.base_url
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                client.get_drive(DRIVE_ID)
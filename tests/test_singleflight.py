@@ -0,0 +1,29 @@
+import asyncio
+
+from doorayapi.singleflight import SingleFlight
+
+
+def test_follower_takes_over_when_leader_is_cancelled():
+    group = SingleFlight()
+    started = []
+
+    async def fetch():
+        started.append(len(started))
+        await asyncio.sleep(0.05)
+        return {"result": len(started)}
+
+    async def run():
+        leader = asyncio.ensure_future(group.do_async("key", fetch))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(group.do_async("key", fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        results = await asyncio.gather(*followers)
+        return leader, results
+
+    leader, results = asyncio.run(run())
+    assert leader.cancelled()
+    # 기다리던 호출자 중 하나만 다시 실행하고 나머지는 그 결과를 공유합니다.
+    assert results == [{"result": 2}] * 3
+    assert len(started) == 2
+    assert group.stats() == {"calls": 2, "deduplicated": 2}
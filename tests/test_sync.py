@@ -0,0 +1,137 @@
+import json
+
+import pytest
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID
+
+from doorayapi.sync import DriveSync
+
+
+@pytest.fixture
+def folder_id(client):
+    return client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "sync")["result"]["id"]
+
+
+@pytest.fixture
+def local(tmp_path):
+    root = tmp_path / "local"
+    (root / "docs" / "old").mkdir(parents=True)
+    (root / "a.txt").write_text("a")
+    (root / "docs" / "b.txt").write_text("b")
+    (root / "docs" / "old" / "c.txt").write_text("c")
+    return root
+
+
+def remote_names(server, parent_id):
+    return sorted(item["name"] for item in server.state.files.values() if item["parentId"] == parent_id)
+
+
+def test_second_run_skips_unchanged(server, client, folder_id, local):
+    first = DriveSync(client, DRIVE_ID, folder_id, str(local)).run()
+    assert (first.created_folders, first.uploaded, first.errors) == (2, 3, [])
+    requests_before = server.requests
+    second = DriveSync(client, DRIVE_ID, folder_id, str(local)).run()
+    assert (second.uploaded, second.unchanged) == (0, 3)
+    assert server.requests == requests_before
+
+
+def test_resume_after_failed_upload(server, client, folder_id, local, monkeypatch):
+    upload_file = client.upload_file
+
+    def failing_upload(drive_id, parent_id, file_path, progress=None):
+        if file_path.endswith("b.txt"):
+            raise ConnectionError("interrupted")
+        return upload_file(drive_id, parent_id, file_path, progress)
+
+    monkeypatch.setattr(client, "upload_file", failing_upload)
+    first = DriveSync(client, DRIVE_ID, folder_id, str(local), save_interval=0).run()
+    assert [path for path, _ in first.errors] == ["docs/b.txt"]
+
+    monkeypatch.setattr(client, "upload_file", upload_file)
+    second = DriveSync(client, DRIVE_ID, folder_id, str(local)).run()
+    assert (second.uploaded, second.unchanged, second.errors) == (1, 2, [])
+    assert remote_names(server, folder_id) == ["a.txt", "docs"]
+
+
+def test_failed_folder_skips_only_its_subtree(server, client, folder_id, local, monkeypatch):
+    create_folder = client.create_folder
+
+    def failing_create_folder(drive_id, parent_id, name):
+        if name == "docs":
+            raise IOError("create failed")
+        return create_folder(drive_id, parent_id, name)
+
+    monkeypatch.setattr(client, "create_folder", failing_create_folder)
+    summary = DriveSync(client, DRIVE_ID, folder_id, str(local)).run()
+    assert [relpath for relpath, _ in summary.errors] == ["docs"]
+    assert (summary.created_folders, summary.uploaded) == (0, 1)
+    assert remote_names(server, folder_id) == ["a.txt"]
+
+    monkeypatch.undo()
+    summary = DriveSync(client, DRIVE_ID, folder_id, str(local)).run()
+    assert (summary.created_folders, summary.uploaded, summary.unchanged, summary.errors) == (2, 2, 1, [])
+
+
+def test_manifest_saved_during_run(client, folder_id, local, monkeypatch):
+    sync = DriveSync(client, DRIVE_ID, folder_id, str(local), save_interval=0)
+    saves = []
+    save = sync.manifest.save
+    monkeypatch.setattr(sync.manifest, "save", lambda: saves.append(len(sync.manifest.files)) or save())
+    sync.run()
+    # 파일마다 한 번씩, 마지막에 한 번 더 저장합니다.
+    assert len(saves) == 4
+    assert sorted(saves)[:3] == [1, 2, 3]
+
+
+def test_delete_removes_files_folders_and_remote_extras(server, client, folder_id, local):
+    DriveSync(client, DRIVE_ID, folder_id, str(local)).run()
+    client.create_folder(DRIVE_ID, folder_id, "remote-only")
+    extra = local / "extra.txt"
+    extra.write_text("x")
+    client.upload_file(DRIVE_ID, folder_id, str(extra))
+    extra.unlink()
+
+    (local / "docs" / "b.txt").unlink()
+    for path in (local / "docs" / "old").iterdir():
+        path.unlink()
+    (local / "docs" / "old").rmdir()
+
+    sync = DriveSync(client, DRIVE_ID, folder_id, str(local), delete=True)
+    dry_run = DriveSync(client, DRIVE_ID, folder_id, str(local), delete=True, dry_run=True).run()
+    assert (dry_run.deleted, dry_run.deleted_folders) == (2, 2)
+    summary = sync.run()
+    assert (summary.deleted, summary.deleted_folders, summary.errors) == (2, 2, [])
+    assert remote_names(server, folder_id) == ["a.txt", "docs"]
+    docs_id = sync.manifest.folders["docs"]
+    assert remote_names(server, docs_id) == []
+
+    with open(sync.manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert sorted(manifest["files"]) == ["a.txt"]
+    assert sorted(manifest["folders"]) == ["docs"]
+
+
+def test_unchanged_delete_run_lists_nothing(server, client, folder_id, local):
+    first = DriveSync(client, DRIVE_ID, folder_id, str(local), delete=True).run()
+    assert first.errors == []
+    requests_before = server.requests
+    second = DriveSync(client, DRIVE_ID, folder_id, str(local), delete=True).run()
+    assert (second.unchanged, second.deleted, second.deleted_folders) == (3, 0, 0)
+    assert server.requests == requests_before
+
+
+def test_delete_cleans_reused_remote_folder(server, client, folder_id, local):
+    DriveSync(client, DRIVE_ID, folder_id, str(local), delete=True).run()
+    # 원격에 이미 있는 폴더와 같은 이름의 로컬 폴더를 추가합니다.
+    shared_id = client.create_folder(DRIVE_ID, folder_id, "shared")["result"]["id"]
+    stale = local / "stale.txt"
+    stale.write_text("s")
+    client.upload_file(DRIVE_ID, shared_id, str(stale))
+    stale.unlink()
+    (local / "shared").mkdir()
+    (local / "shared" / "kept.txt").write_text("k")
+
+    sync = DriveSync(client, DRIVE_ID, folder_id, str(local), delete=True)
+    summary = sync.run()
+    assert (summary.created_folders, summary.uploaded, summary.deleted, summary.errors) == (0, 1, 1, [])
+    assert sync.manifest.folders["shared"] == shared_id
+    assert remote_names(server, shared_id) == ["kept.txt"]
@@ -0,0 +1,132 @@
+import asyncio
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID, WIKI_ID, MockDooray
+
+from doorayapi.aio import AsyncDoorayAPIClient
+from doorayapi.client import MAX_REDIRECT_TARGETS, DoorayAPIClient, RedirectError
+
+# 연결을 받지 않는 주소. 기억한 대상이 사라진 상황을 흉내 냅니다.
+DEAD_ORIGIN = "http://127.0.0.1:9"
+
+
+@pytest.fixture
+def upload(tmp_path):
+    path = tmp_path / "upload.bin"
+    path.write_bytes(b"x" * 100000)
+    return str(path)
+
+
+def test_probe_is_default_and_sends_body_once(server, client, upload):
+    assert client.upload_redirect == "probe"
+    result = client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+    item = server.state.files[result["result"]["id"]]
+    assert item["size"] == 100000
+    assert item["parentId"] == ROOT_FOLDER_ID
+    assert server.bytes_in < 2 * 100000
+    assert len(client._redirect_targets) == 1
+
+    # 두 번째 업로드는 확인 요청 없이 기억한 파일 서버로 바로 보냅니다.
+    requests_before = server.requests
+    result = client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+    assert server.requests == requests_before + 1
+    assert server.state.files[result["result"]["id"]]["parentId"] == ROOT_FOLDER_ID
+
+
+def test_resend_remembers_target(server, upload):
+    with DoorayAPIClient("test-token", upload_redirect="resend") as client:
+        client.base_url = server.base_url
+        client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+        assert server.requests == 2
+
+        client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+        assert server.requests == 3
+
+
+def test_target_is_shared_across_files_of_a_kind(server, client, upload):
+    file_ids = [client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)["result"]["id"] for _ in range(3)]
+    client.update_file_version(DRIVE_ID, file_ids[0], upload)
+    client.upload_wiki_file(WIKI_ID, upload)
+    assert len(client._redirect_targets) == 3
+
+    # 다른 파일의 새 버전도 확인 요청 없이 본문을 한 번만 보냅니다.
+    requests_before, bytes_before = server.requests, server.bytes_in
+    for file_id in file_ids[1:]:
+        client.update_file_version(DRIVE_ID, file_id, upload)
+    assert server.requests == requests_before + 2
+    assert server.bytes_in - bytes_before < 3 * 100000
+    assert len(client._redirect_targets) == 3
+
+
+def test_probe_keeps_parent_per_target(server, client, upload):
+    folder_id = client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "sub")["result"]["id"]
+    client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+    file_id = client.upload_file(DRIVE_ID, folder_id, upload)["result"]["id"]
+    assert server.state.files[file_id]["parentId"] == folder_id
+
+
+def test_redirect_targets_are_bounded(client):
+    for index in range(MAX_REDIRECT_TARGETS + 10):
+        url = f"https://api.example/drive/v1/drives/{index}/files"
+        client._remember_redirect("POST", url, "https://files.example" + urlsplit(url).path)
+    assert len(client._redirect_targets) == MAX_REDIRECT_TARGETS
+    assert client._known_upload_target("POST", "https://api.example/drive/v1/drives/0/files") is None
+    last = f"https://api.example/drive/v1/drives/{MAX_REDIRECT_TARGETS + 9}/files"
+    assert client._known_upload_target("POST", last) == "https://files.example" + urlsplit(last).path
+
+
+def test_probe_falls_back_when_known_target_fails(server, client, upload):
+    url = f"{server.base_url}/drive/v1/drives/{DRIVE_ID}/files"
+    client._remember_redirect("POST", url, f"{DEAD_ORIGIN}/drive/v1/drives/{DRIVE_ID}/files")
+    result = client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+    assert server.state.files[result["result"]["id"]]["size"] == 100000
+    assert client._known_upload_target("POST", url) == f"{server.file_url}/drive/v1/drives/{DRIVE_ID}/files"
+
+
+def test_async_probe_falls_back(server, upload):
+    async def run():
+        async with AsyncDoorayAPIClient("test-token") as client:
+            client.base_url = server.base_url
+            url = f"{server.base_url}/drive/v1/drives/{DRIVE_ID}/files"
+            client._remember_redirect("POST", url, f"{DEAD_ORIGIN}/drive/v1/drives/{DRIVE_ID}/files")
+            first = await client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+            second = await client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+            return first, second
+
+    first, second = asyncio.run(run())
+    assert server.state.files[first["result"]["id"]]["size"] == 100000
+    assert server.state.files[second["result"]["id"]]["parentId"] == ROOT_FOLDER_ID
+
+
+def test_probe_without_redirect_does_not_report_success(upload):
+    with MockDooray(files=0, redirect_uploads=False) as server:
+        with DoorayAPIClient("test-token", upload_redirect="probe") as client:
+            client.base_url = server.base_url
+            with pytest.raises(RedirectError, match="리디렉션하지 않습니다"):
+                client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+            assert not client._redirect_targets
+        with DoorayAPIClient("test-token", upload_redirect="resend") as client:
+            client.base_url = server.base_url
+            result = client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+        assert server.state.files[result["result"]["id"]]["size"] == 100000
+
+
+def test_probe_raises_on_error_status(server, upload):
+    server.revoked_tokens.add("bad-token")
+    with DoorayAPIClient("bad-token") as client:
+        client.base_url = server.base_url
+        with pytest.raises(requests.HTTPError):
+            client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+
+
+def test_async_probe_without_redirect_raises(upload):
+    async def run():
+        async with AsyncDoorayAPIClient("test-token") as client:
+            client.base_url = server.base_url
+            await client.upload_file(DRIVE_ID, ROOT_FOLDER_ID, upload)
+
+    with MockDooray(files=0, redirect_uploads=False) as server:
+        with pytest.raises(RedirectError, match="리디렉션하지 않습니다"):
+            asyncio.run(run())
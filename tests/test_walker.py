@@ -0,0 +1,103 @@
+import gzip
+import json
+
+import pytest
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID, MockDooray
+
+from doorayapi.client import DoorayAPIClient
+from doorayapi.walker import DriveIndex, DriveWalker
+
+
+@pytest.fixture
+def tree(tmp_path):
+    # file-000000.bin, file-000001.bin, docs/readme.txt, docs/old/notes.txt
+    with MockDooray(files=2, file_size=100) as server:
+        with DoorayAPIClient("test-token") as client:
+            client.base_url = server.base_url
+            ids = {"docs": client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "docs")["result"]["id"]}
+            ids["docs/old"] = client.create_folder(DRIVE_ID, ids["docs"], "old")["result"]["id"]
+            for folder, name in (("docs", "readme.txt"), ("docs/old", "notes.txt")):
+                path = tmp_path / name
+                path.write_bytes(b"v1")
+                ids[f"{folder}/{name}"] = client.upload_file(DRIVE_ID, ids[folder], str(path))["result"]["id"]
+            yield server, client, ids
+
+
+def test_walk_is_breadth_first_with_paths(tree):
+    server, client, ids = tree
+    records = list(DriveWalker(client, DRIVE_ID, max_workers=2, page_size=1).walk())
+    assert [path for path, _ in records] == [
+        "file-000000.bin", "file-000001.bin", "docs", "docs/old", "docs/readme.txt", "docs/old/notes.txt"]
+    assert {path: item["id"] for path, item in records}["docs/old/notes.txt"] == ids["docs/old/notes.txt"]
+
+    shallow = DriveWalker(client, DRIVE_ID, max_depth=2, type="file").walk()
+    assert [path for path, _ in shallow] == ["file-000000.bin", "file-000001.bin", "docs/readme.txt"]
+    below = DriveWalker(client, DRIVE_ID, root_id=ids["docs"]).walk()
+    assert [path for path, _ in below] == ["old", "readme.txt", "old/notes.txt"]
+
+
+def test_build_index_maps_paths_and_ids(tree):
+    server, client, ids = tree
+    index = DriveWalker(client, DRIVE_ID).build_index()
+    assert len(index) == 6
+    assert index.id_of("/docs/old/") == ids["docs/old"]
+    assert index.path_of(ids["docs/readme.txt"]) == "docs/readme.txt"
+    assert "docs/old/notes.txt" in index and "docs/missing" not in index
+    path, kind, size, updated = index.entries[ids["docs/readme.txt"]]
+    assert (path, kind, size) == ("docs/readme.txt", "file", 2) and updated
+
+
+def test_diff_reports_added_removed_modified_and_moved(tree, tmp_path):
+    server, client, ids = tree
+    walker = DriveWalker(client, DRIVE_ID)
+    before = walker.build_index()
+    assert before.diff(before) == {"added": [], "removed": [], "modified": [], "moved": []}
+
+    new = tmp_path / "new.txt"
+    new.write_bytes(b"new")
+    client.upload_file(DRIVE_ID, ids["docs"], str(new))
+    client.delete_file(DRIVE_ID, before.id_of("file-000001.bin"))
+    new.write_bytes(b"version 2")
+    client.update_file_version(DRIVE_ID, ids["docs/readme.txt"], str(new))
+    client.update_file_name(DRIVE_ID, ids["docs/old"], "archive")
+
+    changes = walker.build_index().diff(before)
+    assert changes["added"] == ["docs/new.txt"]
+    assert changes["removed"] == ["file-000001.bin"]
+    # 이름이 바뀐 폴더는 lastUpdatedAt도 바뀌므로 modified에도 나옵니다.
+    assert changes["modified"] == ["docs/archive", "docs/readme.txt"]
+    assert changes["moved"] == [("docs/old", "docs/archive"), ("docs/old/notes.txt", "docs/archive/notes.txt")]
+
+
+def test_save_and_load_round_trip(tree, tmp_path):
+    server, client, ids = tree
+    index = DriveWalker(client, DRIVE_ID).build_index()
+    path = str(tmp_path / "index.json.gz")
+    index.save(path)
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert json.load(f)[ids["docs"]] == ["docs", "folder", None, None]
+
+    loaded = DriveIndex.load(path)
+    assert loaded.entries == index.entries
+    assert loaded.id_of("docs/old/notes.txt") == ids["docs/old/notes.txt"]
+    assert loaded.diff(index) == {"added": [], "removed": [], "modified": [], "moved": []}
+
+
+def test_relocate_and_remove_keep_lookups_consistent():
+    index = DriveIndex.from_walk([
+        ("a", {"id": "1", "type": "folder"}),
+        ("a/x.txt", {"id": "2", "type": "file", "size": 1}),
+        ("a/b/y.txt", {"id": "3", "type": "file", "size": 2}),
+        ("ab.txt", {"id": "4", "type": "file", "size": 3}),
+    ])
+    previous = DriveIndex(dict(index.entries))
+    index.relocate("a", "c")
+    # 폴더 자신과 이름이 접두어만 같은 항목은 그대로 둡니다.
+    assert [index.path_of(file_id) for file_id in "1234"] == ["a", "c/x.txt", "c/b/y.txt", "ab.txt"]
+    assert index.id_of("c/b/y.txt") == "3" and index.id_of("a/b/y.txt") is None
+    assert index.diff(previous)["moved"] == [("a/b/y.txt", "c/b/y.txt"), ("a/x.txt", "c/x.txt")]
+
+    index.remove("2")
+    index.remove("missing")
+    assert index.id_of("c/x.txt") is None and len(index) == 3
+    assert index.diff(previous)["removed"] == ["a/x.txt"]
@@ -0,0 +1,66 @@
+import asyncio
+import json
+
+from mock_server import DRIVE_ID, ROOT_FOLDER_ID
+
+from doorayapi.walker import DriveWalker
+from doorayapi.webhook import HookEvent, HookReceiver, refresh_drive_index
+
+
+async def _post(port: int, head: str, body: bytes = b"") -> int:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(head.encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split(b" ", 2)[1])
+    writer.close()
+    return status
+
+
+def test_invalid_content_length_is_rejected():
+    async def run():
+        events = []
+        async with HookReceiver(coalesce=0) as receiver:
+            receiver.on("*", events.append)
+            bad = await _post(receiver.port, "POST / HTTP/1.1\r\nContent-Length: abc\r\n\r\n")
+            negative = await _post(receiver.port, "POST / HTTP/1.1\r\nContent-Length: -1\r\n\r\n")
+            body = json.dumps({"hookEventType": "postCreated", "postId": "1"}).encode("utf-8")
+            ok = await _post(receiver.port, f"POST / HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n", body)
+            await receiver.flush()
+            return bad, negative, ok, receiver.rejected, events
+
+    bad, negative, ok, rejected, events = asyncio.run(run())
+    assert (bad, negative, ok, rejected) == (400, 400, 200, 2)
+    assert [event.post_id for event in events] == ["1"]
+
+
+def test_wrong_token_is_rejected():
+    async def run():
+        async with HookReceiver(token="secret", coalesce=0) as receiver:
+            body = b"{}"
+            head = "POST /{} HTTP/1.1\r\nContent-Length: 2\r\n\r\n"
+            return [await _post(receiver.port, head.format(query), body)
+                    for query in ("?token=wrong", "", "?token=secret")]
+
+    assert asyncio.run(run()) == [403, 403, 200]
+
+
+def test_drive_index_follows_folder_moves(server, client):
+    docs = client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "docs")["result"]["id"]
+    guide = client.create_folder(DRIVE_ID, docs, "guide")["result"]["id"]
+    archive = client.create_folder(DRIVE_ID, ROOT_FOLDER_ID, "archive")["result"]["id"]
+    source_id = next(item["id"] for item in server.state.files.values() if item["type"] == "file")
+    file_id = client.copy_file(DRIVE_ID, source_id, DRIVE_ID, guide)["result"]["id"]
+    index = DriveWalker(client, DRIVE_ID).build_index()
+    assert index.path_of(file_id) == "docs/guide/file-000000.bin"
+
+    handler = refresh_drive_index(client, index, DRIVE_ID)
+    client.move_file(DRIVE_ID, docs, archive)
+    top = client.copy_file(DRIVE_ID, source_id, DRIVE_ID, ROOT_FOLDER_ID)["result"]["id"]
+    handler([HookEvent({"driveId": DRIVE_ID, "fileId": docs}), HookEvent({"driveId": DRIVE_ID, "fileId": top})])
+
+    assert index.path_of(docs) == "archive/docs"
+    assert index.path_of(guide) == "archive/docs/guide"
+    assert index.id_of("archive/docs/guide/file-000000.bin") == file_id
+    assert index.id_of("docs/guide") is None
+    # 드라이브 최상위 폴더 아래의 파일도 색인에 추가됩니다.
+    assert index.path_of(top) == "file-000000.bin"